@@ -1,9 +1,21 @@
 from os.path import dirname, basename, isfile
 from .person import Person
-from .objects import Institution, Experience, Education, Contact, Skill, Language, Certification, HonorAward
+from .objects import Institution, Experience, Education, Contact, Skill, Language, Certification, HonorAward, SectionStatus
 from .company import Company
 from .jobs import Job
 from .job_search import JobSearch
+from .pool import DriverPool, scrape_people, hydrate_jobs
+from .session import SessionStore
+from .browser import build_driver, configure_profile
+from .replay import RecordingDriver, ReplayDriver
+from .frontier import CrawlFrontier
+from .ratelimit import RateLimiter
+from .export import JSONLSink, CSVSink, ParquetSink, open_sink
+from .cache import PageCache, CachingDriver
+from .canonical import SeenIndex, canonical_url
+from .refresh import ProfileRefresher
+from .aio import AsyncScraper
+from .connections import ConnectionsCrawler
 
 __version__ = "2.11.5"
 
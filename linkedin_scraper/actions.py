@@ -1,5 +1,8 @@
 import getpass
+import hashlib
 from . import constants as c
+from . import ratelimit
+from .session import set_cookies
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -13,14 +16,19 @@ def page_has_loaded(driver):
     page_state = driver.execute_script('return document.readyState;')
     return page_state == 'complete'
 
-def login(driver, email=None, password=None, cookie = None, timeout=10):
+def login(driver, email=None, password=None, cookie = None, timeout=10, session_store=None):
     if cookie is not None:
-        return _login_with_cookie(driver, cookie)
+        return _login_with_cookie(driver, cookie, email)
+
+    if session_store is not None and email and session_store.restore_valid(driver, email):
+        ratelimit.register(driver, email)
+        return
   
     if not email or not password:
         email, password = __prompt_email_password()
   
-    driver.get("https://www.linkedin.com/login")
+    ratelimit.register(driver, email)
+    ratelimit.navigate(driver, "https://www.linkedin.com/login")
     element = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "username")))
   
     email_elem = driver.find_element(By.ID,"username")
@@ -36,10 +44,15 @@ def login(driver, email=None, password=None, cookie = None, timeout=10):
             remember.submit()
   
     element = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CLASS_NAME, c.VERIFY_LOGIN_ID)))
+
+    if session_store is not None:
+        session_store.save(driver, email)
   
-def _login_with_cookie(driver, cookie):
-    driver.get("https://www.linkedin.com/login")
-    driver.add_cookie({
+def _login_with_cookie(driver, cookie, email=None):
+    # Without an email, the account is named after the cookie, so that each cookie has its own budget.
+    ratelimit.register(driver, email or "cookie:" + hashlib.sha1(cookie.encode("utf-8")).hexdigest()[:12])
+    set_cookies(driver, [{
       "name": "li_at",
-      "value": cookie
-    })
+      "value": cookie,
+      "domain": ".linkedin.com"
+    }])
@@ -0,0 +1,355 @@
+"""An asyncio front end running the scrapers in worker processes, each owning one browser.
+
+    async with AsyncScraper(workers=4, email=email, password=password) as scraper:
+        person = await scraper.person(url, sections=["experiences"])
+        async for job in scraper.search("Data Engineer", max_pages=10):
+            ...
+
+Results are the to_dict() records of Person, Company and Job. A task that
+times out or is cancelled kills its worker's browser and the worker is
+replaced, so the work really stops.
+"""
+import asyncio
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+from . import actions
+from .browser import build_driver
+from .company import Company
+from .job_search import JobSearch
+from .jobs import Job
+from .person import Person
+from .session import SessionStore
+
+
+class WorkerError(RuntimeError):
+    """A scrape failed inside a worker process."""
+
+
+def _scrape_person(driver, url, sections=None):
+    return Person(url, driver=driver, sections=sections, close_on_complete=False).to_dict()
+
+
+def _scrape_company(driver, url, get_employees=False, fast=False):
+    return Company(url, driver=driver, get_employees=get_employees, close_on_complete=False, fast=fast).to_dict()
+
+
+def _scrape_job(driver, url):
+    return Job(url, driver=driver, close_on_complete=False).to_dict()
+
+
+def _search_jobs(driver, search_term, filters=None, max_pages=None):
+    for job in JobSearch(driver, scrape=False).iter_search(search_term, filters=filters, max_pages=max_pages):
+        yield job.to_dict()
+
+
+TASKS = {
+    "person": _scrape_person,
+    "company": _scrape_company,
+    "job": _scrape_job,
+}
+STREAMS = {
+    "search": _search_jobs,
+}
+# Seconds between checks of a worker's pipe, which bounds how long a timed out or cancelled task keeps a thread.
+POLL_INTERVAL = 0.5
+
+
+def _worker_main(conn, driver_factory, login):
+    """Runs in a worker process: scrapes the tasks sent over conn on one browser until told to stop.
+
+    Reports ("ready", None) once logged in, or ("error", ...) and exits if the browser or the login failed.
+    """
+    if hasattr(os, "setsid"):
+        # A process group of its own, so that killing it takes chromedriver and Chrome down too.
+        os.setsid()
+    driver = None
+    try:
+        try:
+            driver = (driver_factory or build_driver)()
+            if login.get("cookie") is not None or (login.get("email") and (login.get("password") or login.get("session_path"))):
+                session_store = SessionStore(login["session_path"]) if login.get("session_path") else None
+                actions.login(driver, login.get("email"), login.get("password"), cookie=login.get("cookie"),
+                              session_store=session_store)
+        except Exception as e:
+            conn.send(("error", repr(e)))
+            return
+        conn.send(("ready", None))
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            if message is None:
+                break
+            kind, kwargs = message
+            try:
+                if kind in STREAMS:
+                    for item in STREAMS[kind](driver, **kwargs):
+                        conn.send(("item", item))
+                    conn.send(("result", None))
+                else:
+                    conn.send(("result", TASKS[kind](driver, **kwargs)))
+            except Exception as e:
+                conn.send(("error", repr(e)))
+    finally:
+        try:
+            if driver is not None:
+                driver.quit()
+        except Exception:
+            pass
+
+
+class _Task(object):
+
+    def __init__(self, kind, kwargs, timeout, stream_size=None):
+        self.kind = kind
+        self.kwargs = kwargs
+        self.timeout = timeout
+        self.future = asyncio.get_running_loop().create_future()
+        self.items = asyncio.Queue(stream_size) if stream_size is not None else None
+
+
+class _Worker(object):
+
+    def __init__(self, context, driver_factory, login):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, driver_factory, login), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def wait_ready(self, timeout):
+        """Waits for the worker to have started its browser and logged in, raising WorkerError if it didn't."""
+        try:
+            if not self.conn.poll(timeout):
+                raise WorkerError("Worker did not start within %s seconds" % timeout)
+            status, payload = self.conn.recv()
+        except (EOFError, OSError) as e:
+            self.kill()
+            raise WorkerError("Worker died while starting: %r" % e)
+        except WorkerError:
+            self.kill()
+            raise
+        if status != "ready":
+            self.kill()
+            raise WorkerError("Worker failed to start: %s" % payload)
+
+    def kill(self):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        self.process.join()
+        self.conn.close()
+
+    def stop(self, timeout=10):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class AsyncScraper(object):
+    """Dispatches scrapes to `workers` processes through a bounded queue.
+
+    Submitting waits while `queue_size` tasks are already pending, which
+    gives callers backpressure. Each task has a timeout, `timeout` seconds
+    by default, which also bounds a worker's start and login.
+
+    A worker that fails to start or log in, or `max_respawns` replacements
+    of workers in a row without a task succeeding, make the scraper fail:
+    the pending tasks and every later call raise the WorkerError.
+    """
+
+    def __init__(self, workers=2, queue_size=None, timeout=300, email=None, password=None, cookie=None,
+                 session_path=None, driver_factory=None, max_respawns=5):
+        if email and cookie is None and not (password or session_path):
+            # actions.login would prompt for the password, from a worker process
+            raise ValueError("AsyncScraper needs a password or a session_path along with the email")
+        self.workers = workers
+        self.queue_size = queue_size or workers * 2
+        self.timeout = timeout
+        self.driver_factory = driver_factory
+        self.login = {"email": email, "password": password, "cookie": cookie, "session_path": session_path}
+        self.max_respawns = max_respawns
+        self.respawned = 0
+        self.error = None
+        self._respawns_in_a_row = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._executor = None
+        self._queue = None
+        self._runners = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self):
+        # The workers' pipes are polled on threads of their own, one per worker.
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._queue = asyncio.Queue(self.queue_size)
+        self._runners = [asyncio.ensure_future(self._run()) for _ in range(self.workers)]
+
+    async def close(self):
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+        while not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _spawn(self):
+        worker = _Worker(self._context, self.driver_factory, self.login)
+        worker.wait_ready(self.timeout)
+        return worker
+
+    async def _start_worker(self):
+        """Starts a worker, or returns None and fails the scraper if it could not start."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, self._spawn)
+        except WorkerError as e:
+            self.error = e
+            return None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        worker = await self._start_worker()
+        try:
+            while True:
+                task = await self._queue.get()
+                if task.future.done():
+                    continue
+                if worker is None:
+                    # The scraper failed, so the tasks still queued fail with its error.
+                    task.future.set_exception(self.error)
+                    continue
+                try:
+                    healthy = await self._execute(worker, task)
+                except asyncio.CancelledError:
+                    task.future.cancel()
+                    raise
+                if healthy:
+                    self._respawns_in_a_row = 0
+                    continue
+                await loop.run_in_executor(None, worker.kill)
+                worker = None
+                if self._respawns_in_a_row >= self.max_respawns:
+                    self.error = WorkerError("Gave up after replacing workers %d times in a row" % self._respawns_in_a_row)
+                elif self.error is None:
+                    self.respawned += 1
+                    self._respawns_in_a_row += 1
+                    worker = await self._start_worker()
+        finally:
+            if worker is not None:
+                await loop.run_in_executor(None, worker.stop)
+
+    @staticmethod
+    async def _until(awaitable, task, deadline):
+        """Awaits awaitable unless the task is cancelled or times out first. Returns whether it completed."""
+        loop = asyncio.get_running_loop()
+        done, _ = await asyncio.wait({awaitable, task.future}, timeout=max(0, deadline - loop.time()),
+                                     return_when=asyncio.FIRST_COMPLETED)
+        if awaitable in done:
+            return True
+        awaitable.cancel()
+        if not task.future.done():
+            task.future.set_exception(asyncio.TimeoutError("%s task timed out" % task.kind))
+        return False
+
+    async def _receive(self, worker, task, deadline):
+        """The worker's next message, or None if the task timed out or was cancelled first.
+
+        The pipe is polled for at most POLL_INTERVAL at a time, so no thread
+        stays blocked on a worker that is about to be killed.
+        """
+        loop = asyncio.get_running_loop()
+        while not task.future.done():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                task.future.set_exception(asyncio.TimeoutError("%s task timed out" % task.kind))
+                break
+            if await loop.run_in_executor(self._executor, worker.conn.poll, min(remaining, POLL_INTERVAL)):
+                return await loop.run_in_executor(self._executor, worker.conn.recv)
+        return None
+
+    async def _execute(self, worker, task):
+        """Runs a task on worker. Returns False if the worker has to be replaced."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + task.timeout
+        worker.conn.send((task.kind, task.kwargs))
+        while True:
+            try:
+                message = await self._receive(worker, task, deadline)
+            except (EOFError, OSError) as e:
+                if not task.future.done():
+                    task.future.set_exception(WorkerError("Worker died: %r" % e))
+                return False
+            if message is None:
+                return False
+            status, payload = message
+            if status == "item":
+                # A full stream waits for the consumer, which in turn holds up the worker's pipe.
+                if not await self._until(asyncio.ensure_future(task.items.put(payload)), task, deadline):
+                    return False
+                continue
+            if not task.future.done():
+                if status == "error":
+                    task.future.set_exception(WorkerError(payload))
+                else:
+                    task.future.set_result(payload)
+            return True
+
+    async def _submit(self, kind, kwargs, timeout=None, stream_size=None):
+        if self._queue is None:
+            raise RuntimeError("AsyncScraper is not started, use `async with AsyncScraper(...)` or await start()")
+        if self.error is not None:
+            raise self.error
+        task = _Task(kind, kwargs, timeout or self.timeout, stream_size)
+        await self._queue.put(task)
+        return task
+
+    async def person(self, url, sections=None, timeout=None):
+        task = await self._submit("person", {"url": url, "sections": sections}, timeout)
+        return await task.future
+
+    async def company(self, url, get_employees=False, fast=False, timeout=None):
+        task = await self._submit("company", {"url": url, "get_employees": get_employees, "fast": fast}, timeout)
+        return await task.future
+
+    async def job(self, url, timeout=None):
+        task = await self._submit("job", {"url": url}, timeout)
+        return await task.future
+
+    async def search(self, search_term, filters=None, max_pages=None, timeout=None):
+        """Yields the job stubs of a search as their pages are parsed. `timeout` covers the whole search."""
+        task = await self._submit("search", {"search_term": search_term, "filters": filters, "max_pages": max_pages},
+                                  timeout, stream_size=self.queue_size * 25)
+        try:
+            while True:
+                next_item = asyncio.ensure_future(task.items.get())
+                await asyncio.wait({next_item, task.future}, return_when=asyncio.FIRST_COMPLETED)
+                if next_item.done():
+                    yield next_item.result()
+                    continue
+                next_item.cancel()
+                while not task.items.empty():
+                    yield task.items.get_nowait()
+                task.future.result()
+                return
+        finally:
+            if not task.future.done():
+                task.future.cancel()
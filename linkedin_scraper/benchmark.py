@@ -0,0 +1,236 @@
+"""Times the scrapers against a recorded fixture corpus, without touching the network.
+
+Record a corpus by scraping through a RecordingDriver, then run
+
+    python -m linkedin_scraper.benchmark path/to/fixtures
+
+To compare the memory of the objects.py dataclasses with their compact records, run
+
+    python -m linkedin_scraper.benchmark --records 100000
+"""
+import argparse
+import logging
+import time
+import tracemalloc
+import urllib.parse
+from collections import namedtuple
+
+from .company import Company
+from .job_search import JobSearch
+from .jobs import Job
+from .objects import Experience
+from .person import Person, LAZY_SECTIONS
+from . import ratelimit
+from .replay import ReplayDriver, FixtureStore, FixtureNotFound
+
+logger = logging.getLogger(__name__)
+
+Result = namedtuple("Result", ["entity", "url", "section", "seconds", "allocated_kb", "peak_kb"])
+
+
+def classify(url):
+    path = urllib.parse.urlparse(url).path
+    if "/details/" in path or "/mynetwork/" in path:
+        return None
+    if path.startswith("/in/"):
+        return "person"
+    if path.startswith("/company/") or path.startswith("/school/"):
+        if path.rstrip("/").split("/")[-1] == "people":
+            return None
+        return "company"
+    if path.startswith("/jobs/search"):
+        return "job_search"
+    if path.startswith("/jobs/view") or "currentJobId=" in url:
+        return "job"
+    return None
+
+
+def entity_url(entity, url):
+    """The url an entity's benchmark starts from: a company's main page for its recorded about page."""
+    if entity == "company":
+        parts = urllib.parse.urlsplit(url)
+        return urllib.parse.urlunsplit(parts._replace(path="/".join(parts.path.split("/")[:3]) + "/", query=""))
+    return url
+
+
+def measure(entity, url, section, func, repeat=1):
+    """Returns the fastest of `repeat` runs, or None, with a warning, when a page it needs wasn't recorded."""
+    results = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            func()
+        except FixtureNotFound as e:
+            logger.warning("Skipping %s %s of %s: %s", entity, section, url, e.msg)
+            return None
+        finally:
+            seconds = time.perf_counter() - started
+            allocated, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        results.append(Result(entity, url, section, seconds, allocated / 1024, peak / 1024))
+    return min(results, key=lambda result: result.seconds)
+
+
+def _scraper_for(scraper_class, driver, timeout, **kwargs):
+    scraper = scraper_class(driver=driver, scrape=False, **kwargs)
+    scraper.WAIT_FOR_ELEMENT_TIMEOUT = timeout
+    return scraper
+
+
+def bench_person(fixtures, url, repeat, timeout):
+    results = []
+    driver = ReplayDriver(fixtures)
+
+    def top_card():
+        driver.get(url)
+        person = _scraper_for(Person, driver, timeout, linkedin_url=url, get=False)
+        person.get_name_and_location()
+        person.get_about()
+    results.append(measure("person", url, "top_card", top_card, repeat))
+
+    for section, method in LAZY_SECTIONS.items():
+        person = _scraper_for(Person, driver, timeout, linkedin_url=url, get=False)
+        results.append(measure("person", url, section, getattr(person, method), repeat))
+    return results
+
+
+def bench_company(fixtures, url, repeat, timeout):
+    driver = ReplayDriver(fixtures)
+
+    def about_page():
+        company = _scraper_for(Company, driver, timeout, linkedin_url=url, fast=True)
+        company.scrape_logged_in(get_employees=False, close_on_complete=False)
+
+    def about():
+        company = _scraper_for(Company, driver, timeout, linkedin_url=url)
+        company.scrape_logged_in(get_employees=False, close_on_complete=False)
+
+    def employees():
+        company = _scraper_for(Company, driver, timeout, linkedin_url=url)
+        company.get_employees()
+    return [
+        measure("company", url, "about_page", about_page, repeat),
+        measure("company", url, "about", about, repeat),
+        measure("company", url, "employees", employees, repeat),
+    ]
+
+
+def bench_job(fixtures, url, repeat, timeout):
+    driver = ReplayDriver(fixtures)
+
+    def details():
+        job = _scraper_for(Job, driver, timeout, linkedin_url=url)
+        job.scrape_logged_in(close_on_complete=False)
+    return [measure("job", url, "details", details, repeat)]
+
+
+def bench_job_search(fixtures, url, repeat, timeout):
+    driver = ReplayDriver(fixtures)
+    parsed = urllib.parse.urlparse(url)
+    search_term = urllib.parse.parse_qs(parsed.query).get("keywords", [""])[0]
+    base_url = url[:url.index("/jobs/") + len("/jobs/")]
+
+    def search():
+        job_search = _scraper_for(JobSearch, driver, timeout, base_url=base_url)
+        job_search.search(search_term)
+    return [measure("job_search", url, "search", search, repeat)]
+
+
+def _experiences(count):
+    """Synthetic experiences with the repetition of a real crawl: few companies, locations and dates."""
+    for i in range(count):
+        yield Experience(
+            institution_name="Company %d" % (i % 500),
+            linkedin_url="https://www.linkedin.com/company/%d/" % (i % 500),
+            position_title="Position %d" % (i % 200),
+            from_date="Jan %d" % (2000 + i % 20),
+            to_date="Present",
+            duration="%d yrs" % (i % 10),
+            location="City %d" % (i % 100),
+            description="Worked on project %d" % i,
+        )
+
+
+def bench_records(count):
+    """Memory held by `count` experiences as dataclasses, compact records and frozen records."""
+    # Imported here as records needs Python 3.10, which the fixture benchmarks don't.
+    from . import records
+    variants = [
+        ("Experience", lambda experience: experience),
+        ("ExperienceRecord", records.compact),
+        ("FrozenExperienceRecord", lambda experience: records.compact(experience, frozen=True)),
+    ]
+    results = []
+    for name, convert in variants:
+        held = []
+
+        def build():
+            # Strings are copied so that every row starts out with its own objects, as parsed rows do.
+            held.extend(convert(Experience(**{key: "".join(value) if isinstance(value, str) else value
+                                               for key, value in vars(experience).items()}))
+                        for experience in _experiences(count))
+        results.append(measure("records", "%d rows" % count, name, build))
+        del held
+    return results
+
+
+BENCHMARKS = {
+    "person": bench_person,
+    "company": bench_company,
+    "job": bench_job,
+    "job_search": bench_job_search,
+}
+
+
+def run(fixture_dir, entities=tuple(BENCHMARKS), repeat=3, timeout=1):
+    fixtures = FixtureStore(fixture_dir)
+    results = []
+    # Replayed pages don't touch the network, so they aren't paced.
+    limiter, ratelimit.default_limiter = ratelimit.default_limiter, ratelimit.NoLimit()
+    try:
+        urls = []
+        for url in fixtures.urls():
+            entity = classify(url)
+            if entity in entities and (entity, entity_url(entity, url)) not in urls:
+                urls.append((entity, entity_url(entity, url)))
+        for entity, url in urls:
+            try:
+                results.extend(result for result in BENCHMARKS[entity](fixtures, url, repeat, timeout) if result)
+            except Exception as e:
+                logger.warning("Skipping %s: %r", url, e)
+    finally:
+        ratelimit.default_limiter = limiter
+    return results
+
+
+def format_table(results):
+    lines = ["{:<11} {:<22} {:>10} {:>14} {:>10}  {}".format("entity", "section", "ms", "allocated KiB", "peak KiB", "url")]
+    for result in results:
+        lines.append("{:<11} {:<22} {:>10.2f} {:>14.1f} {:>10.1f}  {}".format(
+            result.entity, result.section, result.seconds * 1000, result.allocated_kb, result.peak_kb, result.url
+        ))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture_dir", nargs="?")
+    parser.add_argument("--entity", action="append", choices=sorted(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=1, help="element wait timeout while replaying")
+    parser.add_argument("--records", type=int, metavar="N", help="measure the memory of N experience records")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.fixture_dir is None and args.records is None:
+        parser.error("give a fixture_dir, --records or both")
+    results = []
+    if args.fixture_dir is not None:
+        results.extend(run(args.fixture_dir, entities=args.entity or tuple(BENCHMARKS), repeat=args.repeat, timeout=args.timeout))
+    if args.records is not None:
+        results.extend(bench_records(args.records))
+    logger.info(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import os
+from dataclasses import dataclass, field, replace
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+RESOURCE_URL_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*media.licdn.com/dms/image*"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist*"],
+    "tracking": [
+        "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+        "*ads.linkedin.com*", "*snap.licdn.com*", "*/li/track*", "*/sensorCollect*",
+        "*platform.linkedin.com/litms*",
+    ],
+}
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "linkedin_scraper", "chrome")
+
+
+@dataclass
+class BrowserProfile:
+    headless: bool = True
+    block: tuple = ("image", "font", "media", "tracking")
+    blocked_urls: list = field(default_factory=list)
+    disable_images: bool = True
+    page_load_strategy: str = "eager"
+    cache_dir: str = DEFAULT_CACHE_DIR
+    window_size: str = "1920,1080"
+    arguments: list = field(default_factory=list)
+
+    def url_patterns(self):
+        patterns = []
+        for resource_type in self.block:
+            patterns.extend(RESOURCE_URL_PATTERNS.get(resource_type, []))
+        return patterns + list(self.blocked_urls)
+
+
+PROFILES = {
+    "default": BrowserProfile(),
+    "person": BrowserProfile(),
+    "company": BrowserProfile(),
+    "job": BrowserProfile(),
+    "job_search": BrowserProfile(),
+}
+
+
+def configure_profile(entity, **changes):
+    """Updates the browser profile used for an entity type, e.g. configure_profile("job", block=("font",))."""
+    PROFILES[entity] = replace(PROFILES.get(entity, PROFILES["default"]), **changes)
+    return PROFILES[entity]
+
+
+def chromedriver_path():
+    if os.getenv("CHROMEDRIVER") is not None:
+        return os.getenv("CHROMEDRIVER")
+    bundled = os.path.join(os.path.dirname(__file__), "drivers/chromedriver")
+    return bundled if os.path.exists(bundled) else None
+
+
+def chrome_options(profile):
+    options = Options()
+    options.page_load_strategy = profile.page_load_strategy
+    if profile.headless:
+        options.add_argument("--headless=new")
+    if profile.window_size:
+        options.add_argument("--window-size=" + profile.window_size)
+    if profile.cache_dir:
+        options.add_argument("--disk-cache-dir=" + profile.cache_dir)
+    if profile.disable_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    options.add_argument("--disable-extensions")
+    options.add_argument("--mute-audio")
+    options.add_argument("--autoplay-policy=user-gesture-required")
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    return options
+
+
+def block_urls(driver, patterns):
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def build_driver(entity="default", driver_path=None, **overrides):
+    """Builds a Chrome driver tuned with the browser profile of the given entity type."""
+    profile = PROFILES.get(entity, PROFILES["default"])
+    if overrides:
+        profile = replace(profile, **overrides)
+
+    driver_path = driver_path or chromedriver_path()
+    service = Service(executable_path=driver_path) if driver_path else Service()
+    driver = webdriver.Chrome(service=service, options=chrome_options(profile))
+
+    patterns = profile.url_patterns()
+    if patterns:
+        block_urls(driver, patterns)
+    return driver
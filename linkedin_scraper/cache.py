@@ -0,0 +1,245 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from selenium.common.exceptions import WebDriverException
+
+from . import ratelimit
+from .canonical import canonical_url, entity_key
+from .replay import FixtureNotFound, ReplayDriver, OUTER_HTML_SCRIPT
+
+DAY = 24 * 60 * 60
+# How long a page stays fresh, in seconds, by the entity it belongs to.
+DEFAULT_MAX_AGES = {
+    "person": 7 * DAY,
+    "company": 30 * DAY,
+    "job": DAY,
+    "job_search": 60 * 60,
+    "other": DAY,
+}
+ENTITY_OF_URL_CLASS = {
+    "profile": "person",
+    "details": "person",
+    "company": "company",
+    "job": "job",
+    "jobs_search": "job_search",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    current_url TEXT,
+    entity TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at);
+CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest);
+"""
+
+
+def entity_of(url):
+    return ENTITY_OF_URL_CLASS.get(ratelimit.classify_url(url), "other")
+
+
+class PageCache(object):
+    """An on-disk cache of page snapshots keyed by canonical url.
+
+    Snapshots are stored compressed under the hash of their content, so
+    identical pages are stored once. Pages older than the max age of their
+    entity are stale. Once the snapshots take more than `max_bytes`, the
+    least recently used ones are evicted.
+    """
+
+    def __init__(self, path=None, max_ages=None, max_bytes=512 * 1024 * 1024, clock=time.time):
+        self.path = os.path.expanduser(path or os.path.join("~", ".linkedin_scraper", "pages"))
+        self.max_ages = dict(DEFAULT_MAX_AGES, **(max_ages or {}))
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(self.path, "index.db"), timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _file(self, digest):
+        return os.path.join(self.path, digest[:2], digest + ".html.z")
+
+    def _fresh(self, key, now):
+        row = self.conn.execute(
+            "SELECT digest, current_url, entity, fetched_at FROM pages WHERE url = ?", (key,)
+        ).fetchone()
+        if row is not None and ratelimit.is_blocked(row[1]):
+            # A login or checkpoint page is never served in place of the page that was asked for.
+            self.conn.execute("DELETE FROM pages WHERE url = ?", (key,))
+            self._remove_unused(row[0])
+            return None
+        if row is None or now - row[3] > self.max_ages.get(row[2], self.max_ages["other"]):
+            return None
+        return row
+
+    def __contains__(self, url):
+        """Whether a fresh snapshot of url is cached."""
+        with self._lock:
+            return self._fresh(canonical_url(url), self.clock()) is not None
+
+    def get(self, url):
+        """Returns (page_source, current_url) of a fresh snapshot of url, or None."""
+        key = canonical_url(url)
+        now = self.clock()
+        with self._lock:
+            row = self._fresh(key, now)
+            if row is None:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, key))
+            self.hits += 1
+        try:
+            with open(self._file(row[0]), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8"), row[1]
+        except (OSError, zlib.error):
+            self.delete(url)
+            return None
+
+    def load(self, url):
+        """The FixtureStore interface, so that a ReplayDriver can serve cached pages."""
+        cached = self.get(url)
+        if cached is None:
+            raise FixtureNotFound("No fresh page cached for " + url)
+        return cached
+
+    def put(self, url, page_source, current_url=None):
+        data = zlib.compress(page_source.encode("utf-8"))
+        digest = hashlib.sha256(data).hexdigest()
+        file_name = self._file(digest)
+        if not os.path.exists(file_name):
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            with open(file_name + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(file_name + ".tmp", file_name)
+        now = self.clock()
+        with self._lock:
+            previous = self.conn.execute("SELECT digest FROM pages WHERE url = ?", (canonical_url(url),)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, digest, current_url, entity, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (canonical_url(url), digest, current_url or url, entity_of(url), len(data), now, now)
+            )
+            if previous is not None and previous[0] != digest:
+                self._remove_unused(previous[0])
+            self._evict()
+
+    def delete(self, url):
+        with self._lock:
+            row = self.conn.execute("SELECT digest FROM pages WHERE url = ?", (canonical_url(url),)).fetchone()
+            if row is not None:
+                self.conn.execute("DELETE FROM pages WHERE url = ?", (canonical_url(url),))
+                self._remove_unused(row[0])
+
+    def _remove_unused(self, digest):
+        """Removes the snapshot of digest if no url uses it any more, returning whether it was unused."""
+        if self.conn.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is not None:
+            return False
+        try:
+            os.remove(self._file(digest))
+        except OSError:
+            pass
+        return True
+
+    def size(self):
+        """Bytes taken by the stored snapshots."""
+        with self._lock:
+            return self._size()
+
+    def _size(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM pages)").fetchone()[0]
+
+    def _evict(self):
+        total = self._size()
+        while total > self.max_bytes:
+            row = self.conn.execute("SELECT url, digest, size FROM pages ORDER BY accessed_at LIMIT 1").fetchone()
+            if row is None:
+                return
+            self.conn.execute("DELETE FROM pages WHERE url = ?", (row[0],))
+            # A snapshot shared with other urls still takes its space.
+            if self._remove_unused(row[1]):
+                total -= row[2]
+
+
+class CachingDriver(object):
+    """Wraps a live driver, serving fresh pages from a PageCache and caching the others.
+
+    A cached page is served by a ReplayDriver, so scrapers parse the snapshot
+    instead of navigating. A live page's rendered DOM is cached when the
+    driver navigates away from it, once the scrapers have expanded and
+    scrolled it. Only profile, company and job pages are cached, and not
+    when the navigation was blocked or ended up on another entity's page.
+    """
+
+    def __init__(self, driver, cache):
+        self.driver = driver
+        self.cache = cache
+        self.replay = ReplayDriver(cache)
+        self._active = driver
+        self._url = None
+
+    def __getattr__(self, name):
+        return getattr(self._active, name)
+
+    def serves_from_cache(self, url):
+        """Lets the rate limiter skip pacing for pages that won't touch the network."""
+        return url in self.cache
+
+    def report_blocked(self, url):
+        """Called by the rate limiter when the navigation to url was redirected to a block, so it isn't cached."""
+        if url == self._url:
+            self._url = None
+
+    def _flush(self):
+        if self._url is None:
+            return
+        try:
+            current_url = self.driver.current_url
+            key = entity_key(self._url)
+            if key is not None and not ratelimit.is_blocked(current_url) and entity_key(current_url) == key:
+                self.cache.put(self._url, self.driver.execute_script(OUTER_HTML_SCRIPT), current_url)
+        except WebDriverException:
+            pass
+        self._url = None
+
+    def get(self, url):
+        self._flush()
+        try:
+            self.replay.get(url)
+            self._active = self.replay
+        except FixtureNotFound:
+            self.driver.get(url)
+            self._active = self.driver
+            self._url = url
+
+    @property
+    def page_source(self):
+        return self._active.page_source
+
+    @property
+    def current_url(self):
+        return self._active.current_url
+
+    def close(self):
+        self._flush()
+        return self.driver.close()
+
+    def quit(self):
+        self._flush()
+        return self.driver.quit()
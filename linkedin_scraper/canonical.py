@@ -0,0 +1,144 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+LINKEDIN_URL = "https://www.linkedin.com"
+
+PROFILE_PATH = re.compile(r"^/in/([^/]+)(/.*)?$")
+COMPANY_PATH = re.compile(r"^/(company|school|showcase)/([^/]+)(/.*)?$")
+JOB_PATH = re.compile(r"^/jobs/view/(?:[^/]*-)?(\d+)(?:/.*)?$")
+TRACKING_PARAMS = {"trk", "trkInfo", "trackingId", "refId", "lipi", "midToken", "midSig", "eBP", "originalSubdomain",
+                   "original_referer", "position", "pageNum", "refresh", "currentJobId"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+"""
+
+
+def _path_id(value):
+    return urllib.parse.unquote(value).lower()
+
+
+def canonical_url(url):
+    """Normalises a LinkedIn url so that every link to the same page is equal.
+
+    The scheme and host are fixed, the fragment and tracking parameters are
+    dropped, profile vanity ids and company slugs are lowercased and
+    ?currentJobId= links become /jobs/view/ links.
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    params = urllib.parse.parse_qsl(parts.query)
+    job_ids = [value for name, value in params if name == "currentJobId"]
+    if job_ids and not parts.path.startswith("/jobs/search"):
+        return "%s/jobs/view/%s/" % (LINKEDIN_URL, job_ids[0])
+
+    path = re.sub(r"/+", "/", parts.path).rstrip("/")
+    match = PROFILE_PATH.match(path)
+    if match:
+        path = "/in/%s%s" % (_path_id(match.group(1)), match.group(2) or "")
+    match = COMPANY_PATH.match(path)
+    if match:
+        path = "/%s/%s%s" % (match.group(1), _path_id(match.group(2)), match.group(3) or "")
+    match = JOB_PATH.match(path)
+    if match:
+        path = "/jobs/view/%s" % match.group(1)
+
+    query = ""
+    if path.startswith("/jobs/search"):
+        query = urllib.parse.urlencode(sorted((name, value) for name, value in params if name not in TRACKING_PARAMS))
+    host = parts.netloc.lower()
+    if not host or host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = "www.linkedin.com"
+    return urllib.parse.urlunsplit(("https", host, path + "/", query, ""))
+
+
+def entity_key(url):
+    """The identity of the profile, company or job a url belongs to, e.g. "person:john-doe", or None.
+
+    Sub-pages of an entity, like a profile's details/experience, have the key of the entity.
+    """
+    parts = urllib.parse.urlsplit(canonical_url(url))
+    path = parts.path.rstrip("/")
+    match = PROFILE_PATH.match(path)
+    if match:
+        return "person:" + match.group(1)
+    match = COMPANY_PATH.match(path)
+    if match:
+        return "company:" + match.group(2)
+    match = JOB_PATH.match(path)
+    if match:
+        return "job:" + match.group(1)
+    return None
+
+
+def entity_url(url):
+    """The url of the entity a url belongs to, e.g. the profile of one of its details pages."""
+    key = entity_key(url)
+    if key is None:
+        return canonical_url(url)
+    kind, value = key.split(":", 1)
+    if kind == "person":
+        return "%s/in/%s/" % (LINKEDIN_URL, value)
+    if kind == "job":
+        return "%s/jobs/view/%s/" % (LINKEDIN_URL, value)
+    return "%s/company/%s/" % (LINKEDIN_URL, value)
+
+
+class SeenIndex(object):
+    """A persistent set of the entities already scraped, across crawl runs, keyed by entity_key."""
+
+    def __init__(self, path=None):
+        self.path = os.path.expanduser(path or os.path.join("~", ".linkedin_scraper", "seen.db"))
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def key(url):
+        return entity_key(url) or canonical_url(url)
+
+    def __contains__(self, url):
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM seen WHERE key = ?", (self.key(url),)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def add(self, url):
+        """Marks the entity of url as seen. Returns True if it wasn't already."""
+        return self.add_many([url]) == 1
+
+    def add_many(self, urls):
+        now = time.time()
+        rows = [(self.key(url), entity_url(url), now, now) for url in urls]
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.executemany("INSERT OR IGNORE INTO seen (key, url, first_seen, last_seen) VALUES (?, ?, ?, ?)", rows)
+            added = self.conn.total_changes - before
+            self.conn.executemany("UPDATE seen SET last_seen = ? WHERE key = ?", [(now, row[0]) for row in rows])
+        return added
+
+    def unseen(self, urls):
+        """The entity urls of `urls` that were never seen, once each, in order."""
+        result = []
+        keys = set()
+        for url in urls:
+            key = self.key(url)
+            if key not in keys and url not in self:
+                keys.add(key)
+                result.append(entity_url(url))
+        return result
@@ -4,15 +4,27 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .objects import Scraper
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from .objects import Scraper, to_record, section
+from . import canonical
+from . import parsers
+from . import selectors
 from .person import Person
-import time
+from .browser import build_driver
+from .extract import Field, Section
 import os
 import json
 
 AD_BANNER_CLASSNAME = ('ad-banner-container', '__ad')
 
+EMPLOYEES = Section(
+    "li",
+    name=Field(line=0),
+    designation=Field(line=3),
+    linkedin_url=Field("a", "href"),
+)
+EMPLOYEE_SCHEMA = {"name": str, "designation": str, "linkedin_url": str}
+
 def getchildren(elem):
     return elem.find_elements(By.XPATH, ".//*")
 
@@ -26,6 +38,13 @@ class CompanySummary(object):
         self.name = name
         self.followers = followers
 
+    def to_dict(self):
+        return {"linkedin_url": self.linkedin_url, "name": self.name, "followers": self.followers}
+
+    @classmethod
+    def schema(cls):
+        return {"linkedin_url": str, "name": str, "followers": str}
+
     def __repr__(self):
         if self.followers == None:
             return """ {name} """.format(name = self.name)
@@ -48,8 +67,9 @@ class Company(Scraper):
     affiliated_companies = []
     employees = []
     headcount = None
+    employee_cursor = None
 
-    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True):
+    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True, seen = None, fast = False):
         self.linkedin_url = linkedin_url
         self.name = name
         self.about_us = about_us
@@ -63,23 +83,23 @@ class Company(Scraper):
         self.specialties = specialties
         self.showcase_pages = showcase_pages
         self.affiliated_companies = affiliated_companies
+        self.seen = seen
+        self.fast = fast
 
-        if driver is None:
-            try:
-                if os.getenv("CHROMEDRIVER") == None:
-                    driver_path = os.path.join(os.path.dirname(__file__), 'drivers/chromedriver')
-                else:
-                    driver_path = os.getenv("CHROMEDRIVER")
+        if self.already_seen(linkedin_url):
+            return
 
-                driver = webdriver.Chrome(driver_path)
-            except:
-                driver = webdriver.Chrome()
+        if driver is None:
+            driver = build_driver("company")
 
-        driver.get(linkedin_url)
         self.driver = driver
+        # Fast mode reads everything from the about page, so it is the only page loaded
+        self.navigate(self.about_url() if fast else linkedin_url)
 
         if scrape:
-            self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
+            self.scraped = self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
+            if self.scraped:
+                self.mark_seen(linkedin_url)
 
     def __get_text_under_subtitle(self, elem):
         return "\n".join(elem.text.split("\n")[1:])
@@ -88,147 +108,172 @@ class Company(Scraper):
         return self.__get_text_under_subtitle(driver.find_element(By.CLASS_NAME, class_name))
 
     def scrape(self, get_employees=True, close_on_complete=True):
+        """Scrapes the company. Returns True if it was scraped logged in."""
         if self.is_signed_in():
-            self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+            return self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
         else:
+            if self.fast:
+                self.navigate(self.linkedin_url)
             self.scrape_not_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
+            return False
 
-    def __parse_employee__(self, employee_raw):
+    def iter_employees(self, limit=None, cursor=None, wait_time=10):
+        """Yields employees from the people page as they load.
 
-        try:
-            # print()
-            employee_object = {}
-            employee_object['name'] = (employee_raw.text.split("\n") or [""])[0].strip()
-            employee_object['designation'] = (employee_raw.text.split("\n") or [""])[3].strip()
-            employee_object['linkedin_url'] = employee_raw.find_element(By.TAG_NAME, "a").get_attribute("href")
-            # print(employee_raw.text, employee_object)
-            # _person = Person(
-            #     # linkedin_url = employee_raw.find_element_by_tag_name("a").get_attribute("href"),
-            #     linkedin_url = employee_raw.find_element_by_tag_name("a").get_attribute("href"),
-            #     name = (employee_raw.text.split("\n") or [""])[0].strip(),
-            #     driver = self.driver,
-            #     get = True,
-            #     scrape = False,
-            #     designation = (employee_raw.text.split("\n") or [""])[3].strip()
-            #     )
-            # print(_person, employee_object)
-            # return _person
-            return employee_object
-        except Exception as e:
-            # print(e)
-            return None
-
-    def get_employees(self, wait_time=10):
-        total = []
-        list_css = "list-style-none"
-        next_xpath = '//button[@aria-label="Next"]'
+        Only list items past the current position are fetched on each scroll,
+        and each employee is parsed once. The position counts the items of all
+        the pages of results gone through, so it carries over when "Next"
+        replaces the list. `employee_cursor` holds the position reached so far
+        and can be passed back as `cursor` to resume.
+        """
         driver = self.driver
+        position = self.employee_cursor = cursor or 0
+        seen = set()
+        yielded = 0
 
-        try:
-            see_all_employees = driver.find_element(By.XPATH,'//a[@data-control-name="topcard_see_all_employees"]')
-        except:
-            pass
-        driver.get(os.path.join(self.linkedin_url, "people"))
+        self.navigate(os.path.join(self.linkedin_url, "people"))
 
-        # Wait for the people list to load - try multiple selectors for compatibility
-        try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.XPATH, '//h2[contains(text(), "People you may know")]')))
-        except:
-            try:
-                _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//span[@dir="ltr"]')))
-            except:
-                # If neither selector works, just wait a bit and continue
-                time.sleep(2)
+        # Wait for the people list to load, with any known version of the page
+        if selectors.wait_for(driver, "company.people_loaded", timeout=6) is None:
+            self.wait_for_dom_quiescence()
 
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-        time.sleep(1)
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-        time.sleep(1)
-
-        results_list = driver.find_element(By.CLASS_NAME, list_css)
-        results_li = results_list.find_elements(By.TAG_NAME, "li")
-        for res in results_li:
-            total.append(self.__parse_employee__(res))
-
-        def is_loaded(previous_results):
-          loop = 0
-          driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-          results_li = results_list.find_elements(By.TAG_NAME, "li")
-          while len(results_li) == previous_results and loop <= 5:
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            loop += 1
-          return loop <= 5
-
-        def get_data(previous_results):
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            for res in results_li[previous_results:]:
-                total.append(self.__parse_employee__(res))
 
-        results_li_len = len(results_li)
-        while is_loaded(results_li_len):
+        # The position of the first item of the current page of results
+        offset = 0
+        results_list = None
+        previous_count = None
+        while True:
+            if results_list is None:
+                # Found again on each page, as the previous page's list element is gone once it re-renders
+                results_list = selectors.find_element(driver, "company.people_list")
+            count = self.wait_for_list_stable(by=By.TAG_NAME, name="li", base=results_list)
+
+            if offset + count > position:
+                for employee in EMPLOYEES.extract(driver, base=results_list, start=position - offset):
+                    position += 1
+                    self.employee_cursor = position
+                    if employee["designation"] is None or not employee["linkedin_url"]:
+                        continue
+                    key = canonical.entity_key(employee["linkedin_url"] or "") or employee["name"]
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield employee
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+
+            next_buttons = selectors.find_elements(driver, "company.people_next")
+            if not next_buttons:
+                # Scrolling loads more of the page until it stops growing
+                if count == previous_count:
+                    return
+                previous_count = count
+                driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
+                continue
+
+            items = results_list.find_elements(By.TAG_NAME, "li")
+            next_buttons[0].click()
             try:
-                driver.find_element(By.XPATH,next_xpath).click()
-            except:
-                pass
-            _ = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, list_css)))
-
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*2/3));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-            time.sleep(1)
+                change = WebDriverWait(driver, wait_time).until(
+                    self._list_changed(results_list, items[0] if items else None, count)
+                )
+            except TimeoutException:
+                return
+            if change == "replaced":
+                offset += count
+                position = self.employee_cursor = max(position, offset)
+                results_list = None
+                previous_count = None
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            time.sleep(1)
 
-            get_data(results_li_len)
-            results_li_len = len(total)
-        return total
+    @staticmethod
+    def _list_changed(results_list, first_item, count):
+        """Waits on the list after "Next" was clicked: "replaced" by the next page, or "grown" with more items."""
+        def changed(driver):
+            try:
+                (first_item or results_list).is_enabled()
+            except StaleElementReferenceException:
+                return "replaced"
+            try:
+                return "grown" if len(results_list.find_elements(By.TAG_NAME, "li")) > count else False
+            except StaleElementReferenceException:
+                return "replaced"
+        return changed
 
+    @section("employees")
+    def get_employees(self, wait_time=10):
+        return list(self.iter_employees(wait_time=wait_time))
 
+    def about_url(self):
+        return os.path.join(self.linkedin_url, "about")
 
     def scrape_logged_in(self, get_employees = True, close_on_complete = True):
         driver = self.driver
 
-        driver.get(self.linkedin_url)
+        if not (self.fast and self.get_about_page()):
+            self.get_name()
+            self.get_about()
+
+        if get_employees:
+            self.employees = self.get_employees()
+
+        if not self.fast:
+            self.navigate(self.linkedin_url)
+
+        if close_on_complete:
+            driver.close()
+        return True
+
+    @section("about_page")
+    def get_about_page(self):
+        """Parses the name, overview, details, headcount and related companies from one snapshot of the about page.
+
+        Returns False if the page could not be parsed, for the caller to fall back to get_name and get_about.
+        """
+        if self.driver.current_url.rstrip("/") != self.about_url().rstrip("/"):
+            self.navigate(self.about_url())
+        self.wait_for_selector("main", by=By.TAG_NAME, timeout=3)
+        self.wait_for_dom_quiescence()
+
+        about = parsers.parse_company_about(self.page_tree())
+        if about is None:
+            return False
+        self.showcase_pages = [CompanySummary(**card) for card in about.pop("showcase_pages")]
+        self.affiliated_companies = [CompanySummary(**card) for card in about.pop("affiliated_companies")]
+        for attr, value in about.items():
+            setattr(self, attr, value)
+        return True
+
+    @section("top_card")
+    def get_name(self):
+        driver = self.driver
+        self.navigate(self.linkedin_url)
 
         # Wait for page to load
-        try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.TAG_NAME, 'main')))
-        except:
-            time.sleep(2)
+        self.wait_for_selector("main", by=By.TAG_NAME, timeout=3)
 
         # Get company name from heading
-        try:
-            self.name = driver.find_element(By.XPATH, "//h1").text.strip()
-        except:
-            try:
-                self.name = driver.find_element(By.CLASS_NAME,"org-top-card-summary__title").text.strip()
-            except:
-                pass
+        headings = selectors.find_elements(driver, "company.name")
+        if headings:
+            self.name = headings[0].text.strip()
+
+    @section("about")
+    def get_about(self):
+        driver = self.driver
 
         # Navigate to about page
-        driver.get(os.path.join(self.linkedin_url, "about"))
+        self.navigate(self.about_url())
 
-        try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.TAG_NAME, 'main')))
-        except:
-            time.sleep(2)
-        time.sleep(2)
+        self.wait_for_selector("main", by=By.TAG_NAME, timeout=3)
+        self.wait_for_dom_quiescence()
 
         # Get about/overview text
-        try:
-            overview_section = driver.find_element(By.XPATH, "//h2[contains(text(), 'Overview')]/following-sibling::p")
-            self.about_us = overview_section.text.strip()
-        except:
-            try:
-                descWrapper = driver.find_elements(By.TAG_NAME, "p")
-                if len(descWrapper) > 0:
-                    self.about_us = descWrapper[0].text.strip()
-            except:
-                pass
+        overview = selectors.find_elements(driver, "company.overview")
+        if overview:
+            self.about_us = overview[0].text.strip()
 
         # Get company details from dt/dd pairs
         try:
@@ -263,23 +308,20 @@ class Company(Scraper):
             pass
 
         # Get headcount from associated members link
-        try:
-            members_link = driver.find_element(By.XPATH, "//a[contains(text(), 'associated members')]")
-            txt = members_link.text.strip()
-            # Extract number from text like "14,436 associated members"
-            import re
-            match = re.search(r'([\d,]+)\s*associated members', txt)
-            if match:
-                self.headcount = int(match.group(1).replace(',', ''))
-        except:
-            pass
+        # Extract number from text like "14,436 associated members", trying each version until one has it
+        members = selectors.find_elements(
+            driver, "company.associated_members", lambda elem: parsers.ASSOCIATED_MEMBERS.search(elem.text)
+        )
+        if members:
+            match = parsers.ASSOCIATED_MEMBERS.search(members[0].text)
+            self.headcount = int(match.group(1).replace(',', ''))
 
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
 
 
         try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
-            showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
+            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located(selectors.locator("company.related_list")))
+            showcase, affiliated = selectors.find_elements(driver, "company.related_list")
             driver.find_element(By.ID,"org-related-companies-module__show-more-btn").click()
 
             # get showcase
@@ -304,19 +346,11 @@ class Company(Scraper):
         except:
             pass
 
-        if get_employees:
-            self.employees = self.get_employees()
-
-        driver.get(self.linkedin_url)
-
-        if close_on_complete:
-            driver.close()
-
     def scrape_not_logged_in(self, close_on_complete = True, retry_limit = 10, get_employees = True):
         driver = self.driver
         retry_times = 0
         while self.is_signed_in() and retry_times <= retry_limit:
-            page = driver.get(self.linkedin_url)
+            self.navigate(self.linkedin_url)
             retry_times = retry_times + 1
 
         self.name = driver.find_element(By.CLASS_NAME, "name").text.strip()
@@ -367,25 +401,40 @@ class Company(Scraper):
         if get_employees:
             self.employees = self.get_employees()
 
-        driver.get(self.linkedin_url)
+        self.navigate(self.linkedin_url)
 
         if close_on_complete:
             driver.close()
 
+    def to_dict(self):
+        return {
+            "linkedin_url": self.linkedin_url,
+            "name": self.name,
+            "about_us": self.about_us,
+            "website": self.website,
+            "phone": self.phone,
+            "headquarters": self.headquarters,
+            "founded": self.founded,
+            "industry": self.industry,
+            "company_type": self.company_type,
+            "company_size": self.company_size,
+            "specialties": self.specialties,
+            "headcount": self.headcount,
+            "showcase_pages": to_record(self.showcase_pages),
+            "affiliated_companies": to_record(self.affiliated_companies),
+            "employees": to_record(self.employees),
+        }
+
+    @classmethod
+    def schema(cls):
+        """Maps each key of to_dict to its type, with [Type] for a list of records."""
+        schema = dict.fromkeys(
+            ["linkedin_url", "name", "about_us", "website", "phone", "headquarters", "founded", "industry",
+             "company_type", "company_size", "specialties"],
+            str
+        )
+        schema.update(headcount=int, showcase_pages=[CompanySummary], affiliated_companies=[CompanySummary], employees=[EMPLOYEE_SCHEMA])
+        return schema
+
     def __repr__(self):
-        _output = {}
-        _output['name'] = self.name
-        _output['about_us'] = self.about_us
-        _output['specialties'] = self.specialties
-        _output['website'] = self.website
-        _output['phone'] = self.phone
-        _output['industry'] = self.industry
-        _output['company_type'] = self.name
-        _output['headquarters'] = self.headquarters
-        _output['company_size'] = self.company_size
-        _output['founded'] = self.founded
-        _output['affiliated_companies'] = self.affiliated_companies
-        _output['employees'] = self.employees
-        _output['headcount'] = self.headcount
-        
-        return json.dumps(_output).replace('\n', '')
+        return json.dumps(self.to_dict()).replace('\n', '')
@@ -0,0 +1,116 @@
+import json
+import os
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from . import canonical
+from .browser import build_driver
+from .extract import Field, Section
+from .objects import Contact, Scraper
+
+CONNECTIONS_URL = "https://www.linkedin.com/mynetwork/invite-connect/connections/"
+CONNECTIONS_LIST = "mn-connections"
+CARD_CLASS = "mn-connection-card"
+LOAD_MORE_CSS = "button.scaffold-finite-scroll__load-button"
+
+CONNECTION_CARDS = Section(
+    "." + CARD_CLASS,
+    url=Field(".mn-connection-card__link", "href"),
+    name=Field(".mn-connection-card__details .mn-connection-card__name"),
+    occupation=Field(".mn-connection-card__details .mn-connection-card__occupation"),
+)
+
+
+class ConnectionsCrawler(Scraper):
+    """Streams the connections of the logged-in account from the infinitely scrolling connections page.
+
+    Each round scrolls to the bottom of the list, waits for it to stop
+    growing and parses only the cards past the current position, so each
+    card is read once. Cards repeated across a round's boundary are dropped
+    by remembering the last `recent_window` connections. The position and
+    those recent connections are checkpointed to `checkpoint` after every
+    round, and a new crawler given the same checkpoint resumes from there.
+    """
+
+    def __init__(self, driver=None, checkpoint=None, stable_rounds=2, wait_time=10, recent_window=500):
+        self.driver = driver or build_driver("person")
+        self.checkpoint = os.path.expanduser(checkpoint) if checkpoint else None
+        self.stable_rounds = stable_rounds
+        self.wait_time = wait_time
+        self.position = 0
+        self.recent_keys = deque(maxlen=recent_window)
+        self._recent = set()
+        self.load_checkpoint()
+
+    def _remember(self, key):
+        """Adds key to the recent keys, returning False if it is already one of them."""
+        if key in self._recent:
+            return False
+        if len(self.recent_keys) == self.recent_keys.maxlen:
+            self._recent.discard(self.recent_keys[0])
+        self.recent_keys.append(key)
+        self._recent.add(key)
+        return True
+
+    def load_checkpoint(self):
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        self.position = state["position"]
+        for key in state.get("recent", []):
+            self._remember(key)
+
+    def save_checkpoint(self):
+        if self.checkpoint is None:
+            return
+        with open(self.checkpoint + ".tmp", "w") as f:
+            json.dump({"position": self.position, "recent": list(self.recent_keys)}, f)
+        os.replace(self.checkpoint + ".tmp", self.checkpoint)
+
+    def _load_more(self, connections):
+        self.scroll_to_bottom()
+        try:
+            self.driver.find_element(By.CSS_SELECTOR, LOAD_MORE_CSS).click()
+        except WebDriverException:
+            pass
+        return self.wait_for_list_stable(by=By.CLASS_NAME, name=CARD_CLASS, base=connections, timeout=self.wait_time)
+
+    def crawl(self, limit=None):
+        """Yields a Contact for each connection not yielded before, up to `limit` of them."""
+        self.navigate(CONNECTIONS_URL)
+        connections = self.wait_for_selector(CONNECTIONS_LIST, by=By.CLASS_NAME, timeout=self.wait_time)
+        if connections is None:
+            return
+        yielded = 0
+        count = self.wait_for_list_stable(by=By.CLASS_NAME, name=CARD_CLASS, base=connections, timeout=self.wait_time)
+        # When resuming, scroll back to the checkpointed position without parsing the cards before it.
+        while count < self.position:
+            previous_count, count = count, self._load_more(connections)
+            if count <= previous_count:
+                break
+        idle_rounds = 0
+        while True:
+            if count > self.position:
+                idle_rounds = 0
+                for record in CONNECTION_CARDS.extract(self.driver, base=connections, start=self.position):
+                    self.position += 1
+                    key = canonical.entity_key(record["url"] or "") or record["name"]
+                    if not self._remember(key):
+                        continue
+                    yield Contact(**record)
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        self.save_checkpoint()
+                        return
+                self.save_checkpoint()
+            else:
+                idle_rounds += 1
+                if idle_rounds >= self.stable_rounds:
+                    return
+            count = self._load_more(connections)
+
+    def __iter__(self):
+        return self.crawl()
@@ -0,0 +1,213 @@
+import csv
+import json
+import os
+import threading
+
+from .objects import to_record
+
+
+class Sink(object):
+    """Writes scraped records to a file as they are produced, flushing every `batch_size` records.
+
+    `schema` is an entity class with a schema() classmethod (Person, Company,
+    Job...) or the dict it returns. Use it as a context manager, or pass
+    `sink.store` as the store of a frontier crawl. Stored records are
+    flushed and synced to disk one by one, since the frontier marks the
+    item done as soon as store returns.
+    """
+
+    def __init__(self, path, schema=None, batch_size=100):
+        self.path = os.path.expanduser(path)
+        self.schema = schema.schema() if hasattr(schema, "schema") else schema
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch = []
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        record = to_record(record)
+        with self._lock:
+            self._batch.append(record)
+            self.count += 1
+            if len(self._batch) >= self.batch_size:
+                self._flush()
+
+    def store(self, url, kind, record):
+        """Writes a record for a frontier crawl and returns a pointer to it once it is on disk."""
+        record = to_record(record)
+        with self._lock:
+            self._batch.append(record)
+            self.count += 1
+            self._flush()
+            pointer = "%s:%d" % (self.current_path, self.count)
+            self.sync()
+        return pointer
+
+    @property
+    def current_path(self):
+        """The file records are written to."""
+        return self.path
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self.write_batch(self._batch)
+            self._batch = []
+
+    def write_batch(self, records):
+        raise NotImplementedError
+
+    def sync(self):
+        """Makes the records written so far durable."""
+        raise NotImplementedError
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JSONLSink(Sink):
+
+    def __init__(self, path, schema=None, batch_size=100):
+        super().__init__(path, schema, batch_size)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def write_batch(self, records):
+        self.file.writelines(json.dumps(record, default=str) + "\n" for record in records)
+        self.file.flush()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        super().close()
+        self.file.close()
+
+
+class CSVSink(Sink):
+    """One row per record. Nested lists and records are written as JSON."""
+
+    def __init__(self, path, schema=None, batch_size=100):
+        super().__init__(path, schema, batch_size)
+        write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self.file = open(self.path, "a", encoding="utf-8", newline="")
+        self.writer = None
+        self._write_header = write_header
+
+    def write_batch(self, records):
+        if self.writer is None:
+            columns = list(self.schema or records[0])
+            self.writer = csv.DictWriter(self.file, fieldnames=columns, extrasaction="ignore")
+            if self._write_header:
+                self.writer.writeheader()
+        self.writer.writerows(
+            {key: json.dumps(value, default=str) if isinstance(value, (list, dict)) else value
+             for key, value in record.items()}
+            for record in records
+        )
+        self.file.flush()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        super().close()
+        self.file.close()
+
+
+def arrow_type(kind):
+    """The pyarrow type for a schema entry: a type, a record class, a dict of fields or [entry] for a list."""
+    import pyarrow as pa
+    if isinstance(kind, list):
+        return pa.list_(arrow_type(kind[0]))
+    if hasattr(kind, "schema"):
+        kind = kind.schema()
+    if isinstance(kind, dict):
+        return pa.struct([(name, arrow_type(value)) for name, value in kind.items()])
+    return {int: pa.int64(), float: pa.float64(), bool: pa.bool_()}.get(kind, pa.string())
+
+
+class ParquetSink(Sink):
+    """Writes one row group per batch. Needs pyarrow (pip install pyarrow).
+
+    A Parquet file can't be appended to, so existing files are never
+    overwritten: records go to the first free part file, people.parquet,
+    then people.1.parquet, people.2.parquet... `paths` lists the files
+    written. A Parquet file is only readable once closed, so syncing closes
+    it and the next records start a new part file.
+    """
+
+    def __init__(self, path, schema=None, batch_size=1000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("ParquetSink needs pyarrow, install it with `pip install pyarrow`")
+        super().__init__(path, schema, batch_size)
+        self.writer = None
+        self.paths = []
+
+    @property
+    def current_path(self):
+        return self.paths[-1] if self.paths else self.path
+
+    def _next_path(self):
+        stem, extension = os.path.splitext(self.path)
+        path, part = self.path, 0
+        while os.path.exists(path):
+            part += 1
+            path = "%s.%d%s" % (stem, part, extension)
+        return path
+
+    def write_batch(self, records):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self.schema is not None:
+            schema = pa.schema([(name, arrow_type(kind)) for name, kind in self.schema.items()])
+            table = pa.Table.from_pylist(records, schema=schema)
+        else:
+            table = pa.Table.from_pylist(records)
+        if self.writer is None:
+            self.paths.append(self._next_path())
+            self.writer = pq.ParquetWriter(self.paths[-1], table.schema)
+        self.writer.write_table(table.cast(self.writer.schema))
+
+    def sync(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def close(self):
+        super().close()
+        self.sync()
+
+
+SINKS = {
+    ".jsonl": JSONLSink,
+    ".csv": CSVSink,
+    ".parquet": ParquetSink,
+}
+
+
+def open_sink(path, schema=None, **kwargs):
+    """Opens the sink matching the file extension of path."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SINKS:
+        raise ValueError("No sink for %s files, use one of %s" % (extension, ", ".join(sorted(SINKS))))
+    return SINKS[extension](path, schema, **kwargs)
+
+
+def export(entities, path, schema=None, **kwargs):
+    """Writes each entity of an iterable to path as it is produced, returning the number written."""
+    with open_sink(path, schema, **kwargs) as sink:
+        for entity in entities:
+            sink.write(entity)
+    return sink.count
@@ -0,0 +1,111 @@
+import json
+
+from lxml import html
+
+from . import parsers
+from .locators import locator_to_xpath
+from selenium.webdriver.common.by import By
+
+EXTRACT_SCRIPT = """
+var base = arguments[0] || document, start = arguments[1] || 0;
+var root = %(root)s, fields = %(fields)s;
+function read(target, field) {
+    if (!target) return null;
+    var value = field.attr === "text" ? target.innerText : (field.attr in target ? target[field.attr] : target.getAttribute(field.attr));
+    if (value == null) return null;
+    value = String(value);
+    if (field.line != null) {
+        value = value.split("\\n")[field.line];
+        if (value == null) return null;
+    }
+    return value.trim();
+}
+var nodes = base.querySelectorAll(root), records = [];
+for (var i = start; i < nodes.length; i++) {
+    var node = nodes[i], record = {};
+    for (var name in fields) {
+        var field = fields[name];
+        if (field.many) {
+            var targets = field.selector ? node.querySelectorAll(field.selector) : [node];
+            record[name] = Array.prototype.map.call(targets, function (t) { return read(t, field); })
+                .filter(function (v) { return v != null; });
+        } else {
+            record[name] = read(field.selector ? node.querySelector(field.selector) : node, field);
+        }
+    }
+    records.push(record);
+}
+return records;
+"""
+
+
+class Field(object):
+    """One value of a record: the text or an attribute of the element matching `selector` in it.
+
+    `selector` is a CSS selector relative to the record element (None for the
+    element itself), `attr` is "text" or an attribute/property name, `line`
+    picks one line of the value and `many` collects every match.
+    """
+
+    def __init__(self, selector=None, attr="text", line=None, many=False):
+        self.selector = selector
+        self.attr = attr
+        self.line = line
+        self.many = many
+
+    def to_json(self):
+        return {"selector": self.selector, "attr": self.attr, "line": self.line, "many": self.many}
+
+
+class Section(object):
+    """Declares the records of a page section, compiled into a single execute_script call."""
+
+    def __init__(self, root, **fields):
+        self.root = root
+        self.fields = fields
+        self.script = EXTRACT_SCRIPT % {
+            "root": json.dumps(root),
+            "fields": json.dumps({name: field.to_json() for name, field in fields.items()}),
+        }
+
+    def extract(self, driver, base=None, start=0):
+        """Returns one dict per record element under base, skipping the first `start` of them."""
+        records = driver.execute_script(self.script, base, start)
+        if records is None:
+            records = self.extract_tree(self._tree(driver, base), start)
+        return records
+
+    @staticmethod
+    def _tree(driver, base):
+        if base is not None and hasattr(base, "elem"):
+            return base.elem
+        tree = html.fromstring(driver.page_source)
+        tree.make_links_absolute(driver.current_url)
+        return tree
+
+    def _read(self, target, field):
+        if target is None:
+            return None
+        value = parsers.text(target) if field.attr == "text" else target.get(field.attr)
+        if value is None:
+            return None
+        if field.line is not None:
+            lines = value.split("\n")
+            if field.line >= len(lines):
+                return None
+            value = lines[field.line]
+        return value.strip()
+
+    def extract_tree(self, tree, start=0):
+        """Evaluates the section against an lxml tree, for drivers without a browser behind them."""
+        records = []
+        for node in tree.xpath(locator_to_xpath(By.CSS_SELECTOR, self.root))[start:]:
+            record = {}
+            for name, field in self.fields.items():
+                targets = node.xpath(locator_to_xpath(By.CSS_SELECTOR, field.selector)) if field.selector else [node]
+                if field.many:
+                    record[name] = [value for value in (self._read(t, field) for t in targets) if value is not None]
+                else:
+                    record[name] = self._read(parsers.first(targets), field)
+            records.append(record)
+        return records
@@ -0,0 +1,228 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import canonical
+from .company import Company
+from .jobs import Job
+from .person import Person
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    result TEXT,
+    claimed_by TEXT,
+    claimed_at REAL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS frontier_status ON frontier (status, id);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL
+);
+"""
+
+
+class CrawlFrontier(object):
+    """A SQLite-backed queue of urls to crawl that survives crashes and restarts.
+
+    Items are claimed with a lease. An item whose worker died is handed out
+    again once the lease expires, or failed if it has no attempts left, and
+    finished items are never redone. Urls are canonicalised, and with a
+    `seen` index, entities scraped in other runs are not added and finished
+    ones are marked as seen.
+    """
+
+    def __init__(self, path, lease=600, max_attempts=3, seen=None):
+        self.path = os.path.expanduser(path)
+        self.seen = seen
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def add(self, urls, kind):
+        urls = [canonical.canonical_url(url) for url in urls]
+        if self.seen is not None:
+            urls = [url for url in urls if url not in self.seen]
+        now = time.time()
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO frontier (url, kind, updated_at) VALUES (?, ?, ?)",
+                    [(url, kind, now) for url in urls]
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            return self.conn.total_changes - before
+
+    def claim(self, worker_id=None, kinds=None):
+        """Claims the next item, returning (url, kind) or None when nothing is left to do."""
+        worker_id = worker_id or "%s:%d:%d" % (socket.gethostname(), os.getpid(), threading.get_ident())
+        now = time.time()
+        query = (
+            "SELECT id, url, kind FROM frontier WHERE "
+            "(status = ? OR (status IN (?, ?) AND attempts < ? AND (status = ? OR claimed_at < ?)))"
+        )
+        params = [PENDING, IN_PROGRESS, FAILED, self.max_attempts, FAILED, now - self.lease]
+        if kinds:
+            query += " AND kind IN (%s)" % ",".join("?" * len(kinds))
+            params.extend(kinds)
+        query += " ORDER BY id LIMIT 1"
+
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reap(now)
+                row = self.conn.execute(query, params).fetchone()
+                if row is not None:
+                    self.conn.execute(
+                        "UPDATE frontier SET status = ?, attempts = attempts + 1, claimed_by = ?, claimed_at = ?, updated_at = ? WHERE id = ?",
+                        (IN_PROGRESS, worker_id, now, now, row[0])
+                    )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return None if row is None else (row[1], row[2])
+
+    def _reap(self, now):
+        """Fails the items whose lease expired on their last attempt, which would otherwise stay in progress."""
+        self.conn.execute(
+            "UPDATE frontier SET status = ?, last_error = ?, updated_at = ? "
+            "WHERE status = ? AND attempts >= ? AND claimed_at < ?",
+            (FAILED, "Lease expired on the last attempt", now, IN_PROGRESS, self.max_attempts, now - self.lease)
+        )
+
+    def complete(self, url, result=None):
+        self._update(url, DONE, result=result, last_error=None)
+        if self.seen is not None:
+            self.seen.add(url)
+
+    def fail(self, url, error):
+        self._update(url, FAILED, last_error=str(error))
+
+    def _update(self, url, status, **fields):
+        fields.update(status=status, updated_at=time.time())
+        columns = ", ".join("%s = ?" % name for name in fields)
+        with self._lock:
+            self.conn.execute("UPDATE frontier SET %s WHERE url = ?" % columns, list(fields.values()) + [url])
+
+    def store_result(self, url, record):
+        """Stores a scraped record and returns a pointer to it for the frontier row."""
+        with self._lock:
+            cursor = self.conn.execute(
+                "INSERT INTO results (url, data, created_at) VALUES (?, ?, ?)",
+                (url, json.dumps(record, default=str), time.time())
+            )
+        return "results:%d" % cursor.lastrowid
+
+    def load_result(self, pointer):
+        with self._lock:
+            row = self.conn.execute("SELECT data FROM results WHERE id = ?", (int(pointer.split(":", 1)[1]),)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def status(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, attempts, last_error, result FROM frontier WHERE url = ?", (canonical.canonical_url(url),)
+            ).fetchone()
+        return None if row is None else dict(zip(("status", "attempts", "last_error", "result"), row))
+
+    def counts(self):
+        with self._lock:
+            return dict(self.conn.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall())
+
+
+def scrape_entity(kind, url, driver):
+    if kind == "person":
+        return Person(url, driver=driver, close_on_complete=False)
+    if kind == "company":
+        return Company(url, driver=driver, close_on_complete=False)
+    if kind == "job":
+        return Job(url, driver=driver, close_on_complete=False)
+    raise ValueError("Unknown kind: " + kind)
+
+
+def process_next(frontier, driver, worker_id=None, kinds=None, store=None):
+    """Claims, scrapes and records one item. Returns False when the frontier has nothing left.
+
+    An item that was not scraped logged in, or a profile with failed
+    sections, is failed so that it is retried up to max_attempts times.
+    """
+    item = frontier.claim(worker_id, kinds)
+    if item is None:
+        return False
+    url, kind = item
+    try:
+        entity = scrape_entity(kind, url, driver)
+        if getattr(entity, "failed_sections", None):
+            raise RuntimeError("Failed sections: " + ", ".join(entity.failed_sections))
+        if not entity.scraped:
+            raise RuntimeError("Not scraped, the driver is not signed in")
+        record = entity.to_dict()
+        pointer = store(url, kind, record) if store else frontier.store_result(url, record)
+    except Exception as e:
+        frontier.fail(url, repr(e))
+    else:
+        frontier.complete(url, pointer)
+    return True
+
+
+def crawl(frontier, driver, worker_id=None, kinds=None, max_items=None, store=None):
+    """Works through the frontier on one driver until it is empty or max_items were processed."""
+    processed = 0
+    while max_items is None or processed < max_items:
+        if not process_next(frontier, driver, worker_id, kinds, store):
+            break
+        processed += 1
+    return processed
+
+
+def crawl_concurrently(frontier, pool, concurrency=4, kinds=None, max_items=None, store=None):
+    """Runs `concurrency` workers against the frontier, each taking a driver from a DriverPool per item."""
+    counter = {"processed": 0}
+    lock = threading.Lock()
+
+    def worker(index):
+        worker_id = "%s:%d:worker-%d" % (socket.gethostname(), os.getpid(), index)
+        while True:
+            with lock:
+                if max_items is not None and counter["processed"] >= max_items:
+                    return
+                counter["processed"] += 1
+            with pool.driver() as driver:
+                if not process_next(frontier, driver, worker_id, kinds, store):
+                    with lock:
+                        counter["processed"] -= 1
+                    return
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+    return counter["processed"]
@@ -0,0 +1,198 @@
+"""Counts and times the WebDriver calls and waits of the scrapers, per section and per entity.
+
+    metrics = instrument(driver)
+    person = Person(url, driver=driver)
+    print(metrics.summary())
+"""
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+CALL_NAMES = {
+    Command.GET: "get",
+    Command.FIND_ELEMENT: "find_element",
+    Command.FIND_CHILD_ELEMENT: "find_element",
+    Command.FIND_ELEMENTS: "find_elements",
+    Command.FIND_CHILD_ELEMENTS: "find_elements",
+    Command.W3C_EXECUTE_SCRIPT: "execute_script",
+    Command.W3C_EXECUTE_SCRIPT_ASYNC: "execute_async_script",
+}
+# Methods timed directly on drivers that don't route their calls through execute(), such as ReplayDriver.
+TIMED_METHODS = ["get", "find_element", "find_elements", "execute_script", "execute_async_script"]
+SUMMARY_CALLS = ["get", "find_element", "find_elements", "execute_script", "wait"]
+
+
+class Stat(object):
+    __slots__ = ("count", "seconds", "max_seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def add(self, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class Instrumentation(object):
+    """Collects call and wait timings, attributed to the entity and section being scraped.
+
+    Totals are kept per entity type and section. Per url, only the last
+    `recent` sections run are kept, as (entity, url, section, seconds) in
+    `entities`, so a long crawl doesn't grow the metrics.
+    """
+
+    def __init__(self, recent=1000):
+        self.calls = defaultdict(Stat)
+        self.sections = defaultdict(Stat)
+        self.entities = deque(maxlen=recent)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _context(self):
+        return getattr(self._local, "context", ("", ""))
+
+    def record(self, call, seconds):
+        entity, section = self._context()
+        with self._lock:
+            self.calls[(entity, section, call)].add(seconds)
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending[call].add(seconds)
+
+    @contextmanager
+    def section(self, entity, section, url=None):
+        """Attributes the calls made by this thread inside the block to entity/section."""
+        previous = self._context()
+        previous_pending = getattr(self._local, "pending", None)
+        self._local.context = (entity, section)
+        self._local.pending = defaultdict(Stat)
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+            calls = self._local.pending
+            self._local.context = previous
+            self._local.pending = previous_pending
+            with self._lock:
+                self.sections[(entity, section)].add(seconds)
+                if url:
+                    self.entities.append((entity, url, section, seconds))
+            logger.info(json.dumps({
+                "event": "section",
+                "entity": entity,
+                "section": section,
+                "url": url,
+                "seconds": round(seconds, 4),
+                "calls": {call: {"count": stat.count, "seconds": round(stat.seconds, 4)} for call, stat in calls.items()},
+                "error": repr(error) if error is not None else None,
+            }))
+
+    def summary(self):
+        """A table of sections by total time, with the calls made in them."""
+        with self._lock:
+            calls = defaultdict(Stat)
+            for (entity, section, call), stat in self.calls.items():
+                target = calls[(entity, section, call.split(":")[0])]
+                target.count += stat.count
+                target.seconds += stat.seconds
+            rows = sorted(self.sections.items(), key=lambda item: -item[1].seconds)
+        lines = ["{:<12} {:<16} {:>6} {:>9} {:>8}".format("entity", "section", "runs", "total s", "mean s")
+                 + "".join(" {:>18}".format(call) for call in SUMMARY_CALLS)]
+        for (entity, section), stat in rows:
+            line = "{:<12} {:<16} {:>6} {:>9.2f} {:>8.2f}".format(entity, section, stat.count, stat.seconds, stat.seconds / stat.count)
+            for call in SUMMARY_CALLS:
+                call_stat = calls.get((entity, section, call))
+                line += " {:>18}".format("%d / %.2fs" % (call_stat.count, call_stat.seconds) if call_stat else "-")
+            lines.append(line)
+        return "\n".join(lines)
+
+    def prometheus(self):
+        """The metrics in the Prometheus text exposition format."""
+        lines = [
+            "# TYPE linkedin_scraper_driver_calls_total counter",
+            "# TYPE linkedin_scraper_driver_call_seconds_total counter",
+            "# TYPE linkedin_scraper_sections_total counter",
+            "# TYPE linkedin_scraper_section_seconds_total counter",
+        ]
+        with self._lock:
+            for (entity, section, call), stat in sorted(self.calls.items()):
+                labels = 'entity="%s",section="%s",call="%s"' % (entity, section, call)
+                lines.append("linkedin_scraper_driver_calls_total{%s} %d" % (labels, stat.count))
+                lines.append("linkedin_scraper_driver_call_seconds_total{%s} %f" % (labels, stat.seconds))
+            for (entity, section), stat in sorted(self.sections.items()):
+                labels = 'entity="%s",section="%s"' % (entity, section)
+                lines.append("linkedin_scraper_sections_total{%s} %d" % (labels, stat.count))
+                lines.append("linkedin_scraper_section_seconds_total{%s} %f" % (labels, stat.seconds))
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port=9464, host=""):
+        """Serves prometheus() over HTTP from a daemon thread, returning the server."""
+        instrumentation = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = instrumentation.prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _timed(instrumentation, call, func):
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            instrumentation.record(call, time.perf_counter() - started)
+    return timed
+
+
+def instrument(driver, instrumentation=None):
+    """Times every call made through driver, including the calls of the elements it returns.
+
+    A Selenium driver is wrapped at execute(), which every command goes
+    through. Other drivers have their main methods wrapped.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    if isinstance(driver, WebDriver):
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                instrumentation.record(CALL_NAMES.get(driver_command, driver_command), time.perf_counter() - started)
+        driver.execute = timed_execute
+    else:
+        for name in TIMED_METHODS:
+            if hasattr(driver, name):
+                setattr(driver, name, _timed(instrumentation, name, getattr(driver, name)))
+    driver.instrumentation = instrumentation
+    return instrumentation
@@ -1,16 +1,41 @@
 import os
-from typing import List
-from time import sleep
+import re
+from typing import Iterator, List
 import urllib.parse
 
-from .objects import Scraper
+from .objects import Scraper, section
 from . import constants as c
+from . import selectors
 from .jobs import Job
+from .extract import Field, Section
+from .pool import hydrate_jobs
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
+
+JOB_CARD_FIELDS = dict(
+    job_title=Field(".job-card-list__title"),
+    linkedin_url=Field(".job-card-list__title", "href"),
+    company=Field(".artdeco-entity-lockup__subtitle"),
+    location=Field(".job-card-container__metadata-wrapper"),
+)
+JOB_CARDS = Section(".job-card-list", **JOB_CARD_FIELDS)
+JOB_BOARD_ITEMS = Section(".jobs-job-board-list__item", **JOB_CARD_FIELDS)
+
+PAGE_SIZE = 25
+# Values of the search filters, as LinkedIn puts them in the url.
+DATE_POSTED = {"day": "r86400", "week": "r604800", "month": "r2592000"}
+WORKPLACE_TYPES = {"onsite": "1", "remote": "2", "hybrid": "3"}
+JOB_ID = re.compile(r"(?:currentJobId=|/jobs/view/(?:[^/?]*-)?)(\d+)")
+
+
+def job_id(url):
+    """The numeric id of a job from its view or search url, or None."""
+    match = JOB_ID.search(url or "")
+    return match.group(1) if match else None
 
 
 class JobSearch(Scraper):
@@ -36,56 +61,125 @@ class JobSearch(Scraper):
         job_div = self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
         job_title = job_div.text.strip()
         linkedin_url = job_div.get_attribute("href")
-        company = base_element.find_element_by_class_name("artdeco-entity-lockup__subtitle").text
-        location = base_element.find_element_by_class_name("job-card-container__metadata-wrapper").text
+        company = base_element.find_element(By.CLASS_NAME, "artdeco-entity-lockup__subtitle").text
+        location = base_element.find_element(By.CLASS_NAME, "job-card-container__metadata-wrapper").text
         job = Job(linkedin_url=linkedin_url, job_title=job_title, company=company, location=location, scrape=False, driver=self.driver)
         return job
 
+    def scrape_job_cards(self, section, base_element) -> List[Job]:
+        """Reads every job card under base_element with a single script call."""
+        return [
+            Job(scrape=False, driver=self.driver, **record)
+            for record in section.extract(self.driver, base=base_element)
+            if record["linkedin_url"]
+        ]
+
 
+    @section("recommended_jobs")
     def scrape_logged_in(self, close_on_complete=True, scrape_recommended_jobs=True):
         driver = self.driver
-        driver.get(self.base_url)
+        self.navigate(self.base_url)
         if scrape_recommended_jobs:
             self.focus()
-            sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-            job_area = self.wait_for_element_to_load(name="scaffold-finite-scroll__content")
+            self.wait_for_dom_quiescence()
+            job_area = self.wait_for_element_to_load(*selectors.locator("job_search.recommended"))
             areas = self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
             for i, area in enumerate(areas):
                 area_name = self.AREAS[i]
                 if not area_name:
                     continue
-                area_results = []
-                for job_posting in area.find_elements_by_class_name("jobs-job-board-list__item"):
-                    job = self.scrape_job_card(job_posting)
-                    area_results.append(job)
-                setattr(self, area_name, area_results)
+                setattr(self, area_name, self.scrape_job_cards(JOB_BOARD_ITEMS, area))
         return
 
 
-    def search(self, search_term: str) -> List[Job]:
-        url = os.path.join(self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
-        self.driver.get(url)
+    def search_url(self, search_term: str, filters=None, start=0) -> str:
+        """Builds a search url.
+
+        filters may hold a `location`, `date_posted` ("day", "week" or "month")
+        and `remote` ("onsite", "remote", "hybrid" or a list of them).
+        """
+        filters = dict(filters or {})
+        params = [("keywords", search_term)]
+        if filters.get("location"):
+            params.append(("location", filters.pop("location")))
+        if filters.get("date_posted"):
+            date_posted = filters.pop("date_posted")
+            if date_posted not in DATE_POSTED:
+                raise ValueError("Unknown date_posted: %s, use one of %s" % (date_posted, ", ".join(DATE_POSTED)))
+            params.append(("f_TPR", DATE_POSTED[date_posted]))
+        if filters.get("remote"):
+            remote = filters.pop("remote")
+            remote = [remote] if isinstance(remote, str) else remote
+            unknown = set(remote) - set(WORKPLACE_TYPES)
+            if unknown:
+                raise ValueError("Unknown remote filter: %s, use %s" % (", ".join(sorted(unknown)), ", ".join(WORKPLACE_TYPES)))
+            params.append(("f_WT", ",".join(WORKPLACE_TYPES[value] for value in remote)))
+        unknown = [name for name, value in filters.items() if value]
+        if unknown:
+            raise ValueError("Unknown search filters: " + ", ".join(sorted(unknown)))
+        if start:
+            params.append(("start", str(start)))
+        params.append(("refresh", "true"))
+        return os.path.join(self.base_url, "search") + "?" + urllib.parse.urlencode(params, quote_via=urllib.parse.quote)
+
+    def search(self, search_term: str, filters=None) -> List[Job]:
+        return self.search_page(self.search_url(search_term, filters))
+
+    def iter_search(self, search_term: str, filters=None, max_pages=None, seen=None) -> Iterator[Job]:
+        """Yields the Job stubs of every results page in turn, following the start= pagination.
+
+        Jobs already yielded from an earlier page, or in the `seen` index, are
+        skipped. It stops after max_pages pages, or once a page has no results
+        or nothing new.
+        """
+        yielded = set()
+        page = 0
+        while max_pages is None or page < max_pages:
+            try:
+                jobs = self.search_page(self.search_url(search_term, filters, start=page * PAGE_SIZE))
+            except TimeoutException:
+                return
+            new = 0
+            for job in jobs:
+                key = job_id(job.linkedin_url) or job.linkedin_url
+                if key in yielded:
+                    continue
+                yielded.add(key)
+                new += 1
+                if seen is None or job.linkedin_url not in seen:
+                    yield job
+            if not new:
+                return
+            page += 1
+
+    def hydrate(self, jobs, concurrency=4, pool=None, seen=None, **login) -> Iterator[Job]:
+        """Scrapes the details of jobs from a search on `concurrency` other browsers, yielding them as they finish.
+
+        This driver is left on the search. Without a pool or login arguments,
+        the new browsers reuse this driver's session cookie.
+        """
+        if pool is None and not login:
+            cookie = self.driver.get_cookie("li_at")
+            if cookie:
+                login["cookie"] = cookie["value"]
+        return hydrate_jobs(jobs, concurrency=concurrency, pool=pool, seen=seen, **login)
+
+    @section("search_page")
+    def search_page(self, url: str) -> List[Job]:
+        """Loads one page of search results and returns its job cards."""
+        self.navigate(url)
         self.scroll_to_bottom()
         self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
-        job_listing_class_name = "jobs-search-results-list"
-        job_listing = self.wait_for_element_to_load(name=job_listing_class_name)
+        job_listing = self.wait_for_element_to_load(*selectors.locator("job_search.results_list"))
+        self.wait_for_dom_quiescence()
 
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.3)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.6)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+        card_by, card_name = selectors.locator("job_search.card")
+        for page_percent in (0.3, 0.6, 1):
+            self.driver.execute_script(
+                "arguments[0].scrollTo(0, arguments[0].scrollHeight * arguments[1]);", job_listing, page_percent
+            )
+            self.wait_for_list_stable(by=card_by, name=card_name, base=job_listing)
 
-        job_results = []
-        for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
-            job = self.scrape_job_card(job_card)
-            job_results.append(job)
-        return job_results
+        self.wait_for_all_elements_to_load(by=card_by, name=card_name, base=job_listing)
+        return self.scrape_job_cards(JOB_CARDS, job_listing)
@@ -1,7 +1,8 @@
 from selenium.common.exceptions import TimeoutException
 
-from .objects import Scraper
+from .objects import Scraper, section
 from . import constants as c
+from . import selectors
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -23,6 +24,7 @@ class Job(Scraper):
         driver=None,
         close_on_complete=True,
         scrape=True,
+        seen=None,
     ):
         super().__init__()
         self.linkedin_url = linkedin_url
@@ -35,16 +37,19 @@ class Job(Scraper):
         self.applicant_count = applicant_count
         self.job_description = job_description
         self.benefits = benefits
+        self.seen = seen
 
-        if scrape:
-            self.scrape(close_on_complete)
+        if scrape and not self.already_seen(linkedin_url):
+            self.scraped = self.scrape(close_on_complete)
+            if self.scraped:
+                self.mark_seen(linkedin_url)
 
     def __repr__(self):
         return f"<Job {self.job_title} {self.company}>"
 
     def scrape(self, close_on_complete=True):
         if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete)
+            return self.scrape_logged_in(close_on_complete=close_on_complete)
         else:
             raise NotImplemented("This part is not implemented yet")
 
@@ -61,33 +66,44 @@ class Job(Scraper):
             "benefits": self.benefits
         }
 
+    @classmethod
+    def schema(cls):
+        return dict.fromkeys(
+            ["linkedin_url", "job_title", "company", "company_linkedin_url", "location", "posted_date",
+             "applicant_count", "job_description", "benefits"],
+            str
+        )
 
+
+    @section("details")
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         
-        driver.get(self.linkedin_url)
+        self.navigate(self.linkedin_url)
         self.focus()
-        self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
-        self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
-        self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
-        primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
+        self.job_title = self.wait_for_element_to_load(*selectors.locator("job.title")).text.strip()
+        company = self.wait_for_element_to_load(*selectors.locator("job.company"))
+        self.company = company.text.strip()
+        self.company_linkedin_url = company.find_element(By.TAG_NAME,"a").get_attribute("href")
+        primary_descriptions = self.wait_for_element_to_load(*selectors.locator("job.primary_description")).find_elements(By.TAG_NAME, "span")
         texts = [span.text for span in primary_descriptions if span.text.strip() != ""]
         self.location = texts[0]
         self.posted_date = texts[3]
         
         try:
-            self.applicant_count = self.wait_for_element_to_load(name="jobs-unified-top-card__applicant-count").text.strip()
+            self.applicant_count = self.wait_for_element_to_load(*selectors.locator("job.applicant_count")).text.strip()
         except TimeoutException:
             self.applicant_count = 0
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
+        job_description_elem = self.wait_for_element_to_load(*selectors.locator("job.description"))
         self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
+        job_description_elem = self.wait_for_element_to_load(*selectors.locator("job.description"))
         job_description_elem.find_element(By.TAG_NAME, "button").click()
         self.job_description = job_description_elem.text.strip()
         try:
-            self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
+            self.benefits = self.wait_for_element_to_load(*selectors.locator("job.salary")).text.strip()
         except TimeoutException:
             self.benefits = None
 
         if close_on_complete:
             driver.close()
+        return True
@@ -0,0 +1,61 @@
+"""Translation of Selenium locators to lxml XPath, so the same locators can be run against parsed html."""
+import re
+
+from selenium.webdriver.common.by import By
+
+CSS_COMPOUND = re.compile(r"^(?P<tag>[\w*-]+)?(?P<rest>(?:[.#][\w-]+|\[[^\]]+\])*)$")
+CSS_PART = re.compile(r"\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|\[(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~|]?=)\s*['\"]?(?P<value>[^'\"\]]*)['\"]?)?\]")
+
+
+def _css_to_xpath(selector):
+    try:
+        from cssselect import GenericTranslator
+        return GenericTranslator().css_to_xpath(selector, prefix="descendant::")
+    except ImportError:
+        pass
+
+    steps = []
+    for compound in selector.split():
+        match = CSS_COMPOUND.match(compound)
+        if not match:
+            raise ValueError("Unsupported CSS selector without cssselect installed: " + selector)
+        conditions = []
+        for part in CSS_PART.finditer(match.group("rest") or ""):
+            if part.group("cls"):
+                conditions.append("contains(concat(' ', normalize-space(@class), ' '), ' %s ')" % part.group("cls"))
+            elif part.group("id"):
+                conditions.append("@id='%s'" % part.group("id"))
+            else:
+                attr, op, value = part.group("attr"), part.group("op"), part.group("value")
+                if not op:
+                    conditions.append("@" + attr)
+                elif op == "=":
+                    conditions.append("@%s='%s'" % (attr, value))
+                elif op == "*=":
+                    conditions.append("contains(@%s, '%s')" % (attr, value))
+                elif op == "^=":
+                    conditions.append("starts-with(@%s, '%s')" % (attr, value))
+                else:
+                    raise ValueError("Unsupported CSS selector without cssselect installed: " + selector)
+        steps.append((match.group("tag") or "*") + "".join("[%s]" % cond for cond in conditions))
+    return "descendant::" + "//".join(steps)
+
+
+def locator_to_xpath(by, value):
+    if by == By.XPATH:
+        return value
+    if by == By.CLASS_NAME:
+        return ".//*[contains(concat(' ', normalize-space(@class), ' '), ' %s ')]" % value
+    if by == By.TAG_NAME:
+        return ".//" + value
+    if by == By.ID:
+        return ".//*[@id='%s']" % value
+    if by == By.NAME:
+        return ".//*[@name='%s']" % value
+    if by == By.LINK_TEXT:
+        return ".//a[normalize-space(.)='%s']" % value
+    if by == By.PARTIAL_LINK_TEXT:
+        return ".//a[contains(., '%s')]" % value
+    if by == By.CSS_SELECTOR:
+        return _css_to_xpath(value)
+    raise ValueError("Unsupported locator: " + str(by))
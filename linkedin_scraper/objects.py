@@ -1,25 +1,102 @@
-from dataclasses import dataclass
-from time import sleep
+import functools
+from collections import namedtuple
+from contextlib import nullcontext
+from dataclasses import dataclass, asdict, fields
+from time import sleep, monotonic
 
+from lxml import html
 from selenium.webdriver import Chrome
 
 from . import constants as c
+from . import ratelimit
+from .tabs import TabPipeline
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException
+
+WaitTiming = namedtuple("WaitTiming", ["kind", "target", "seconds", "satisfied"])
+
+COUNT_SCRIPTS = {
+    By.TAG_NAME: "return (arguments[0] || document).getElementsByTagName(arguments[1]).length;",
+    By.CLASS_NAME: "return (arguments[0] || document).getElementsByClassName(arguments[1]).length;",
+    By.CSS_SELECTOR: "return (arguments[0] || document).querySelectorAll(arguments[1]).length;",
+}
+
+# Resolves once no DOM mutation has been observed for `quiet` ms, or `timeout` ms have passed.
+DOM_QUIESCENCE_SCRIPT = """
+var quiet = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now(), last = start;
+var observer = new MutationObserver(function () { last = performance.now(); });
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    var now = performance.now();
+    if (now - last >= quiet || now - start >= timeout) {
+        observer.disconnect();
+        done(now - last >= quiet);
+    } else {
+        setTimeout(check, Math.min(50, quiet));
+    }
+})();
+"""
+
+# Resolves once the document is complete and no resource has finished loading for `idle` ms.
+NETWORK_IDLE_SCRIPT = """
+var idle = arguments[0], timeout = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now();
+var count = -1, last = start;
+(function check() {
+    var now = performance.now();
+    var entries = performance.getEntriesByType("resource").length;
+    if (entries !== count) {
+        count = entries;
+        last = now;
+    }
+    var idleFor = document.readyState === "complete" ? now - last : 0;
+    if (idleFor >= idle || now - start >= timeout) {
+        done(idleFor >= idle);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+
+def to_record(value):
+    """Converts a scraped value, and anything nested in it, into plain dicts and lists."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [to_record(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_record(item) for key, item in value.items()}
+    return value
+
+
+class Record(object):
+    """Serialisation shared by the scraped dataclasses."""
+    __slots__ = ()
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def schema(cls):
+        """Maps each field to its type, in the order to_dict emits them."""
+        return {field.name: field.type for field in fields(cls)}
 
 
 @dataclass
-class Contact:
+class Contact(Record):
     name: str = None
     occupation: str = None
     url: str = None
 
 
 @dataclass
-class Institution:
+class Institution(Record):
     institution_name: str = None
     linkedin_url: str = None
     website: str = None
@@ -50,29 +127,29 @@ class Education(Institution):
 
 @dataclass
 class Interest(Institution):
-    title = None
+    title: str = None
 
 
 @dataclass
 class Accomplishment(Institution):
-    category = None
-    title = None
+    category: str = None
+    title: str = None
 
 
 @dataclass
-class Skill:
+class Skill(Record):
     name: str = None
     endorsements: int = None
 
 
 @dataclass
-class Language:
+class Language(Record):
     name: str = None
     proficiency: str = None
 
 
 @dataclass
-class Certification:
+class Certification(Record):
     name: str = None
     organization: str = None
     issue_date: str = None
@@ -81,7 +158,7 @@ class Certification:
 
 
 @dataclass
-class HonorAward:
+class HonorAward(Record):
     title: str = None
     issuer: str = None
     issue_date: str = None
@@ -89,16 +166,105 @@ class HonorAward:
     associated_with: str = None
 
 
+# Outcomes of scraping a section.
+SECTION_OK = "ok"
+SECTION_EMPTY = "empty"
+SECTION_TIMEOUT = "timeout"
+SECTION_PARSE_ERROR = "parse_error"
+# The browser session was lost while scraping the section. Not retried, the error is raised instead.
+SECTION_SESSION_ERROR = "session_error"
+
+# Errors after which the browser session can't be used any more.
+SESSION_ERRORS = (InvalidSessionIdException, NoSuchWindowException)
+
+
+@dataclass
+class SectionStatus(Record):
+    section: str = None
+    status: str = None
+    items: int = 0
+    attempts: int = 0
+    seconds: float = 0.0
+    error: str = None
+
+    @property
+    def failed(self):
+        return self.status in (SECTION_TIMEOUT, SECTION_PARSE_ERROR, SECTION_SESSION_ERROR)
+
+
+def section(name):
+    """Attributes the driver calls of a Scraper method to section `name`, when its driver is instrumented."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.section_context(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
 @dataclass
 class Scraper:
     driver: Chrome = None
     WAIT_FOR_ELEMENT_TIMEOUT = 5
     TOP_CARD = "pv-top-card"
+    rate_limiter = None
+    tab_pipeline = None
+    seen = None
+    skipped = False
+    scraped = False
 
     @staticmethod
     def wait(duration):
         sleep(int(duration))
 
+    def navigate(self, url):
+        if self.tab_pipeline is not None:
+            self.tab_pipeline.navigate(url)
+        else:
+            ratelimit.navigate(self.driver, url, self.rate_limiter)
+
+    def section_context(self, name):
+        instrumentation = getattr(self.driver, "instrumentation", None)
+        if instrumentation is None:
+            return nullcontext()
+        return instrumentation.section(type(self).__name__.lower(), name, getattr(self, "linkedin_url", None))
+
+    def already_seen(self, url):
+        """Whether url's entity is in the seen index, in which case the scraper skips it."""
+        self.skipped = self.seen is not None and url is not None and url in self.seen
+        return self.skipped
+
+    def session_alive(self):
+        """Whether the driver's browser session still answers."""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def mark_seen(self, url):
+        """Adds url's entity to the seen index. Only called once a logged-in scrape of it has succeeded."""
+        if self.seen is not None and url is not None:
+            self.seen.add(url)
+
+    def pipeline_tabs(self, urls, depth=2):
+        """Starts loading urls in background tabs, in the order navigate will be called with them."""
+        if self.tab_pipeline is None:
+            self.tab_pipeline = TabPipeline(self.driver, depth, self.rate_limiter)
+        self.tab_pipeline.prefetch(urls)
+        return self.tab_pipeline
+
+    def close_tabs(self):
+        if self.tab_pipeline is not None:
+            self.tab_pipeline.close()
+            self.tab_pipeline = None
+
+    def page_tree(self):
+        tree = html.fromstring(self.driver.page_source)
+        tree.make_links_absolute(self.driver.current_url)
+        return tree
+
     def focus(self):
         self.driver.execute_script('alert("Focus window")')
         self.driver.switch_to.alert.accept()
@@ -109,26 +275,125 @@ class Scraper:
 
     def wait_for_element_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    by,
-                    name
+        started = monotonic()
+        satisfied = False
+        try:
+            element = WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_element_located(
+                    (
+                        by,
+                        name
+                    )
                 )
             )
-        )
+            satisfied = True
+            return element
+        finally:
+            self._record_wait("element", name, started, satisfied)
 
     def wait_for_all_elements_to_load(self, by=By.CLASS_NAME, name="pv-top-card", base=None):
         base = base or self.driver
-        return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_all_elements_located(
-                (
-                    by,
-                    name
+        started = monotonic()
+        satisfied = False
+        try:
+            elements = WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_all_elements_located(
+                    (
+                        by,
+                        name
+                    )
                 )
             )
-        )
-
+            satisfied = True
+            return elements
+        finally:
+            self._record_wait("elements", name, started, satisfied)
+
+
+    @property
+    def wait_timings(self):
+        if "_wait_timings" not in self.__dict__:
+            self._wait_timings = []
+        return self._wait_timings
+
+    def _record_wait(self, kind, target, started, satisfied):
+        timing = WaitTiming(kind, target, monotonic() - started, satisfied)
+        self.wait_timings.append(timing)
+        instrumentation = getattr(self.driver, "instrumentation", None)
+        if instrumentation is not None:
+            instrumentation.record("wait:" + kind, timing.seconds)
+        return timing
+
+    def wait_for_dom_quiescence(self, quiet=0.3, timeout=None):
+        """Waits until the DOM has stopped changing for `quiet` seconds."""
+        timeout = timeout or self.WAIT_FOR_ELEMENT_TIMEOUT
+        started = monotonic()
+        try:
+            satisfied = bool(self.driver.execute_async_script(DOM_QUIESCENCE_SCRIPT, quiet * 1000, timeout * 1000))
+        except TimeoutException:
+            satisfied = False
+        return self._record_wait("dom_quiescence", None, started, satisfied)
+
+    def wait_for_network_idle(self, idle=0.5, timeout=None):
+        """Waits until the page has loaded and no resource has completed for `idle` seconds."""
+        timeout = timeout or self.WAIT_FOR_ELEMENT_TIMEOUT
+        started = monotonic()
+        try:
+            satisfied = bool(self.driver.execute_async_script(NETWORK_IDLE_SCRIPT, idle * 1000, timeout * 1000))
+        except TimeoutException:
+            satisfied = False
+        return self._record_wait("network_idle", None, started, satisfied)
+
+    def count_elements(self, by=By.TAG_NAME, name="li", base=None):
+        """Counts matching elements in the browser, without transferring a reference to each of them."""
+        script = COUNT_SCRIPTS.get(by)
+        if script is not None:
+            count = self.driver.execute_script(script, base, name)
+            if count is not None:
+                return count
+        return len((base or self.driver).find_elements(by, name))
+
+    def wait_for_list_stable(self, by=By.TAG_NAME, name="li", base=None, stable_for=0.5, timeout=None, poll=0.1):
+        """Waits until the number of matching elements stops changing, and returns that number.
+
+        A list that stays empty is only taken as stable once the DOM has
+        stopped changing too, since the page may not have rendered it yet.
+        """
+        timeout = timeout or self.WAIT_FOR_ELEMENT_TIMEOUT
+        started = monotonic()
+        count = self.count_elements(by, name, base)
+        changed_at = started
+        satisfied = False
+        while monotonic() - started < timeout:
+            sleep(poll)
+            current = self.count_elements(by, name, base)
+            if current != count:
+                count = current
+                changed_at = monotonic()
+            elif monotonic() - changed_at >= stable_for:
+                if count:
+                    satisfied = True
+                    break
+                remaining = timeout - (monotonic() - started)
+                if remaining > 0 and self.wait_for_dom_quiescence(quiet=stable_for, timeout=remaining).satisfied \
+                        and self.count_elements(by, name, base) == 0:
+                    satisfied = True
+                    break
+        self._record_wait("list_stable", name, started, satisfied)
+        return count
+
+    def wait_for_selector(self, name, by=By.CSS_SELECTOR, base=None, timeout=None):
+        """Waits for an element matching the selector, returning it or None on timeout."""
+        base = base or self.driver
+        started = monotonic()
+        try:
+            elem = WebDriverWait(base, timeout or self.WAIT_FOR_ELEMENT_TIMEOUT, poll_frequency=0.1).until(
+                EC.presence_of_element_located((by, name))
+            )
+        except TimeoutException:
+            elem = None
+        self._record_wait("selector", name, started, elem is not None)
+        return elem
 
     def is_signed_in(self):
         try:
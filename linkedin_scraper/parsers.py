@@ -0,0 +1,551 @@
+import re
+
+from .objects import Experience, Education, Skill, Language, Certification, HonorAward
+from . import selectors
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "br", "dd", "div", "dl", "dt", "footer",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav",
+    "ol", "p", "section", "table", "tr", "ul",
+}
+HIDDEN_TAGS = {"script", "style", "noscript", "template"}
+HIDDEN_CLASSES = {"visually-hidden"}
+
+EMPTY_SECTION_PLACEHOLDERS = [
+    "Nothing to see for now",
+    "will appear here",
+    "No skills have been",
+    "hasn't added",
+    "not added any",
+]
+
+
+def is_empty_section_placeholder(text):
+    text_lower = text.lower()
+    return any(pattern.lower() in text_lower for pattern in EMPTY_SECTION_PLACEHOLDERS)
+
+
+def _is_hidden(elem):
+    if elem.tag in HIDDEN_TAGS:
+        return True
+    return bool(HIDDEN_CLASSES.intersection((elem.get("class") or "").split()))
+
+
+def _collect_text(elem, parts):
+    if not isinstance(elem.tag, str) or _is_hidden(elem):
+        return
+    block = elem.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if elem.text:
+        parts.append(elem.text)
+    for child in elem:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+
+
+def text(elem):
+    """Approximates WebElement.text: visible text, one line per block element."""
+    if elem is None:
+        return ""
+    parts = []
+    _collect_text(elem, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def children(elem):
+    return elem.xpath("*")
+
+
+def by_class(elem, class_name):
+    return elem.xpath(
+        ".//*[contains(concat(' ', normalize-space(@class), ' '), ' %s ')]" % class_name
+    )
+
+
+def first(elems):
+    return elems[0] if len(elems) else None
+
+
+def first_by_class(elem, class_name):
+    return first(by_class(elem, class_name))
+
+
+def first_by_tag(elem, tag_name):
+    return first(elem.xpath(".//%s" % tag_name))
+
+
+def aria_hidden_texts(elem):
+    return [text(span).strip() for span in elem.xpath(".//span[@aria-hidden='true']")]
+
+
+def unique_texts(texts, skip_prefix=None):
+    seen_texts = set()
+    result = []
+    for txt in texts:
+        if not txt or txt in seen_texts:
+            continue
+        if skip_prefix and txt.startswith(skip_prefix):
+            continue
+        seen_texts.add(txt)
+        result.append(txt)
+    return result
+
+
+def _details_list(tree):
+    main = first_by_tag(tree, "main")
+    if main is None:
+        return None
+    return first_by_class(main, "pvs-list__container")
+
+
+def _split_work_times(work_times):
+    if work_times:
+        parts = work_times.split("·")
+        times = parts[0].strip() if parts else ""
+        duration = parts[1].strip() if len(parts) > 1 else None
+    else:
+        times = ""
+        duration = None
+    from_date = " ".join(times.split(" ")[:2]) if times else ""
+    to_date = " ".join(times.split(" ")[3:]) if times and len(times.split(" ")) > 3 else ""
+    return from_date, to_date, duration
+
+
+def _span_text(elem):
+    return text(first_by_tag(elem, "span"))
+
+
+def parse_experiences(tree):
+    main_list = _details_list(tree)
+    if main_list is None:
+        return None
+
+    experiences = []
+    for position in by_class(main_list, "pvs-list__paged-list-item"):
+        position = first(position.xpath(".//div[@data-view-name='profile-component-entity']"))
+        if position is None:
+            continue
+
+        elements = children(position)
+        if len(elements) < 2:
+            continue
+        company_logo_elem, position_details = elements[0], elements[1]
+
+        logo_children = children(company_logo_elem)
+        company_linkedin_url = logo_children[0].get("href") if logo_children else None
+        if not company_linkedin_url:
+            continue
+
+        position_details_list = children(position_details)
+        position_summary_details = position_details_list[0] if len(position_details_list) > 0 else None
+        position_summary_text = position_details_list[1] if len(position_details_list) > 1 else None
+        if position_summary_details is None:
+            continue
+
+        summary_children = children(position_summary_details)
+        outer_positions = children(summary_children[0]) if summary_children else []
+
+        if len(outer_positions) == 4:
+            position_title = _span_text(outer_positions[0])
+            company = _span_text(outer_positions[1])
+            work_times = _span_text(outer_positions[2])
+            location = _span_text(outer_positions[3])
+        elif len(outer_positions) == 3:
+            if "·" in text(outer_positions[2]):
+                position_title = _span_text(outer_positions[0])
+                company = _span_text(outer_positions[1])
+                work_times = _span_text(outer_positions[2])
+                location = ""
+            else:
+                position_title = ""
+                company = _span_text(outer_positions[0])
+                work_times = _span_text(outer_positions[1])
+                location = _span_text(outer_positions[2])
+        else:
+            position_title = ""
+            company = _span_text(outer_positions[0]) if outer_positions else ""
+            work_times = _span_text(outer_positions[1]) if len(outer_positions) > 1 else ""
+            location = ""
+
+        from_date, to_date, duration = _split_work_times(work_times)
+
+        inner_positions = []
+        if position_summary_text is not None:
+            container = first(position_summary_text.xpath(
+                "*[contains(concat(' ', normalize-space(@class), ' '), ' pvs-list__container ')]"
+            ))
+            if container is not None:
+                inner = first(container.xpath("*/*/*"))
+                if inner is not None:
+                    inner_positions = by_class(inner, "pvs-list__paged-list-item")
+
+        if len(inner_positions) > 1:
+            for description in inner_positions:
+                anchor = first_by_tag(description, "a")
+                if anchor is None:
+                    continue
+                res = children(anchor)
+                position_title_elem = res[0] if len(res) > 0 else None
+                work_times_elem = res[1] if len(res) > 1 else None
+                location_elem = res[2] if len(res) > 2 else None
+
+                location = text(first(children(location_elem))) if location_elem is not None else None
+                if position_title_elem is not None:
+                    title_elem = first(children(position_title_elem))
+                    position_title = text(first(title_elem.xpath(".//*"))) if title_elem is not None else ""
+                else:
+                    position_title = ""
+                work_times = text(first(children(work_times_elem))) if work_times_elem is not None else ""
+                from_date, to_date, duration = _split_work_times(work_times)
+
+                experiences.append(Experience(
+                    position_title=position_title,
+                    from_date=from_date,
+                    to_date=to_date,
+                    duration=duration,
+                    location=location,
+                    description=text(description),
+                    institution_name=company,
+                    linkedin_url=company_linkedin_url
+                ))
+        else:
+            experiences.append(Experience(
+                position_title=position_title,
+                from_date=from_date,
+                to_date=to_date,
+                duration=duration,
+                location=location,
+                description=text(position_summary_text),
+                institution_name=company,
+                linkedin_url=company_linkedin_url
+            ))
+    return experiences
+
+
+def parse_educations(tree):
+    main_list = _details_list(tree)
+    if main_list is None:
+        return None
+
+    educations = []
+    for position in by_class(main_list, "pvs-list__paged-list-item"):
+        position = first(position.xpath(".//div[@data-view-name='profile-component-entity']"))
+        if position is None:
+            continue
+
+        elements = children(position)
+        if len(elements) < 2:
+            continue
+        institution_logo_elem, position_details = elements[0], elements[1]
+
+        logo_children = children(institution_logo_elem)
+        institution_linkedin_url = logo_children[0].get("href") if logo_children else None
+
+        position_details_list = children(position_details)
+        position_summary_details = position_details_list[0] if len(position_details_list) > 0 else None
+        position_summary_text = position_details_list[1] if len(position_details_list) > 1 else None
+        if position_summary_details is None:
+            continue
+
+        summary_children = children(position_summary_details)
+        outer_positions = children(summary_children[0]) if summary_children else []
+
+        institution_name = _span_text(outer_positions[0]) if outer_positions else ""
+        degree = _span_text(outer_positions[1]) if len(outer_positions) > 1 else None
+
+        from_date = None
+        to_date = None
+        if len(outer_positions) > 2:
+            times = _span_text(outer_positions[2])
+            if times and "-" in times:
+                split_times = times.split(" ")
+                dash_index = split_times.index("-") if "-" in split_times else -1
+                if dash_index > 0:
+                    from_date = split_times[dash_index-1]
+                if dash_index < len(split_times) - 1:
+                    to_date = split_times[-1]
+
+        educations.append(Education(
+            from_date=from_date,
+            to_date=to_date,
+            description=text(position_summary_text),
+            degree=degree,
+            institution_name=institution_name,
+            linkedin_url=institution_linkedin_url
+        ))
+    return educations
+
+
+def parse_skills(tree):
+    main_list = _details_list(tree)
+    if main_list is None:
+        return None
+
+    skills = []
+    for item in by_class(main_list, "pvs-list__paged-list-item"):
+        skill_link = first(item.xpath(".//a[contains(@href, 'keywords=')]"))
+        if skill_link is None:
+            continue
+        skill_name = first(aria_hidden_texts(skill_link)) or ""
+
+        endorsements = 0
+        endorsement_link = first(item.xpath(".//a[contains(@href, 'endorsers')]"))
+        if endorsement_link is not None:
+            endorsement_parts = (first(aria_hidden_texts(endorsement_link)) or "").split()
+            try:
+                endorsements = int(endorsement_parts[0]) if endorsement_parts else 0
+            except ValueError:
+                endorsements = 0
+
+        if skill_name and not is_empty_section_placeholder(skill_name):
+            skills.append(Skill(name=skill_name, endorsements=endorsements))
+    return skills
+
+
+def _main_list_items(tree):
+    main = first_by_tag(tree, "main")
+    if main is None:
+        return None
+    main_list = first_by_tag(main, "ul")
+    if main_list is None:
+        return None
+    return main_list.xpath(".//li")
+
+
+def parse_languages(tree):
+    items = _main_list_items(tree)
+    if items is None:
+        return None
+
+    languages = []
+    for item in items:
+        spans = aria_hidden_texts(item)
+        language_name = spans[0] if len(spans) >= 1 else ""
+        proficiency = spans[1] if len(spans) >= 2 else ""
+        if language_name and not is_empty_section_placeholder(language_name):
+            languages.append(Language(name=language_name, proficiency=proficiency))
+    return languages
+
+
+def parse_certifications(tree):
+    items = _main_list_items(tree)
+    if items is None:
+        return None
+
+    certifications = []
+    for item in items:
+        spans = aria_hidden_texts(item)
+        cert_name = spans[0] if len(spans) >= 1 else ""
+        organization = spans[1] if len(spans) >= 2 else ""
+        issue_date = ""
+        credential_id = ""
+        if len(spans) >= 3:
+            issue_date = spans[2]
+            if issue_date.startswith("Issued "):
+                issue_date = issue_date[7:]
+        if len(spans) >= 4 and spans[3].startswith("Credential ID "):
+            credential_id = spans[3][14:]
+
+        cred_link = first(item.xpath(".//a[contains(@href, 'credential')]"))
+        credential_url = cred_link.get("href") if cred_link is not None else ""
+
+        if cert_name and not is_empty_section_placeholder(cert_name):
+            certifications.append(Certification(
+                name=cert_name,
+                organization=organization,
+                issue_date=issue_date,
+                credential_id=credential_id,
+                credential_url=credential_url
+            ))
+    return certifications
+
+
+def parse_honors_awards(tree):
+    main_list = _details_list(tree)
+    if main_list is None:
+        return None
+
+    honors_awards = []
+    for item in by_class(main_list, "pvs-list__paged-list-item"):
+        title = ""
+        issuer = ""
+        issue_date = ""
+        description = ""
+        associated_with = ""
+
+        for txt in unique_texts(aria_hidden_texts(item)):
+            if "Issued by " in txt:
+                parts = txt.replace("Issued by ", "").split(" · ")
+                if len(parts) >= 1:
+                    issuer = parts[0].strip()
+                if len(parts) >= 2:
+                    issue_date = parts[1].strip()
+            elif "Associated with " in txt:
+                associated_with = txt.replace("Associated with ", "")
+            elif not title:
+                title = txt
+            else:
+                description = description + " " + txt if description else txt
+
+        if title and not is_empty_section_placeholder(title):
+            honors_awards.append(HonorAward(
+                title=title,
+                issuer=issuer,
+                issue_date=issue_date,
+                description=description,
+                associated_with=associated_with
+            ))
+    return honors_awards
+
+
+def parse_interest_items(tree):
+    """Returns (link_url, name, description) for the currently open interests tab."""
+    main = first_by_tag(tree, "main")
+    if main is None:
+        return None
+    tab_panel = first(main.xpath(".//div[@role='tabpanel']"))
+    if tab_panel is None:
+        return None
+
+    items = []
+    for item in by_class(tab_panel, "pvs-list__paged-list-item"):
+        link = first_by_tag(item, "a")
+        link_url = (link.get("href") or "") if link is not None else ""
+        texts = unique_texts(aria_hidden_texts(item), skip_prefix="·")
+        if texts:
+            items.append((link_url, texts[0], texts[1] if len(texts) > 1 else ""))
+    return items
+
+
+# The id of the anchor LinkedIn puts in each section card of the main profile page.
+PROFILE_SECTION_ANCHORS = {
+    "about": "about",
+    "experiences": "experience",
+    "educations": "education",
+    "skills": "skills",
+    "languages": "languages",
+    "certifications": "licenses_and_certifications",
+    "honors_awards": "honors_and_awards",
+    "interests": "interests",
+}
+
+
+# Parts of the profile text that change with time alone: relative durations next to date ranges
+# ("· 3 yrs 2 mos"), endorsement counts and connection or follower counts.
+RELATIVE_DURATION = re.compile(r"\s*·?\s*\b\d+\s+(?:yrs?|mos?|years?|months?)\b")
+ENDORSEMENTS = re.compile(r"\bendorse", re.IGNORECASE)
+AUDIENCE_COUNT = re.compile(r"[\d,.]+[KM]?\+?\s+(?:connections|followers)")
+SHOW_ALL_COUNT = re.compile(r"Show all (\d+)")
+# The leading fields of a section card entry: its title, organisation and date range.
+ENTRY_FIELDS = 3
+
+
+def strip_durations(value):
+    """Removes the relative durations from a line, e.g. "Jan 2020 - Present · 3 yrs 2 mos" -> "Jan 2020 - Present"."""
+    return RELATIVE_DURATION.sub("", value).strip(" ·")
+
+
+def _card_entry(item):
+    fields = unique_texts(aria_hidden_texts(item)) or text(item).split("\n")
+    fields = [strip_durations(field) for field in fields if not ENDORSEMENTS.search(field)]
+    return " | ".join(field for field in fields[:ENTRY_FIELDS] if field)
+
+
+def _card_summary(card):
+    """The entry count and the title, organisation and dates of each entry shown on a section card."""
+    show_all = SHOW_ALL_COUNT.search(text(card))
+    count = int(show_all.group(1)) if show_all else len(card.xpath(".//li[not(ancestor::li)]"))
+    return "\n".join([str(count)] + [_card_entry(item) for item in card.xpath(".//li")])
+
+
+def parse_profile_sections(tree):
+    """Returns a summary of the top card and of each section card on the main profile page, None if absent.
+
+    Section cards show the first few entries and a "Show all N ..." link.
+    Their summary keeps only what changes when the section does, so that
+    it can be fingerprinted: the entry count and each entry's title,
+    organisation and dates, without relative durations. The about card is
+    summarised by its text.
+    """
+    top_card = first(tree.xpath("(//main//section)[1]"))
+    sections = {"top_card": AUDIENCE_COUNT.sub("", text(top_card)) if top_card is not None else None}
+    for section, anchor in PROFILE_SECTION_ANCHORS.items():
+        card = first(tree.xpath("//*[@id='%s']/ancestor::section[1]" % anchor))
+        if card is None:
+            sections[section] = None
+        else:
+            sections[section] = text(card) if section == "about" else _card_summary(card)
+    return sections
+
+
+# The Company attribute of each dt label on a company's about page.
+COMPANY_ABOUT_FIELDS = {
+    "Website": "website",
+    "Phone": "phone",
+    "Industry": "industry",
+    "Company size": "company_size",
+    "Headquarters": "headquarters",
+    "Type": "company_type",
+    "Founded": "founded",
+    "Specialties": "specialties",
+}
+ASSOCIATED_MEMBERS = re.compile(r"([\d,]+)\s*associated members")
+
+
+def _company_cards(company_list):
+    cards = []
+    for card in by_class(company_list, "org-company-card"):
+        link = first_by_class(card, "company-name-link")
+        if link is None:
+            continue
+        followers = first_by_class(card, "company-followers-count")
+        cards.append({
+            "linkedin_url": link.get("href"),
+            "name": text(link).strip(),
+            "followers": text(followers).strip() if followers is not None else None,
+        })
+    return cards
+
+
+def parse_company_about(tree):
+    """Parses a company's about page into the values of Company's attributes, or None if it isn't loaded.
+
+    showcase_pages and affiliated_companies hold dicts of CompanySummary's
+    fields.
+    """
+    main = first_by_tag(tree, "main")
+    if main is None:
+        return None
+
+    about = {}
+    heading = selectors.find_first(tree, "company.name")
+    if heading is not None:
+        about["name"] = text(heading).strip()
+
+    overview = selectors.find_first(tree, "company.overview")
+    if overview is not None:
+        about["about_us"] = text(overview).strip()
+
+    for label in tree.xpath("//dt"):
+        attr = COMPANY_ABOUT_FIELDS.get(text(label).strip())
+        value = first(label.xpath("following-sibling::dd[1]"))
+        if attr is None or value is None or attr in about:
+            continue
+        about[attr] = text(value).strip()
+    if "specialties" in about:
+        about["specialties"] = "\n".join(about["specialties"].split(", "))
+
+    members = selectors.find(tree, "company.associated_members", lambda elem: ASSOCIATED_MEMBERS.search(text(elem)))
+    if members:
+        match = ASSOCIATED_MEMBERS.search(text(members[0]))
+        about["headcount"] = int(match.group(1).replace(",", ""))
+
+    company_lists = selectors.find(tree, "company.related_list")
+    about["showcase_pages"] = _company_cards(company_lists[0]) if len(company_lists) > 0 else []
+    about["affiliated_companies"] = _company_cards(company_lists[1]) if len(company_lists) > 1 else []
+    return about
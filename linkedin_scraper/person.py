@@ -3,16 +3,95 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact, Skill, Language, Certification, HonorAward
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact, Skill, Language, Certification, HonorAward, to_record, section
+from .objects import SectionStatus, SECTION_OK, SECTION_EMPTY, SECTION_TIMEOUT, SECTION_PARSE_ERROR, SECTION_SESSION_ERROR
+from .objects import SESSION_ERRORS
 import os
+from time import monotonic
 from linkedin_scraper import selectors
+from . import parsers
+from .browser import build_driver
+from .connections import ConnectionsCrawler
+
+# Sections scraped by default, in order, and the method that fetches each of them.
+SECTIONS = {
+    "experiences": "get_experiences",
+    "educations": "get_educations",
+    "skills": "get_skills",
+    "languages": "get_languages",
+    "certifications": "get_certifications",
+    "honors_awards": "get_honors_awards",
+    "accomplishments": "get_accomplishments",
+}
+# Sections only scraped when requested or accessed. Contacts are the logged-in account's connections,
+# whichever profile is scraped.
+LAZY_SECTIONS = dict(SECTIONS, interests="get_interests", contacts="get_contacts")
+# Parts of the main profile page, run and reported like sections.
+PROFILE_PARTS = {
+    "top_card": "get_name_and_location",
+    "about": "get_about",
+}
+
+# The details page of each section that has one, relative to the profile url.
+SECTION_PAGES = {
+    "experiences": "details/experience",
+    "educations": "details/education",
+    "skills": "details/skills",
+    "languages": "details/languages",
+    "certifications": "details/certifications",
+    "honors_awards": "details/honors",
+    "interests": "details/interests",
+}
+
+# The record type of each section, for Person.schema.
+SECTION_TYPES = {
+    "experiences": Experience,
+    "educations": Education,
+    "skills": Skill,
+    "languages": Language,
+    "certifications": Certification,
+    "honors_awards": HonorAward,
+    "accomplishments": Accomplishment,
+    "contacts": Contact,
+    "interests": Interest,
+}
+
+class LazySection(object):
+    """A Person attribute that fetches its section on first access if it was not scraped up front."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.attr = "_" + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        pending = instance.__dict__.get("_pending_sections")
+        if pending and self.name in pending:
+            if getattr(instance, "driver", None) is None:
+                raise RuntimeError("Person.%s was not scraped and no driver is attached to fetch it" % self.name)
+            pending.discard(self.name)
+            instance.run_section(self.name)
+        return instance.__dict__.get(self.attr)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.attr] = value
 
 
 class Person(Scraper):
 
     __TOP_CARD = "main"
-    __WAIT_FOR_ELEMENT_TIMEOUT = 5
+
+    experiences = LazySection()
+    educations = LazySection()
+    interests = LazySection()
+    accomplishments = LazySection()
+    contacts = LazySection()
+    skills = LazySection()
+    languages = LazySection()
+    certifications = LazySection()
+    honors_awards = LazySection()
 
     def __init__(
         self,
@@ -35,7 +114,19 @@ class Person(Scraper):
         scrape=True,
         close_on_complete=True,
         time_to_wait_after_login=0,
+        use_lxml=True,
+        sections=None,
+        prefetch_tabs=0,
+        seen=None,
+        section_retries=1,
+        retry_budget=3,
     ):
+        self._pending_sections = set()
+        self.section_status = {}
+        self._section_baselines = {}
+        self.section_retries = section_retries
+        self.retry_budget = retry_budget
+        self.sections = list(SECTIONS) if sections is None else list(sections)
         self.linkedin_url = linkedin_url
         self.name = name
         self.about = about or []
@@ -49,27 +140,25 @@ class Person(Scraper):
         self.languages = languages or []
         self.certifications = certifications or []
         self.honors_awards = honors_awards or []
+        self.use_lxml = use_lxml
+        self.prefetch_tabs = prefetch_tabs
+        self.seen = seen
+
+        if self.already_seen(linkedin_url):
+            return
 
         if driver is None:
-            try:
-                if os.getenv("CHROMEDRIVER") == None:
-                    driver_path = os.path.join(
-                        os.path.dirname(__file__), "drivers/chromedriver"
-                    )
-                else:
-                    driver_path = os.getenv("CHROMEDRIVER")
+            driver = build_driver("person")
 
-                driver = webdriver.Chrome(driver_path)
-            except:
-                driver = webdriver.Chrome()
+        self.driver = driver
 
         if get:
-            driver.get(linkedin_url)
-
-        self.driver = driver
+            self.navigate(linkedin_url)
 
         if scrape:
-            self.scrape(close_on_complete)
+            self.scraped = self.scrape(close_on_complete)
+            if self.scraped:
+                self.mark_seen(linkedin_url)
 
     def add_about(self, about):
         self.about.append(about)
@@ -105,36 +194,54 @@ class Person(Scraper):
         self.honors_awards.append(honor_award)
 
     def scrape(self, close_on_complete=True):
+        """Scrapes the profile. Returns True if it was scraped logged in with no failed section."""
         if self.is_signed_in():
-            self.scrape_logged_in(close_on_complete=close_on_complete)
+            return self.scrape_logged_in(close_on_complete=close_on_complete, sections=self.sections)
         else:
             print("you are not logged in!")
+            return False
 
     def _click_see_more_by_class_name(self, class_name):
         try:
-            _ = WebDriverWait(self.driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+            _ = WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located((By.CLASS_NAME, class_name))
             )
             div = self.driver.find_element(By.CLASS_NAME, class_name)
             div.find_element(By.TAG_NAME, "button").click()
-        except Exception as e:
+        except (TimeoutException, NoSuchElementException):
             pass
 
+    def _parse_page(self, parser):
+        """Parses the current page from a single page_source snapshot, or returns None to fall back to Selenium."""
+        if not self.use_lxml:
+            return None
+        try:
+            return parser(self.page_tree())
+        except Exception:
+            return None
+
     def is_open_to_work(self):
         try:
-            return "#OPEN_TO_WORK" in self.driver.find_element(By.CLASS_NAME,"pv-top-card-profile-picture").find_element(By.TAG_NAME,"img").get_attribute("title")
-        except:
+            return "#OPEN_TO_WORK" in (selectors.find_element(self.driver, "person.profile_picture").get_attribute("title") or "")
+        except NoSuchElementException:
             return False
 
+    @section("experiences")
     def get_experiences(self):
-        url = os.path.join(self.linkedin_url, "details/experience")
-        self.driver.get(url)
+        url = self.section_url("experiences")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-        for position in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
+        main_list = self.wait_for_element_to_load(*selectors.locator("person.details_list"), base=main)
+        experiences = self._parse_page(parsers.parse_experiences)
+        if experiences is not None:
+            for experience in experiences:
+                self.add_experience(experience)
+            return
+
+        for position in selectors.find_elements(main_list, "person.details_item"):
             position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
             
             # Fix: Handle case where more than 2 elements are returned
@@ -261,15 +368,22 @@ class Person(Scraper):
                 )
                 self.add_experience(experience)
 
+    @section("educations")
     def get_educations(self):
-        url = os.path.join(self.linkedin_url, "details/education")
-        self.driver.get(url)
+        url = self.section_url("educations")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-        for position in main_list.find_elements(By.CLASS_NAME,"pvs-list__paged-list-item"):
+        main_list = self.wait_for_element_to_load(*selectors.locator("person.details_list"), base=main)
+        educations = self._parse_page(parsers.parse_educations)
+        if educations is not None:
+            for education in educations:
+                self.add_education(education)
+            return
+
+        for position in selectors.find_elements(main_list, "person.details_item"):
             try:
                 position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
                 
@@ -334,310 +448,369 @@ class Person(Scraper):
                 # Skip this education entry if elements are missing
                 continue
 
+    @section("top_card")
     def get_name_and_location(self):
-        top_panel = self.driver.find_element(By.XPATH, "//*[@class='mt2 relative']")
-        self.name = top_panel.find_element(By.TAG_NAME, "h1").text
-        self.location = top_panel.find_element(By.XPATH, "//*[@class='text-body-small inline t-black--light break-words']").text
+        top_panel = selectors.find_element(self.driver, "person.top_card")
+        self.name = selectors.find_element(top_panel, "person.name").text
+        self.location = selectors.find_element(top_panel, "person.location").text
 
+    @section("about")
     def get_about(self):
         try:
-            about = self.driver.find_element(By.ID,"about").find_element(By.XPATH,"..").find_element(By.CLASS_NAME,"display-flex").text
+            about = selectors.find_element(self.driver, "person.about").text
         except NoSuchElementException :
             about=None
         self.about = about
 
+    @section("skills")
     def get_skills(self):
-        url = os.path.join(self.linkedin_url, "details/skills")
-        self.driver.get(url)
+        url = self.section_url("skills")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
 
-        try:
-            main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-            for item in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
-                try:
-                    # Get skill name from the link element
-                    skill_name = ""
-                    endorsements = 0
-
-                    # Try to find skill name in link
-                    try:
-                        skill_link = item.find_element(By.CSS_SELECTOR, "a[href*='keywords=']")
-                        skill_name_elem = skill_link.find_element(By.XPATH, ".//span[@aria-hidden='true']")
-                        skill_name = skill_name_elem.text.strip()
-                    except NoSuchElementException:
-                        continue
+        main_list = self.wait_for_element_to_load(*selectors.locator("person.details_list"), base=main)
+        skills = self._parse_page(parsers.parse_skills)
+        if skills is not None:
+            for skill in skills:
+                self.add_skill(skill)
+            return
 
-                    # Try to get endorsements count
-                    try:
-                        endorsement_link = item.find_element(By.CSS_SELECTOR, "a[href*='endorsers']")
-                        endorsement_text = endorsement_link.find_element(By.XPATH, ".//span[@aria-hidden='true']").text
-                        # Extract number from text like "4 endorsements"
-                        endorsement_parts = endorsement_text.split()
-                        if endorsement_parts:
-                            endorsements = int(endorsement_parts[0])
-                    except (NoSuchElementException, ValueError):
-                        endorsements = 0
+        for item in selectors.find_elements(main_list, "person.details_item"):
+            try:
+                # Get skill name from the link element
+                skill_name = ""
+                endorsements = 0
 
-                    # Skip placeholder text for empty sections
-                    if skill_name and not self._is_empty_section_placeholder(skill_name):
-                        skill = Skill(
-                            name=skill_name,
-                            endorsements=endorsements
-                        )
-                        self.add_skill(skill)
-                except (NoSuchElementException, IndexError):
+                # Try to find skill name in link
+                try:
+                    skill_link = item.find_element(By.CSS_SELECTOR, "a[href*='keywords=']")
+                    skill_name_elem = skill_link.find_element(By.XPATH, ".//span[@aria-hidden='true']")
+                    skill_name = skill_name_elem.text.strip()
+                except NoSuchElementException:
                     continue
-        except Exception:
-            pass
+
+                # Try to get endorsements count
+                try:
+                    endorsement_link = item.find_element(By.CSS_SELECTOR, "a[href*='endorsers']")
+                    endorsement_text = endorsement_link.find_element(By.XPATH, ".//span[@aria-hidden='true']").text
+                    # Extract number from text like "4 endorsements"
+                    endorsement_parts = endorsement_text.split()
+                    if endorsement_parts:
+                        endorsements = int(endorsement_parts[0])
+                except (NoSuchElementException, ValueError):
+                    endorsements = 0
+
+                # Skip placeholder text for empty sections
+                if skill_name and not self._is_empty_section_placeholder(skill_name):
+                    skill = Skill(
+                        name=skill_name,
+                        endorsements=endorsements
+                    )
+                    self.add_skill(skill)
+            except (NoSuchElementException, IndexError):
+                continue
 
     def _is_empty_section_placeholder(self, text):
         """Check if text is a LinkedIn placeholder for empty sections."""
-        placeholder_patterns = [
-            "Nothing to see for now",
-            "will appear here",
-            "No skills have been",
-            "hasn't added",
-            "not added any",
-        ]
-        text_lower = text.lower()
-        return any(pattern.lower() in text_lower for pattern in placeholder_patterns)
+        return parsers.is_empty_section_placeholder(text)
 
+    @section("languages")
     def get_languages(self):
-        url = os.path.join(self.linkedin_url, "details/languages")
-        self.driver.get(url)
+        url = self.section_url("languages")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
 
-        try:
-            main_list = main.find_element(By.TAG_NAME, "ul")
-            for item in main_list.find_elements(By.TAG_NAME, "li"):
-                try:
-                    # Get all spans with aria-hidden="true"
-                    spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-
-                    language_name = ""
-                    proficiency = ""
-
-                    if len(spans) >= 1:
-                        language_name = spans[0].text.strip()
-                    if len(spans) >= 2:
-                        proficiency = spans[1].text.strip()
-
-                    # Skip placeholder text for empty sections
-                    if language_name and not self._is_empty_section_placeholder(language_name):
-                        language = Language(
-                            name=language_name,
-                            proficiency=proficiency
-                        )
-                        self.add_language(language)
-                except (NoSuchElementException, IndexError):
-                    continue
-        except Exception:
-            pass
+        languages = self._parse_page(parsers.parse_languages)
+        if languages is not None:
+            for language in languages:
+                self.add_language(language)
+            return
 
+        main_list = main.find_element(By.TAG_NAME, "ul")
+        for item in main_list.find_elements(By.TAG_NAME, "li"):
+            try:
+                # Get all spans with aria-hidden="true"
+                spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
+
+                language_name = ""
+                proficiency = ""
+
+                if len(spans) >= 1:
+                    language_name = spans[0].text.strip()
+                if len(spans) >= 2:
+                    proficiency = spans[1].text.strip()
+
+                # Skip placeholder text for empty sections
+                if language_name and not self._is_empty_section_placeholder(language_name):
+                    language = Language(
+                        name=language_name,
+                        proficiency=proficiency
+                    )
+                    self.add_language(language)
+            except (NoSuchElementException, IndexError):
+                continue
+
+    @section("certifications")
     def get_certifications(self):
-        url = os.path.join(self.linkedin_url, "details/certifications")
-        self.driver.get(url)
+        url = self.section_url("certifications")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
 
-        try:
-            main_list = main.find_element(By.TAG_NAME, "ul")
-            for item in main_list.find_elements(By.TAG_NAME, "li"):
+        certifications = self._parse_page(parsers.parse_certifications)
+        if certifications is not None:
+            for certification in certifications:
+                self.add_certification(certification)
+            return
+
+        main_list = main.find_element(By.TAG_NAME, "ul")
+        for item in main_list.find_elements(By.TAG_NAME, "li"):
+            try:
+                cert_name = ""
+                organization = ""
+                issue_date = ""
+                credential_id = ""
+                credential_url = ""
+
+                # Get all spans with aria-hidden="true"
+                spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
+
+                if len(spans) >= 1:
+                    cert_name = spans[0].text.strip()
+                if len(spans) >= 2:
+                    organization = spans[1].text.strip()
+                if len(spans) >= 3:
+                    issue_date = spans[2].text.strip()
+                    # Remove "Issued " prefix if present
+                    if issue_date.startswith("Issued "):
+                        issue_date = issue_date[7:]
+                if len(spans) >= 4:
+                    cred_text = spans[3].text.strip()
+                    if cred_text.startswith("Credential ID "):
+                        credential_id = cred_text[14:]
+
+                # Try to get credential URL
                 try:
-                    cert_name = ""
-                    organization = ""
-                    issue_date = ""
-                    credential_id = ""
-                    credential_url = ""
-
-                    # Get all spans with aria-hidden="true"
-                    spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-
-                    if len(spans) >= 1:
-                        cert_name = spans[0].text.strip()
-                    if len(spans) >= 2:
-                        organization = spans[1].text.strip()
-                    if len(spans) >= 3:
-                        issue_date = spans[2].text.strip()
-                        # Remove "Issued " prefix if present
-                        if issue_date.startswith("Issued "):
-                            issue_date = issue_date[7:]
-                    if len(spans) >= 4:
-                        cred_text = spans[3].text.strip()
-                        if cred_text.startswith("Credential ID "):
-                            credential_id = cred_text[14:]
-
-                    # Try to get credential URL
-                    try:
-                        cred_link = item.find_element(By.CSS_SELECTOR, "a[href*='credential']")
-                        credential_url = cred_link.get_attribute("href")
-                    except NoSuchElementException:
-                        pass
-
-                    # Skip placeholder text for empty sections
-                    if cert_name and not self._is_empty_section_placeholder(cert_name):
-                        certification = Certification(
-                            name=cert_name,
-                            organization=organization,
-                            issue_date=issue_date,
-                            credential_id=credential_id,
-                            credential_url=credential_url
-                        )
-                        self.add_certification(certification)
-                except (NoSuchElementException, IndexError):
-                    continue
-        except Exception:
-            pass
+                    cred_link = item.find_element(By.CSS_SELECTOR, "a[href*='credential']")
+                    credential_url = cred_link.get_attribute("href")
+                except NoSuchElementException:
+                    pass
+
+                # Skip placeholder text for empty sections
+                if cert_name and not self._is_empty_section_placeholder(cert_name):
+                    certification = Certification(
+                        name=cert_name,
+                        organization=organization,
+                        issue_date=issue_date,
+                        credential_id=credential_id,
+                        credential_url=credential_url
+                    )
+                    self.add_certification(certification)
+            except (NoSuchElementException, IndexError):
+                continue
 
+    @section("honors_awards")
     def get_honors_awards(self):
-        url = os.path.join(self.linkedin_url, "details/honors")
-        self.driver.get(url)
+        url = self.section_url("honors_awards")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
 
-        try:
-            main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
-            for item in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
-                try:
-                    title = ""
-                    issuer = ""
-                    issue_date = ""
-                    description = ""
-                    associated_with = ""
-
-                    # Get all spans with aria-hidden="true" - filter for non-empty unique values
-                    spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-
-                    # Extract unique non-empty text values (LinkedIn duplicates content for accessibility)
-                    seen_texts = set()
-                    unique_texts = []
-                    for span in spans:
-                        text = span.text.strip()
-                        if text and text not in seen_texts:
-                            seen_texts.add(text)
-                            unique_texts.append(text)
-
-                    for text in unique_texts:
-                        if "Issued by " in text:
-                            # Parse issuer and date from "Issued by X · Date"
-                            parts = text.replace("Issued by ", "").split(" · ")
-                            if len(parts) >= 1:
-                                issuer = parts[0].strip()
-                            if len(parts) >= 2:
-                                issue_date = parts[1].strip()
-                        elif "Associated with " in text:
-                            associated_with = text.replace("Associated with ", "")
-                        elif not title:
-                            # First non-special text is the title
-                            title = text
+        main_list = self.wait_for_element_to_load(*selectors.locator("person.details_list"), base=main)
+        honors_awards = self._parse_page(parsers.parse_honors_awards)
+        if honors_awards is not None:
+            for honor_award in honors_awards:
+                self.add_honor_award(honor_award)
+            return
+
+        for item in selectors.find_elements(main_list, "person.details_item"):
+            try:
+                title = ""
+                issuer = ""
+                issue_date = ""
+                description = ""
+                associated_with = ""
+
+                # Get all spans with aria-hidden="true" - filter for non-empty unique values
+                spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
+
+                # Extract unique non-empty text values (LinkedIn duplicates content for accessibility)
+                seen_texts = set()
+                unique_texts = []
+                for span in spans:
+                    text = span.text.strip()
+                    if text and text not in seen_texts:
+                        seen_texts.add(text)
+                        unique_texts.append(text)
+
+                for text in unique_texts:
+                    if "Issued by " in text:
+                        # Parse issuer and date from "Issued by X · Date"
+                        parts = text.replace("Issued by ", "").split(" · ")
+                        if len(parts) >= 1:
+                            issuer = parts[0].strip()
+                        if len(parts) >= 2:
+                            issue_date = parts[1].strip()
+                    elif "Associated with " in text:
+                        associated_with = text.replace("Associated with ", "")
+                    elif not title:
+                        # First non-special text is the title
+                        title = text
+                    else:
+                        # Remaining text is likely description
+                        if description:
+                            description = description + " " + text
                         else:
-                            # Remaining text is likely description
-                            if description:
-                                description = description + " " + text
-                            else:
-                                description = text
-
-                    # Skip placeholder text for empty sections
-                    if title and not self._is_empty_section_placeholder(title):
-                        honor_award = HonorAward(
-                            title=title,
-                            issuer=issuer,
-                            issue_date=issue_date,
-                            description=description,
-                            associated_with=associated_with
-                        )
-                        self.add_honor_award(honor_award)
-                except (NoSuchElementException, IndexError):
-                    continue
-        except Exception:
-            pass
+                            description = text
+
+                # Skip placeholder text for empty sections
+                if title and not self._is_empty_section_placeholder(title):
+                    honor_award = HonorAward(
+                        title=title,
+                        issuer=issuer,
+                        issue_date=issue_date,
+                        description=description,
+                        associated_with=associated_with
+                    )
+                    self.add_honor_award(honor_award)
+            except (NoSuchElementException, IndexError):
+                continue
 
+    @section("interests")
     def get_interests(self):
-        url = os.path.join(self.linkedin_url, "details/interests")
-        self.driver.get(url)
+        url = self.section_url("interests")
+        self.navigate(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
 
-        try:
-            # Find all tabs (Top Voices, Companies, Groups, Schools)
-            tabs = main.find_elements(By.CSS_SELECTOR, "button[role='tab']")
+        # Find all tabs (Top Voices, Companies, Groups, Schools)
+        tabs = main.find_elements(By.CSS_SELECTOR, "button[role='tab']")
 
-            for tab in tabs:
+        for tab in tabs:
+            try:
+                # Get tab name from aria-hidden span to avoid duplication
                 try:
-                    # Get tab name from aria-hidden span to avoid duplication
-                    try:
-                        tab_name_elem = tab.find_element(By.XPATH, ".//span[@aria-hidden='true']")
-                        tab_name = tab_name_elem.text.strip()
-                    except NoSuchElementException:
-                        tab_name = tab.text.strip()
-                        # Remove duplicates like "Top VoicesTop Voices"
-                        if len(tab_name) > 0 and len(tab_name) % 2 == 0:
-                            half = len(tab_name) // 2
-                            if tab_name[:half] == tab_name[half:]:
-                                tab_name = tab_name[:half]
-
-                    tab.click()
-                    self.wait(1)  # Wait for tab content to load
-
-                    # Get list items from the current tab panel
-                    tab_panel = main.find_element(By.CSS_SELECTOR, "div[role='tabpanel']")
-                    self.scroll_to_half()
-                    self.scroll_to_bottom()
-
-                    items = tab_panel.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
-
-                    for item in items:
-                        try:
-                            # Get the URL from the first link
-                            links = item.find_elements(By.TAG_NAME, "a")
-                            link_url = links[0].get_attribute("href") if links else ""
-
-                            # Get text from spans with aria-hidden="true"
-                            spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
-
-                            # Extract unique non-empty text values
-                            seen_texts = set()
-                            unique_texts = []
-                            for span in spans:
-                                text = span.text.strip()
-                                if text and text not in seen_texts and not text.startswith("·"):
-                                    seen_texts.add(text)
-                                    unique_texts.append(text)
-
-                            if unique_texts:
-                                name = unique_texts[0]  # First text is usually the name
-                                description = unique_texts[1] if len(unique_texts) > 1 else ""
-
-                                interest = Interest(
-                                    institution_name=name,
-                                    linkedin_url=link_url
-                                )
-                                interest.title = f"{tab_name}: {description}" if description else tab_name
-                                self.add_interest(interest)
-                        except (NoSuchElementException, IndexError):
-                            continue
-                except (NoSuchElementException, IndexError):
+                    tab_name_elem = tab.find_element(By.XPATH, ".//span[@aria-hidden='true']")
+                    tab_name = tab_name_elem.text.strip()
+                except NoSuchElementException:
+                    tab_name = tab.text.strip()
+                    # Remove duplicates like "Top VoicesTop Voices"
+                    if len(tab_name) > 0 and len(tab_name) % 2 == 0:
+                        half = len(tab_name) // 2
+                        if tab_name[:half] == tab_name[half:]:
+                            tab_name = tab_name[:half]
+
+                tab.click()
+                self.wait_for_dom_quiescence()  # Wait for tab content to load
+
+                # Get list items from the current tab panel
+                tab_panel = main.find_element(By.CSS_SELECTOR, "div[role='tabpanel']")
+                self.scroll_to_half()
+                self.scroll_to_bottom()
+
+                parsed_items = self._parse_page(parsers.parse_interest_items)
+                if parsed_items is not None:
+                    for link_url, name, description in parsed_items:
+                        interest = Interest(
+                            institution_name=name,
+                            linkedin_url=link_url
+                        )
+                        interest.title = f"{tab_name}: {description}" if description else tab_name
+                        self.add_interest(interest)
                     continue
-        except Exception:
+
+                items = selectors.find_elements(tab_panel, "person.details_item")
+
+                for item in items:
+                    try:
+                        # Get the URL from the first link
+                        links = item.find_elements(By.TAG_NAME, "a")
+                        link_url = links[0].get_attribute("href") if links else ""
+
+                        # Get text from spans with aria-hidden="true"
+                        spans = item.find_elements(By.XPATH, ".//span[@aria-hidden='true']")
+
+                        # Extract unique non-empty text values
+                        seen_texts = set()
+                        unique_texts = []
+                        for span in spans:
+                            text = span.text.strip()
+                            if text and text not in seen_texts and not text.startswith("·"):
+                                seen_texts.add(text)
+                                unique_texts.append(text)
+
+                        if unique_texts:
+                            name = unique_texts[0]  # First text is usually the name
+                            description = unique_texts[1] if len(unique_texts) > 1 else ""
+
+                            interest = Interest(
+                                institution_name=name,
+                                linkedin_url=link_url
+                            )
+                            interest.title = f"{tab_name}: {description}" if description else tab_name
+                            self.add_interest(interest)
+                    except (NoSuchElementException, IndexError):
+                        continue
+            except (NoSuchElementException, IndexError):
+                continue
+
+    @section("accomplishments")
+    def get_accomplishments(self):
+        driver = self.driver
+        self.navigate(self.linkedin_url)
+
+        try:
+            _ = WebDriverWait(driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_element_located(
+                    (
+                        By.XPATH,
+                        "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']",
+                    )
+                )
+            )
+            acc = driver.find_element(By.XPATH,
+                "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']"
+            )
+            for block in acc.find_elements(By.XPATH,
+                "//div[@class='pv-accomplishments-block__content break-words']"
+            ):
+                category = block.find_element(By.TAG_NAME, "h3")
+                for title in block.find_element(By.TAG_NAME,
+                    "ul"
+                ).find_elements(By.TAG_NAME, "li"):
+                    accomplishment = Accomplishment(category=category.text, title=title.text)
+                    self.add_accomplishment(accomplishment)
+        except TimeoutException:
+            # Most profiles have no accomplishments card, which is not a failure
             pass
 
-    def scrape_logged_in(self, close_on_complete=True):
+    @section("contacts")
+    def get_contacts(self, limit=None, checkpoint=None):
+        crawler = ConnectionsCrawler(self.driver, checkpoint=checkpoint)
+        crawler.rate_limiter = self.rate_limiter
+        for contact in crawler.crawl(limit):
+            self.add_contact(contact)
+
+    def scrape_logged_in(self, close_on_complete=True, sections=None):
         driver = self.driver
-        duration = None
+        sections = list(SECTIONS) if sections is None else sections
+        unknown = set(sections) - set(LAZY_SECTIONS)
+        if unknown:
+            raise ValueError("Unknown sections: " + ", ".join(sorted(unknown)))
 
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+        root = WebDriverWait(driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
             EC.presence_of_element_located(
                 (
                     By.TAG_NAME,
@@ -646,15 +819,17 @@ class Person(Scraper):
             )
         )
         self.focus()
-        self.wait(5)
+        self.wait_for_dom_quiescence()
 
         # get name and location
-        self.get_name_and_location()
+        self.run_section("top_card")
 
         self.open_to_work = self.is_open_to_work()
 
         # get about
-        self.get_about()
+        self.run_section("about")
+        # Retried now, while still on the profile page that the sections navigate away from
+        retry_budget = self.retry_failed_sections(list(PROFILE_PARTS))
         driver.execute_script(
             "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
         )
@@ -662,72 +837,144 @@ class Person(Scraper):
             "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
         )
 
-        # get experience
-        self.get_experiences()
-
-        # get education
-        self.get_educations()
-
-        # get skills
-        self.get_skills()
-
-        # get languages
-        self.get_languages()
-
-        # get certifications
-        self.get_certifications()
-
-        # get honors & awards
-        self.get_honors_awards()
-
-        driver.get(self.linkedin_url)
-
-        # get accomplishment
-        try:
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']",
-                    )
-                )
+        if self.prefetch_tabs:
+            self.pipeline_tabs(
+                [self.section_url(section) for section in sections if section in SECTION_PAGES], self.prefetch_tabs
             )
-            acc = driver.find_element(By.XPATH,
-                "//*[@class='pv-profile-section pv-accomplishments-section artdeco-container-card artdeco-card ember-view']"
-            )
-            for block in acc.find_elements(By.XPATH,
-                "//div[@class='pv-accomplishments-block__content break-words']"
-            ):
-                category = block.find_element(By.TAG_NAME, "h3")
-                for title in block.find_element(By.TAG_NAME,
-                    "ul"
-                ).find_elements(By.TAG_NAME, "li"):
-                    accomplishment = Accomplishment(category.text, title.text)
-                    self.add_accomplishment(accomplishment)
-        except:
-            pass
 
-        # get connections
-        try:
-            driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
-            _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
-            )
-            connections = driver.find_element(By.CLASS_NAME, "mn-connections")
-            if connections is not None:
-                for conn in connections.find_elements(By.CLASS_NAME, "mn-connection-card"):
-                    anchor = conn.find_element(By.CLASS_NAME, "mn-connection-card__link")
-                    url = anchor.get_attribute("href")
-                    name = conn.find_element(By.CLASS_NAME, "mn-connection-card__details").find_element(By.CLASS_NAME, "mn-connection-card__name").text.strip()
-                    occupation = conn.find_element(By.CLASS_NAME, "mn-connection-card__details").find_element(By.CLASS_NAME, "mn-connection-card__occupation").text.strip()
-
-                    contact = Contact(name=name, occupation=occupation, url=url)
-                    self.add_contact(contact)
-        except:
-            connections = None
+        # Requested sections are scraped now, the rest are fetched on first access while the driver is open
+        self._pending_sections = set()
+        for section in sections:
+            self.run_section(section)
+        self.retry_failed_sections(sections, retry_budget)
 
         if close_on_complete:
             driver.quit()
+        else:
+            self.close_tabs()
+            self._pending_sections = set(LAZY_SECTIONS) - set(sections)
+        return not self.failed_sections
+
+    def _section_items(self, section):
+        if section == "top_card":
+            return int(bool(self.name))
+        if section == "about":
+            return int(bool(self.about))
+        return len(self.peek(section) or [])
+
+    def run_section(self, section):
+        """Scrapes one section, recording its outcome in section_status instead of raising.
+
+        A failed attempt's partial results are discarded when the section is
+        run again, so a retry doesn't duplicate them. Losing the browser
+        session is recorded as a session_error and raised, since no other
+        section can succeed on it either.
+        """
+        status = self.section_status.get(section)
+        if status is None:
+            status = self.section_status[section] = SectionStatus(section=section)
+            if section in LAZY_SECTIONS:
+                self._section_baselines[section] = list(self.peek(section) or [])
+        elif section in LAZY_SECTIONS:
+            setattr(self, section, list(self._section_baselines[section]))
+        method = getattr(self, PROFILE_PARTS.get(section) or LAZY_SECTIONS[section])
+
+        started = monotonic()
+        status.attempts += 1
+        status.error = None
+        try:
+            method()
+            status.items = self._section_items(section)
+            status.status = SECTION_OK if status.items else SECTION_EMPTY
+        except TimeoutException as e:
+            status.status = SECTION_TIMEOUT
+            status.error = repr(e)
+        except Exception as e:
+            status.error = repr(e)
+            if isinstance(e, SESSION_ERRORS) or (isinstance(e, WebDriverException) and not self.session_alive()):
+                status.status = SECTION_SESSION_ERROR
+                raise
+            status.status = SECTION_PARSE_ERROR
+        finally:
+            status.seconds += monotonic() - started
+        if status.failed:
+            status.items = self._section_items(section)
+        return status
+
+    def retry_failed_sections(self, sections, budget=None):
+        """Runs the failed sections again, each up to section_retries times and `budget` times in total.
+
+        The budget defaults to retry_budget. Returns the budget left.
+        """
+        budget = self.retry_budget if budget is None else budget
+        while budget > 0:
+            failed = [
+                section for section in sections
+                if self.section_status[section].failed and self.section_status[section].status != SECTION_SESSION_ERROR
+                and self.section_status[section].attempts <= self.section_retries
+            ]
+            if not failed:
+                break
+            for section in failed[:budget]:
+                self.run_section(section)
+                budget -= 1
+        return budget
+
+    @property
+    def failed_sections(self):
+        """The sections whose last run failed."""
+        return [section for section, status in self.section_status.items() if status.failed]
+
+    def section_url(self, section):
+        return os.path.join(self.linkedin_url, SECTION_PAGES[section])
+
+    def section_context(self, name):
+        # A section whose method runs, called directly or not, is no longer pending, so that the method's own
+        # accesses to the section don't fetch it lazily a second time.
+        self._pending_sections.discard(name)
+        return super().section_context(name)
+
+    def detach(self):
+        """Drops the driver and the sections left to fetch on access, before the driver is handed to someone else."""
+        self.close_tabs()
+        self._pending_sections = set()
+        self.driver = None
+
+    def peek(self, section):
+        """Returns a section as scraped so far, without fetching it lazily."""
+        return self.__dict__.get("_" + section)
+
+    def to_dict(self):
+        experiences = self.peek("experiences") or []
+        record = {
+            "linkedin_url": self.linkedin_url,
+            "name": self.name,
+            "location": getattr(self, "location", None),
+            "about": ("\n".join(self.about) or None) if isinstance(self.about, list) else self.about,
+            "open_to_work": getattr(self, "open_to_work", None),
+            "company": experiences[0].institution_name if experiences else None,
+            "job_title": experiences[0].position_title if experiences else None,
+        }
+        for section in LAZY_SECTIONS:
+            record[section] = to_record(self.peek(section) or [])
+        record["section_status"] = to_record(list(self.section_status.values()))
+        return record
+
+    @classmethod
+    def schema(cls):
+        """Maps each key of to_dict to its type, with [Type] for a list of records."""
+        schema = {
+            "linkedin_url": str,
+            "name": str,
+            "location": str,
+            "about": str,
+            "open_to_work": bool,
+            "company": str,
+            "job_title": str,
+        }
+        schema.update((section, [SECTION_TYPES[section]]) for section in LAZY_SECTIONS)
+        schema["section_status"] = [SectionStatus]
+        return schema
 
     @property
     def company(self):
@@ -755,13 +1002,13 @@ class Person(Scraper):
         return "<Person {name}\n\nAbout\n{about}\n\nExperience\n{exp}\n\nEducation\n{edu}\n\nSkills\n{skills}\n\nLanguages\n{languages}\n\nCertifications\n{certs}\n\nHonors & Awards\n{honors}\n\nInterest\n{int}\n\nAccomplishments\n{acc}\n\nContacts\n{conn}>".format(
             name=self.name,
             about=self.about,
-            exp=self.experiences,
-            edu=self.educations,
-            skills=self.skills,
-            languages=self.languages,
-            certs=self.certifications,
-            honors=self.honors_awards,
-            int=self.interests,
-            acc=self.accomplishments,
-            conn=self.contacts,
+            exp=self.peek("experiences"),
+            edu=self.peek("educations"),
+            skills=self.peek("skills"),
+            languages=self.peek("languages"),
+            certs=self.peek("certifications"),
+            honors=self.peek("honors_awards"),
+            int=self.peek("interests"),
+            acc=self.peek("accomplishments"),
+            conn=self.peek("contacts"),
         )
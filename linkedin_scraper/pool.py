@@ -0,0 +1,254 @@
+import itertools
+import logging
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from . import actions
+from . import canonical
+from .browser import build_driver
+from .person import Person
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDriver(object):
+    """A driver handed out by DriverPool, counting the pages it has loaded."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self._get = driver.get
+        driver.get = self.get
+
+    def get(self, url):
+        self.pages += 1
+        return self._get(url)
+
+
+class DriverPool(object):
+
+    def __init__(self, size=4, driver_factory=None, email=None, password=None, cookie=None, max_pages=200, login_timeout=10, session_store=None):
+        if email and cookie is None and not (password or session_store):
+            # actions.login would prompt for the password, from a worker thread
+            raise ValueError("DriverPool needs a password or a session_store along with the email")
+        self.size = size
+        self.driver_factory = driver_factory or build_driver
+        self.email = email
+        self.password = password
+        self.cookie = cookie
+        self.max_pages = max_pages
+        self.login_timeout = login_timeout
+        self.session_store = session_store
+        self.launched = 0
+        self.recycled = 0
+        self.replaced = 0
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        try:
+            for _ in range(size):
+                self._idle.put(self._launch())
+        except Exception:
+            # Don't leave the browsers that did launch running without a pool to close them.
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _launch(self):
+        driver = self.driver_factory()
+        try:
+            if self.cookie is not None or (self.email and (self.password or self.session_store)):
+                actions.login(driver, self.email, self.password, cookie=self.cookie, timeout=self.login_timeout,
+                              session_store=self.session_store)
+        except Exception:
+            self._quit(driver)
+            raise
+        pooled = PooledDriver(driver)
+        with self._lock:
+            self._drivers.append(pooled)
+            self.launched += 1
+        return pooled
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _retire(self, pooled):
+        with self._lock:
+            if pooled in self._drivers:
+                self._drivers.remove(pooled)
+        self._quit(pooled.driver)
+
+    @staticmethod
+    def is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _unavailable(self):
+        return RuntimeError("DriverPool is closed" if self._closed else "DriverPool has no drivers left")
+
+    def acquire(self, timeout=None):
+        if self._closed or self.size <= 0:
+            raise self._unavailable()
+        pooled = self._idle.get(timeout=timeout)
+        if pooled is None:
+            # Woken up because the pool closed or lost its last driver, so wake the next waiter too.
+            self._idle.put(None)
+            raise self._unavailable()
+        return pooled
+
+    def release(self, pooled, crashed=False):
+        if self._closed:
+            self._retire(pooled)
+            return
+        if crashed or not self.is_alive(pooled.driver):
+            self.replaced += 1
+            pooled = self._relaunch(pooled)
+        elif pooled.pages >= self.max_pages:
+            self.recycled += 1
+            pooled = self._relaunch(pooled)
+        if pooled is not None:
+            self._idle.put(pooled)
+        elif self.size <= 0:
+            self._idle.put(None)
+
+    def _relaunch(self, pooled):
+        """Replaces a driver. If the new one fails to launch, the pool shrinks and None is returned."""
+        self._retire(pooled)
+        try:
+            return self._launch()
+        except Exception:
+            with self._lock:
+                self.size -= 1
+            logger.exception("Could not relaunch a pooled driver, %d left", self.size)
+            return None
+
+    @contextmanager
+    def driver(self, timeout=None):
+        pooled = self.acquire(timeout=timeout)
+        crashed = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            crashed = not self.is_alive(pooled.driver)
+            raise
+        finally:
+            self.release(pooled, crashed=crashed)
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for pooled in drivers:
+            self._quit(pooled.driver)
+        self._idle.put(None)
+
+
+def scrape_people(urls, concurrency=4, pool=None, retries=1, email=None, password=None, cookie=None, session_store=None, seen=None, **person_kwargs):
+    """Scrapes each profile url on its own pooled driver, returning Person objects (or None on failure) in input order.
+
+    Urls of the same profile are scraped once and share their Person. Profiles
+    in the `seen` index are not scraped and come back as None. The returned
+    Persons are detached from the pooled drivers, so sections that were not
+    scraped stay empty instead of being fetched on access.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(size=concurrency, email=email, password=password, cookie=cookie, session_store=session_store)
+
+    person_kwargs["close_on_complete"] = False
+    person_kwargs["seen"] = seen
+
+    def scrape_one(url):
+        if seen is not None and url in seen:
+            return None
+        for attempt in range(retries + 1):
+            try:
+                with pool.driver() as driver:
+                    person = Person(url, driver=driver, **person_kwargs)
+                    # The driver goes back to the pool, so the person must not fetch sections through it later.
+                    person.detach()
+                    return person
+            except Exception:
+                if attempt == retries:
+                    logger.exception("Could not scrape %s in %d attempts", url, retries + 1)
+                    return None
+
+    try:
+        profile_urls = [canonical.entity_url(url) for url in urls]
+        unique_urls = list(dict.fromkeys(profile_urls))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            people = dict(zip(unique_urls, executor.map(scrape_one, unique_urls)))
+        return [people[url] for url in profile_urls]
+    finally:
+        if own_pool:
+            pool.close()
+
+
+def hydrate_jobs(jobs, concurrency=4, pool=None, retries=1, email=None, password=None, cookie=None, session_store=None, seen=None):
+    """Scrapes the details of Job stubs on pooled drivers, yielding each job as soon as it is done.
+
+    The stubs keep the driver they came with, so a search session stays
+    usable. Jobs that still fail after `retries` are not yielded. Jobs in the
+    `seen` index are skipped, and hydrated ones are added to it. `jobs` is
+    read as the workers free up, twice `concurrency` ahead, so a streaming
+    search is paged through as fast as its jobs are hydrated.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(size=concurrency, email=email, password=password, cookie=cookie, session_store=session_store)
+
+    def hydrate_one(job):
+        if seen is not None and job.linkedin_url in seen:
+            return None
+        original_driver = job.driver
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    with pool.driver() as driver:
+                        job.driver = driver
+                        job.scrape_logged_in(close_on_complete=False)
+                    if seen is not None:
+                        seen.add(job.linkedin_url)
+                    return job
+                except Exception:
+                    if attempt == retries:
+                        logger.exception("Could not hydrate %s in %d attempts", job.linkedin_url, retries + 1)
+                        return None
+        finally:
+            job.driver = original_driver
+
+    jobs = iter(jobs)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = set()
+    try:
+        while True:
+            for job in itertools.islice(jobs, 2 * concurrency - len(pending)):
+                pending.add(executor.submit(hydrate_one, job))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = future.result()
+                if job is not None:
+                    yield job
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if own_pool:
+            pool.close()
@@ -0,0 +1,207 @@
+import re
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+URL_CLASSES = [
+    ("details", re.compile(r"/in/[^/]+/details/")),
+    ("profile", re.compile(r"/in/")),
+    ("company", re.compile(r"/(company|school|showcase)/")),
+    ("jobs_search", re.compile(r"/jobs/search")),
+    ("job", re.compile(r"/jobs/")),
+    ("network", re.compile(r"/mynetwork/")),
+    ("login", re.compile(r"/(login|uas/login|checkpoint)")),
+]
+# Matched against the path of a url only, so that e.g. /in/login-expert/ is not taken for a login page.
+BLOCKED_URL = re.compile(r"^/(checkpoint|authwall|uas/login|login)(/|$)")
+
+# Budgets as (requests per second, burst size), per account and url class.
+DEFAULT_BUDGETS = {
+    "profile": (1 / 3.0, 5),
+    "details": (1.0, 10),
+    "company": (1 / 3.0, 5),
+    "jobs_search": (1 / 5.0, 3),
+    "job": (1 / 2.0, 5),
+    "network": (1 / 5.0, 3),
+    "login": (1 / 30.0, 2),
+    "other": (1.0, 10),
+}
+DEFAULT_ACCOUNT_BUDGET = (1.0, 10)
+DEFAULT_ACCOUNT = "default"
+
+
+def classify_url(url):
+    for url_class, pattern in URL_CLASSES:
+        if pattern.search(url or ""):
+            return url_class
+    return "other"
+
+
+def is_blocked(url):
+    """Whether url is a checkpoint, authwall or login page."""
+    return bool(url) and BLOCKED_URL.match(urlsplit(url).path) is not None
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self):
+        """Seconds until a token is available."""
+        self._refill()
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+
+class RateLimiter(object):
+    """Paces navigations with token buckets per account and per url class.
+
+    When a navigation lands on a checkpoint, authwall or login page, the account
+    is paused for an exponentially growing backoff and its rates are halved.
+    The rates recover gradually on successful navigations.
+    """
+
+    def __init__(self, budgets=None, account_budget=DEFAULT_ACCOUNT_BUDGET, backoff=60, max_backoff=3600,
+                 recovery=1.05, clock=time.monotonic, sleep=time.sleep):
+        self.budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
+        self.account_budget = account_budget
+        self.initial_backoff = backoff
+        self.max_backoff = max_backoff
+        self.recovery = recovery
+        self.clock = clock
+        self.sleep = sleep
+        self.blocked = 0
+        self._buckets = {}
+        self._scale = {}
+        self._backoff = {}
+        self._paused_until = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, account, url_class):
+        key = (account, url_class)
+        if key not in self._buckets:
+            rate, burst = self.account_budget if url_class is None else self.budgets.get(url_class, self.budgets["other"])
+            self._buckets[key] = TokenBucket(rate * self._scale.get(account, 1.0), burst, self.clock)
+        return self._buckets[key]
+
+    def acquire(self, url, account=DEFAULT_ACCOUNT):
+        """Blocks until the account may navigate to url, returning the seconds waited."""
+        url_class = classify_url(url)
+        waited = 0
+        while True:
+            with self._lock:
+                buckets = (self._bucket(account, None), self._bucket(account, url_class))
+                delay = max(
+                    [self._paused_until.get(account, 0) - self.clock()] + [bucket.delay() for bucket in buckets]
+                )
+                if delay <= 0:
+                    for bucket in buckets:
+                        bucket.take()
+                    return waited
+            self.sleep(delay)
+            waited += delay
+
+    def _set_scale(self, account, scale):
+        self._scale[account] = scale
+        for (bucket_account, url_class), bucket in self._buckets.items():
+            if bucket_account == account:
+                rate, _ = self.account_budget if url_class is None else self.budgets.get(url_class, self.budgets["other"])
+                bucket.rate = rate * scale
+
+    def report(self, requested_url, landed_url, account=DEFAULT_ACCOUNT):
+        """Backs off if a navigation was redirected to a checkpoint/authwall/login page. Returns True if it was."""
+        with self._lock:
+            if is_blocked(landed_url) and not is_blocked(requested_url):
+                self.blocked += 1
+                backoff = min(self.max_backoff, self._backoff.get(account, self.initial_backoff / 2.0) * 2)
+                self._backoff[account] = backoff
+                self._paused_until[account] = self.clock() + backoff
+                self._set_scale(account, self._scale.get(account, 1.0) / 2)
+                return True
+            if account in self._backoff:
+                del self._backoff[account]
+            scale = self._scale.get(account, 1.0)
+            if scale < 1.0:
+                self._set_scale(account, min(1.0, scale * self.recovery))
+            return False
+
+    def get(self, driver, url, account=None):
+        if getattr(driver, "serves_from_cache", None) and driver.serves_from_cache(url):
+            driver.get(url)
+            return
+        account = account or account_for(driver)
+        self.acquire(url, account)
+        driver.get(url)
+        try:
+            landed_url = driver.current_url
+        except Exception:
+            return
+        if self.report(url, landed_url, account) and getattr(driver, "report_blocked", None):
+            driver.report_blocked(url)
+
+
+class NoLimit(object):
+    """Navigates without pacing, for drivers that never touch the network such as ReplayDriver."""
+
+    def acquire(self, url, account=DEFAULT_ACCOUNT):
+        return 0
+
+    def report(self, requested_url, landed_url, account=DEFAULT_ACCOUNT):
+        return False
+
+    def get(self, driver, url, account=None):
+        driver.get(url)
+
+
+default_limiter = RateLimiter()
+_accounts = weakref.WeakKeyDictionary()
+_after_next_load = weakref.WeakKeyDictionary()
+
+
+def register(driver, account):
+    """Associates a driver with the account it is logged in as, so it uses that account's budget."""
+    _accounts[driver] = account
+
+
+def account_for(driver):
+    try:
+        return _accounts.get(driver, DEFAULT_ACCOUNT)
+    except TypeError:
+        return DEFAULT_ACCOUNT
+
+
+def after_next_load(driver, callback):
+    """Calls callback(driver) once, after the next page loaded in driver through navigate."""
+    _after_next_load.setdefault(driver, []).append(callback)
+
+
+def navigate(driver, url, limiter=None):
+    """Loads url in driver through the rate limiter. Every navigation in the package goes through here."""
+    (limiter or default_limiter).get(driver, url)
+    try:
+        callbacks = _after_next_load.pop(driver, [])
+    except TypeError:
+        callbacks = []
+    for callback in callbacks:
+        callback(driver)
+
+
+def configure(**kwargs):
+    """Replaces the package-wide rate limiter, e.g. configure(budgets={"profile": (0.2, 3)})."""
+    global default_limiter
+    default_limiter = RateLimiter(**kwargs)
+    return default_limiter
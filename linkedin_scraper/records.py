@@ -0,0 +1,88 @@
+"""Compact variants of the dataclasses in objects.py, for holding many records in memory.
+
+The variants have __slots__ instead of a per-instance __dict__. They keep
+only the fields the scrapers fill in, and they intern strings that repeat
+across records, such as company names, locations and dates. They need
+Python 3.10 or later.
+
+    rows = [records.compact(experience) for experience in person.experiences]
+    keys = {records.compact(experience, frozen=True) for experience in person.experiences}
+"""
+import sys
+from dataclasses import asdict, fields, make_dataclass
+
+from .objects import (
+    Record, Contact, Institution, Experience, Education, Interest, Accomplishment, Skill, Language,
+    Certification, HonorAward
+)
+
+# The fields each scraper fills in. Classes not listed keep all their fields.
+COMPACT_FIELDS = {
+    Experience: ["position_title", "institution_name", "linkedin_url", "from_date", "to_date", "duration",
+                 "location", "description"],
+    Education: ["institution_name", "linkedin_url", "degree", "from_date", "to_date", "description"],
+    Interest: ["institution_name", "linkedin_url", "title"],
+    Accomplishment: ["category", "title"],
+}
+
+# Fields whose values repeat across records and are worth interning.
+INTERNED_FIELDS = {
+    "institution_name", "position_title", "location", "from_date", "to_date", "duration", "degree", "name",
+    "occupation", "proficiency", "organization", "issuer", "issue_date", "associated_with", "category",
+    "industry", "type", "headquarters",
+}
+
+
+def _record_type(cls, frozen):
+    types = {field.name: field.type for field in fields(cls)}
+    names = COMPACT_FIELDS.get(cls, list(types))
+    return make_dataclass(
+        ("Frozen" if frozen else "") + cls.__name__ + "Record",
+        [(name, types[name], None) for name in names],
+        bases=(Record,),
+        slots=True,
+        frozen=frozen,
+        namespace={"__module__": __name__},
+    )
+
+
+SOURCE_TYPES = [Contact, Institution, Experience, Education, Interest, Accomplishment, Skill, Language,
+                Certification, HonorAward]
+RECORD_TYPES = {cls: _record_type(cls, frozen=False) for cls in SOURCE_TYPES}
+FROZEN_RECORD_TYPES = {cls: _record_type(cls, frozen=True) for cls in SOURCE_TYPES}
+ORIGINAL_TYPES = dict(
+    [(record_type, cls) for cls, record_type in RECORD_TYPES.items()]
+    + [(record_type, cls) for cls, record_type in FROZEN_RECORD_TYPES.items()]
+)
+
+ContactRecord = RECORD_TYPES[Contact]
+InstitutionRecord = RECORD_TYPES[Institution]
+ExperienceRecord = RECORD_TYPES[Experience]
+EducationRecord = RECORD_TYPES[Education]
+InterestRecord = RECORD_TYPES[Interest]
+AccomplishmentRecord = RECORD_TYPES[Accomplishment]
+SkillRecord = RECORD_TYPES[Skill]
+LanguageRecord = RECORD_TYPES[Language]
+CertificationRecord = RECORD_TYPES[Certification]
+HonorAwardRecord = RECORD_TYPES[HonorAward]
+# Frozen types are module attributes too, so that records pickle (e.g. across processes).
+globals().update((record_type.__name__, record_type) for record_type in FROZEN_RECORD_TYPES.values())
+
+
+def _value(name, value):
+    if name in INTERNED_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def compact(item, frozen=False):
+    """Converts an Experience, Education, Skill... into its slotted record. Frozen records are hashable."""
+    record_type = (FROZEN_RECORD_TYPES if frozen else RECORD_TYPES)[type(item)]
+    return record_type(**{
+        field.name: _value(field.name, getattr(item, field.name)) for field in fields(record_type)
+    })
+
+
+def expand(record):
+    """Converts a compact record back into the class it came from."""
+    return ORIGINAL_TYPES[type(record)](**asdict(record))
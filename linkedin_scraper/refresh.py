@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+
+from . import canonical
+from . import parsers
+from .objects import to_record
+from .person import Person, SECTION_PAGES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    url TEXT PRIMARY KEY,
+    fingerprints TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Parts of the main profile page scraped without visiting another page.
+TOP_CARD_PARTS = ("top_card", "about")
+
+
+def fingerprint(text):
+    return None if text is None else hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def profile_fingerprints(tree):
+    """Fingerprints of the top card, about and each section card of a main profile page, from their stable fields."""
+    return {part: fingerprint(text) for part, text in parsers.parse_profile_sections(tree).items()}
+
+
+class ProfileRefresher(object):
+    """Re-scrapes profiles, visiting only the details pages of sections that changed.
+
+    Each refresh loads the main profile page, fingerprints its top card and
+    section cards, and compares them to the fingerprints stored by the last
+    refresh. Only changed sections are scraped, so an unchanged profile
+    costs a single page load. A part that failed to scrape keeps its old
+    fingerprint, so it is fetched again by the next refresh.
+    """
+
+    def __init__(self, path, sections=None):
+        self.path = os.path.expanduser(path)
+        self.sections = [section for section in SECTION_PAGES if sections is None or section in sections]
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def load(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT fingerprints FROM fingerprints WHERE url = ?", (canonical.entity_url(url),)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save(self, url, fingerprints):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (url, fingerprints, updated_at) VALUES (?, ?, ?)",
+                (canonical.entity_url(url), json.dumps(fingerprints), time.time())
+            )
+
+    def refresh(self, url, driver, **person_kwargs):
+        """Refreshes one profile, returning the Person and a diff record.
+
+        The Person holds the top card and the changed sections. The diff lists
+        the changed and unchanged parts of the profile.
+        """
+        url = canonical.entity_url(url)
+        person = Person(url, driver=driver, scrape=False, **person_kwargs)
+        person.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+        person.wait_for_dom_quiescence()
+
+        current = profile_fingerprints(person.page_tree())
+        previous = self.load(url)
+        parts = list(TOP_CARD_PARTS) + self.sections
+        if previous is None:
+            changed = [part for part in parts if current.get(part) is not None]
+        else:
+            changed = [part for part in parts if previous.get(part) != current.get(part)]
+
+        # A section the profile no longer has is reported as changed, but there is nothing to fetch.
+        sections = [section for section in self.sections if section in changed and current.get(section) is not None]
+        if changed:
+            person.scrape_logged_in(close_on_complete=False, sections=sections)
+        fingerprints = dict(current)
+        for part in person.failed_sections:
+            if previous is not None and part in previous:
+                fingerprints[part] = previous[part]
+            else:
+                fingerprints.pop(part, None)
+        self.save(url, fingerprints)
+        values = {section: to_record(person.peek(section)) for section in sections}
+        if set(TOP_CARD_PARTS) & set(changed):
+            values.update(name=person.name, location=getattr(person, "location", None), about=person.about)
+        diff = {
+            "linkedin_url": url,
+            "new": previous is None,
+            "changed": changed,
+            "unchanged": [part for part in parts if part not in changed],
+            "fetched": sections,
+            "failed": person.failed_sections,
+            "values": values,
+            "refreshed_at": time.time(),
+        }
+        return person, diff
+
+    def refresh_all(self, urls, driver, **person_kwargs):
+        """Refreshes each profile on one driver, yielding (person, diff) pairs."""
+        for url in urls:
+            yield self.refresh(url, driver, **person_kwargs)
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+from urllib.parse import urlsplit, urlunsplit
+
+from lxml import html
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from . import parsers
+from .locators import locator_to_xpath
+
+INDEX_FILE = "index.json"
+# The kinds of snapshot recorded per url, in the order they are preferred when replaying.
+KINDS = ("rendered_dom", "page_source")
+OUTER_HTML_SCRIPT = "return document.documentElement.outerHTML;"
+
+
+class FixtureNotFound(WebDriverException):
+    pass
+
+
+def fixture_key(url):
+    """The index key of url. The trailing slash of the path is dropped, as the scrapers build urls with and without."""
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(path=parts.path.rstrip("/")))
+
+
+class FixtureStore(object):
+    """A directory of page snapshots keyed by the url they were requested with and their kind.
+
+    A url can have both a page_source snapshot and the rendered DOM. Loading
+    it serves the rendered DOM when there is one, as it holds what the
+    scrapers scrolled and clicked into view.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+        try:
+            with open(os.path.join(self.path, INDEX_FILE)) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        index, self.index = self.index, {}
+        for url, entry in index.items():
+            # Indexes written before snapshots were kept per kind hold a single entry per url.
+            if "file" in entry:
+                entry = {entry.pop("kind", "page_source"): entry}
+            self.index.setdefault(fixture_key(url), {}).update(entry)
+
+    def __contains__(self, url):
+        return fixture_key(url) in self.index
+
+    def urls(self):
+        return list(self.index)
+
+    def save(self, url, page_source, current_url=None, kind="page_source"):
+        if kind not in KINDS:
+            raise ValueError("Unknown fixture kind: " + kind)
+        key = fixture_key(url)
+        file_name = hashlib.sha1((kind + ":" + key).encode("utf-8")).hexdigest()[:20] + ".html"
+        with open(os.path.join(self.path, file_name), "w", encoding="utf-8") as f:
+            f.write(page_source)
+        self.index.setdefault(key, {})[kind] = {"file": file_name, "current_url": current_url or url}
+        with open(os.path.join(self.path, INDEX_FILE), "w") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+
+    def kinds(self, url):
+        return [kind for kind in KINDS if kind in self.index.get(fixture_key(url), {})]
+
+    def load(self, url, kind=None):
+        """The (page source, current url) recorded for url, of `kind` or else of the preferred kind recorded."""
+        kinds = [kind] if kind else self.kinds(url)
+        entries = self.index.get(fixture_key(url), {})
+        if not kinds or kinds[0] not in entries:
+            raise FixtureNotFound("No %sfixture recorded for %s" % (kind + " " if kind else "", url))
+        entry = entries[kinds[0]]
+        with open(os.path.join(self.path, entry["file"]), encoding="utf-8") as f:
+            return f.read(), entry["current_url"]
+
+
+class RecordingDriver(object):
+    """Wraps a live driver and saves a snapshot of every page the scrapers touch.
+
+    page_source reads are saved as they happen, and the rendered DOM of each
+    page is saved separately before navigating away from it, so
+    Selenium-walking code paths can be replayed too.
+    """
+
+    def __init__(self, driver, fixture_dir):
+        self.driver = driver
+        self.fixtures = FixtureStore(fixture_dir)
+        self._url = None
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def _flush(self):
+        if self._url is None:
+            return
+        try:
+            dom = self.driver.execute_script(OUTER_HTML_SCRIPT)
+            self.fixtures.save(self._url, dom, self.driver.current_url, kind="rendered_dom")
+        except WebDriverException:
+            pass
+
+    def get(self, url):
+        self._flush()
+        self.driver.get(url)
+        self._url = url
+
+    @property
+    def page_source(self):
+        page_source = self.driver.page_source
+        if self._url is not None:
+            self.fixtures.save(self._url, page_source, self.driver.current_url)
+        return page_source
+
+    def close(self):
+        self._flush()
+        self._url = None
+        return self.driver.close()
+
+    def quit(self):
+        self._flush()
+        self._url = None
+        return self.driver.quit()
+
+
+class ReplayElement(object):
+    """The subset of WebElement used by the scrapers, backed by an lxml element."""
+
+    def __init__(self, elem, parent):
+        self.elem = elem
+        self.parent = parent
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayElement) and other.elem is self.elem
+
+    def __hash__(self):
+        return hash(self.elem)
+
+    @property
+    def text(self):
+        return parsers.text(self.elem)
+
+    @property
+    def tag_name(self):
+        return self.elem.tag
+
+    def get_attribute(self, name):
+        if name in ("textContent", "innerText"):
+            return parsers.text(self.elem)
+        if name == "innerHTML":
+            return (self.elem.text or "") + "".join(html.tostring(child, encoding="unicode") for child in self.elem)
+        if name == "outerHTML":
+            return html.tostring(self.elem, encoding="unicode")
+        return self.elem.get(name)
+
+    get_dom_attribute = get_attribute
+
+    def is_enabled(self):
+        return self.elem.get("disabled") is None
+
+    def is_displayed(self):
+        return not parsers._is_hidden(self.elem)
+
+    def click(self):
+        pass
+
+    def submit(self):
+        pass
+
+    def send_keys(self, *value):
+        pass
+
+    def find_elements(self, by=By.ID, value=None):
+        return [ReplayElement(elem, self.parent) for elem in self.elem.xpath(locator_to_xpath(by, value))
+                if not isinstance(elem, str)]
+
+    def find_element(self, by=By.ID, value=None):
+        elems = self.find_elements(by, value)
+        if not elems:
+            raise NoSuchElementException("Unable to locate element: %s=%s" % (by, value))
+        return elems[0]
+
+
+class _Alert(object):
+    def accept(self):
+        pass
+
+    def dismiss(self):
+        pass
+
+
+class _SwitchTo(object):
+    def __init__(self, driver):
+        self.driver = driver
+        self.alert = _Alert()
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class ReplayDriver(object):
+    """A stand-in for the WebDriver API used by Scraper that serves recorded fixtures.
+
+    fixture_dir is a directory, a FixtureStore or anything else with its
+    load(url) method, such as a PageCache.
+    """
+
+    def __init__(self, fixture_dir):
+        self.fixtures = fixture_dir if hasattr(fixture_dir, "load") else FixtureStore(fixture_dir)
+        self.switch_to = _SwitchTo(self)
+        self.current_window_handle = "replay"
+        self.window_handles = ["replay"]
+        self.page_source = "<html><body></body></html>"
+        self.current_url = "about:blank"
+        self.tree = html.fromstring(self.page_source)
+        self.pages_loaded = 0
+
+    def get(self, url):
+        self.page_source, self.current_url = self.fixtures.load(url)
+        self.tree = html.fromstring(self.page_source)
+        self.tree.make_links_absolute(self.current_url)
+        self.pages_loaded += 1
+
+    @property
+    def title(self):
+        return parsers.text(parsers.first(self.tree.xpath("//title")))
+
+    def find_elements(self, by=By.ID, value=None):
+        return ReplayElement(self.tree, self).find_elements(by, value)
+
+    def find_element(self, by=By.ID, value=None):
+        return ReplayElement(self.tree, self).find_element(by, value)
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            return "complete"
+        if "outerHTML" in script:
+            return self.page_source
+        if "localStorage" in script:
+            return {}
+        if "userAgent" in script:
+            return "ReplayDriver"
+        return None
+
+    def execute_async_script(self, script, *args):
+        return True
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return {}
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def set_script_timeout(self, time_to_wait):
+        pass
+
+    def get_cookies(self):
+        return []
+
+    def add_cookie(self, cookie_dict):
+        pass
+
+    def close(self):
+        pass
+
+    def quit(self):
+        pass
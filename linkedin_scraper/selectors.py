@@ -1 +1,245 @@
+"""A registry of the selectors used by the scrapers, loaded from selectors.json.
+
+Each key has several versions, one per LinkedIn layout it was seen in.
+Lookups try the versions in a learned order, the one that matched last
+first, so a page of the current layout costs a single lookup. Extra or
+newer selectors can be put in a file named by LINKEDIN_SCRAPER_SELECTORS,
+which is reloaded when it changes. A file that can't be read or parsed is
+logged and the selectors loaded before it are kept:
+
+    {"company.name": [{"version": "2025-h1", "by": "xpath", "value": "//main//h1"}]}
+"""
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from time import monotonic, sleep
+
+from lxml import etree
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from .locators import locator_to_xpath
+
 NAME = 'text-heading-xlarge'
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "selectors.json")
+OVERRIDE_ENV = "LINKEDIN_SCRAPER_SELECTORS"
+
+logger = logging.getLogger(__name__)
+
+
+class Selector(object):
+    """One version of a selector: its Selenium locator and the equivalent lxml XPath, compiled once.
+
+    A `fallback` version is a catch-all that is only tried after the others,
+    since it would match on pages the others match too.
+    """
+    __slots__ = ("key", "version", "by", "value", "fallback", "xpath")
+
+    def __init__(self, key, version, by, value, fallback=False):
+        self.key = key
+        self.version = version
+        self.by = by
+        self.value = value
+        self.fallback = fallback
+        self.xpath = etree.XPath(locator_to_xpath(by, value))
+
+    @property
+    def locator(self):
+        return (self.by, self.value)
+
+    def __repr__(self):
+        return "<Selector %s@%s %s=%r>" % (self.key, self.version, self.by, self.value)
+
+
+class SelectorRegistry(object):
+    """Versioned selectors by key, read from `paths`, later files replacing the keys of earlier ones.
+
+    The files are checked for changes at most every `check_interval` seconds
+    and reloaded when one has changed, keeping the learned order of the
+    versions that are still there.
+    """
+
+    def __init__(self, paths=None, check_interval=5.0):
+        if paths is None:
+            paths = [DEFAULT_PATH] + ([os.environ[OVERRIDE_ENV]] if os.environ.get(OVERRIDE_ENV) else [])
+        self.paths = [os.path.expanduser(path) for path in paths]
+        self.check_interval = check_interval
+        self.hits = defaultdict(int)
+        self._selectors = {}
+        self._files = {}
+        self._mtimes = {}
+        self._checked_at = monotonic()
+        self._lock = threading.Lock()
+        self.load()
+
+    def _stat(self):
+        mtimes = {}
+        for path in self.paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    def _read(self, path):
+        with open(path) as f:
+            definitions = json.load(f)
+        return {
+            key: [
+                Selector(key, version["version"], version["by"], version["value"], version.get("fallback", False))
+                for version in versions
+            ]
+            for key, versions in definitions.items()
+        }
+
+    def load(self):
+        """Reads and compiles the selectors of each path, returning whether all of them loaded.
+
+        A file that can't be read, parsed or compiled keeps the selectors it
+        had at its last good load, if any. Its mtime is still recorded, so it
+        isn't read again until it changes.
+        """
+        mtimes = self._stat()
+        loaded = True
+        selectors = {}
+        for path in self.paths:
+            if mtimes[path] is None:
+                self._files.pop(path, None)
+                continue
+            try:
+                self._files[path] = self._read(path)
+            except (OSError, ValueError, TypeError, KeyError, AttributeError, etree.XPathError) as e:
+                logger.warning("Keeping the previous selectors of %s, it could not be loaded: %r", path, e)
+                loaded = False
+            for key, versions in self._files.get(path, {}).items():
+                selectors[key] = list(versions)
+        with self._lock:
+            for key, versions in selectors.items():
+                learned = [selector.version for selector in self._selectors.get(key, [])]
+                versions.sort(key=lambda selector: (
+                    selector.fallback, learned.index(selector.version) if selector.version in learned else len(learned)
+                ))
+            self._selectors = selectors
+            self._mtimes = mtimes
+        return loaded
+
+    def reload_if_changed(self):
+        now = monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        if self._stat() == self._mtimes:
+            return False
+        return self.load()
+
+    def versions(self, key):
+        """The versions of `key`, in the order they are tried."""
+        self.reload_if_changed()
+        try:
+            return list(self._selectors[key])
+        except KeyError:
+            raise KeyError("Unknown selector: " + key)
+
+    def matched(self, selector):
+        """Moves the version that matched to the front of its key's order."""
+        self.hits[(selector.key, selector.version)] += 1
+        if selector.fallback:
+            return
+        with self._lock:
+            versions = self._selectors.get(selector.key)
+            if versions and versions[0] is not selector and selector in versions:
+                versions.remove(selector)
+                versions.insert(0, selector)
+
+    def locator(self, key):
+        """The (by, value) locator of the version tried first."""
+        return self.versions(key)[0].locator
+
+    def find(self, tree, key, accept=None):
+        """The lxml elements under tree matched by the first version of `key` that matches any.
+
+        With `accept`, only the elements it returns true for count as matches,
+        so a version whose elements are all rejected falls through to the next.
+        """
+        for selector in self.versions(key):
+            elems = selector.xpath(tree)
+            if accept is not None:
+                elems = [elem for elem in elems if accept(elem)]
+            if len(elems):
+                self.matched(selector)
+                return elems
+        return []
+
+    def find_first(self, tree, key):
+        elems = self.find(tree, key)
+        return elems[0] if elems else None
+
+    def find_elements(self, base, key, accept=None):
+        """The WebElements under base (a driver or an element) matched by the first version of `key` that matches any.
+
+        `accept` filters the elements as in `find`.
+        """
+        for selector in self.versions(key):
+            elems = base.find_elements(*selector.locator)
+            if accept is not None:
+                elems = [elem for elem in elems if accept(elem)]
+            if elems:
+                self.matched(selector)
+                return elems
+        return []
+
+    def find_element(self, base, key):
+        elems = self.find_elements(base, key)
+        if not elems:
+            raise NoSuchElementException("No version of selector %s matched" % key)
+        return elems[0]
+
+    def wait_for(self, base, key, timeout=5, poll=0.1):
+        """Waits until any version of `key` matches under base, returning the first element, or None on timeout."""
+        started = monotonic()
+        while True:
+            try:
+                elems = self.find_elements(base, key)
+            except WebDriverException:
+                elems = []
+            if elems:
+                return elems[0]
+            if monotonic() - started >= timeout:
+                return None
+            sleep(poll)
+
+
+registry = SelectorRegistry()
+
+
+def configure(path=None, check_interval=5.0):
+    """Replaces the registry with one that reads the selectors of `path` over the packaged ones."""
+    global registry
+    registry = SelectorRegistry([DEFAULT_PATH] + ([path] if path else []), check_interval)
+    return registry
+
+
+def locator(key):
+    return registry.locator(key)
+
+
+def find(tree, key, accept=None):
+    return registry.find(tree, key, accept)
+
+
+def find_first(tree, key):
+    return registry.find_first(tree, key)
+
+
+def find_elements(base, key, accept=None):
+    return registry.find_elements(base, key, accept)
+
+
+def find_element(base, key):
+    return registry.find_element(base, key)
+
+
+def wait_for(base, key, timeout=5, poll=0.1):
+    return registry.wait_for(base, key, timeout, poll)
@@ -0,0 +1,141 @@
+import json
+import os
+import re
+import time
+from urllib.parse import urlsplit
+
+import requests
+from selenium.common.exceptions import WebDriverException
+
+from . import ratelimit
+
+LINKEDIN_URL = "https://www.linkedin.com"
+VALIDATION_URL = LINKEDIN_URL + "/feed/"
+
+RESTORE_LOCAL_STORAGE_SCRIPT = """
+(function (items) {
+    if (!/(^|\\.)linkedin\\.com$/.test(location.hostname)) return;
+    for (var key in items) {
+        try { window.localStorage.setItem(key, items[key]); } catch (e) {}
+    }
+})(%s);
+"""
+
+
+def _remove_restore_script(driver, identifier):
+    """Stops restoring the stored localStorage once a LinkedIn page has loaded it, so later pages keep newer values."""
+    try:
+        host = urlsplit(driver.current_url).hostname or ""
+    except WebDriverException:
+        return
+    if not re.search(r"(^|\.)linkedin\.com$", host):
+        ratelimit.after_next_load(driver, lambda driver: _remove_restore_script(driver, identifier))
+        return
+    try:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+    except WebDriverException:
+        pass
+
+
+def _to_cdp_cookie(cookie):
+    cdp_cookie = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain") or ".linkedin.com",
+        "path": cookie.get("path") or "/",
+        "secure": cookie.get("secure", True),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("sameSite"):
+        cdp_cookie["sameSite"] = cookie["sameSite"]
+    if cookie.get("expiry"):
+        cdp_cookie["expires"] = cookie["expiry"]
+    return cdp_cookie
+
+
+def set_cookies(driver, cookies):
+    """Sets cookies through CDP so no page has to be loaded first, falling back to a cheap navigation otherwise."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(cookie) for cookie in cookies]})
+        return
+    ratelimit.navigate(driver, LINKEDIN_URL + "/robots.txt")
+    for cookie in cookies:
+        driver.add_cookie({key: value for key, value in cookie.items() if key != "sameSite" or value in ("Strict", "Lax", "None")})
+
+
+class SessionStore(object):
+    """Persists the cookie jar and localStorage of logged in accounts, one JSON file per account."""
+
+    def __init__(self, path=None, max_age=None, validation_timeout=10):
+        self.path = os.path.expanduser(path or os.path.join("~", ".linkedin_scraper", "sessions"))
+        self.max_age = max_age
+        self.validation_timeout = validation_timeout
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file(self, account):
+        return os.path.join(self.path, re.sub(r"[^\w.@-]", "_", account) + ".json")
+
+    def save(self, driver, account):
+        session = {
+            "account": account,
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script("return Object.assign({}, window.localStorage);") or {},
+            "user_agent": driver.execute_script("return navigator.userAgent;"),
+        }
+        tmp_file = self._file(account) + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(session, f)
+        os.replace(tmp_file, self._file(account))
+        return session
+
+    def load(self, account):
+        try:
+            with open(self._file(account)) as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self.max_age is not None and time.time() - session.get("saved_at", 0) > self.max_age:
+            return None
+        return session
+
+    def delete(self, account):
+        try:
+            os.remove(self._file(account))
+        except OSError:
+            pass
+
+    def is_valid(self, session):
+        """Checks the session with one lightweight request instead of a browser page load."""
+        if not session or not any(cookie["name"] == "li_at" for cookie in session["cookies"]):
+            return False
+        headers = {}
+        if session.get("user_agent"):
+            headers["User-Agent"] = session["user_agent"]
+        cookies = {cookie["name"]: cookie["value"] for cookie in session["cookies"]}
+        try:
+            response = requests.get(VALIDATION_URL, cookies=cookies, headers=headers,
+                                    allow_redirects=False, timeout=self.validation_timeout)
+        except requests.RequestException:
+            return False
+        return response.status_code == 200
+
+    def restore(self, driver, session):
+        set_cookies(driver, session["cookies"])
+        if session.get("local_storage") and hasattr(driver, "execute_cdp_cmd"):
+            # Runs before the first page's own scripts, and is removed once that page has loaded.
+            result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": RESTORE_LOCAL_STORAGE_SCRIPT % json.dumps(session["local_storage"])
+            })
+            identifier = (result or {}).get("identifier")
+            if identifier is not None:
+                ratelimit.after_next_load(driver, lambda driver: _remove_restore_script(driver, identifier))
+
+    def restore_valid(self, driver, account):
+        """Restores the stored session for account into driver if it is still valid."""
+        session = self.load(account)
+        if not self.is_valid(session):
+            return False
+        self.restore(driver, session)
+        return True
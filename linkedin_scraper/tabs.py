@@ -0,0 +1,94 @@
+from selenium.common.exceptions import WebDriverException
+
+from . import ratelimit
+
+OPEN_TAB_SCRIPT = "window.open(arguments[0], '_blank');"
+
+
+class TabPipeline(object):
+    """Loads the next urls to visit in background tabs of the same browser.
+
+    While the current page is being parsed, up to `depth` upcoming urls load
+    in other tabs. Navigating to one of them then only switches to its tab
+    and closes the tab that was done with, unless it is the tab the pipeline
+    started from. Urls that were not prefetched load in the current tab as
+    usual. Background loads are paced by the rate limiter like any other
+    navigation. Closing the pipeline returns to the tab it started from.
+    """
+
+    def __init__(self, driver, depth=2, limiter=None):
+        self.driver = driver
+        self.depth = depth
+        self.limiter = limiter
+        self.prefetched = 0
+        self.hits = 0
+        self._queue = []
+        self._tabs = {}
+        self._origin = None
+
+    def _limiter(self):
+        return self.limiter or ratelimit.default_limiter
+
+    def prefetch(self, urls):
+        """Queues urls in the order they will be visited and starts loading the first `depth` of them."""
+        if self._origin is None:
+            self._origin = self.driver.current_window_handle
+        for url in urls:
+            if url not in self._tabs and url not in self._queue:
+                self._queue.append(url)
+        self._fill()
+
+    def _fill(self):
+        while self._queue and len(self._tabs) < self.depth:
+            url = self._queue.pop(0)
+            handle = self._open(url)
+            if handle is None:
+                # The browser didn't open a tab (e.g. a popup blocker), so stop trying.
+                self.depth = 0
+                self._queue = []
+                return
+            self._tabs[url] = handle
+
+    def _open(self, url):
+        handles = set(self.driver.window_handles)
+        self._limiter().acquire(url, ratelimit.account_for(self.driver))
+        self.driver.execute_script(OPEN_TAB_SCRIPT, url)
+        opened = [handle for handle in self.driver.window_handles if handle not in handles]
+        if not opened:
+            return None
+        self.prefetched += 1
+        return opened[0]
+
+    def navigate(self, url):
+        handle = self._tabs.pop(url, None)
+        if url in self._queue:
+            self._queue.remove(url)
+        if handle is None:
+            ratelimit.navigate(self.driver, url, self.limiter)
+        else:
+            if self.driver.current_window_handle != self._origin:
+                self.driver.close()
+            self.driver.switch_to.window(handle)
+            self.hits += 1
+            self._limiter().report(url, self.driver.current_url, ratelimit.account_for(self.driver))
+        self._fill()
+
+    def close(self):
+        """Closes the tabs the pipeline opened, visited or not, and switches back to the tab it started from."""
+        handles = list(self._tabs.values())
+        self._tabs = {}
+        self._queue = []
+        if self._origin is None:
+            return
+        try:
+            current = self.driver.current_window_handle
+            if current != self._origin:
+                handles.append(current)
+            for handle in handles:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except WebDriverException:
+                    pass
+        finally:
+            self.driver.switch_to.window(self._origin)
@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from linkedin_scraper import ratelimit
+from linkedin_scraper.replay import FixtureStore, ReplayDriver
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+PROFILE_URL = "https://www.linkedin.com/in/jane-doe/"
+COMPANY_ABOUT_URL = "https://www.linkedin.com/company/acme/about/"
+
+
+@pytest.fixture(autouse=True)
+def no_pacing(monkeypatch):
+    # Replayed pages don't touch the network, so they aren't paced.
+    monkeypatch.setattr(ratelimit, "default_limiter", ratelimit.NoLimit())
+
+
+@pytest.fixture
+def fixtures():
+    return FixtureStore(FIXTURE_DIR)
+
+
+@pytest.fixture
+def load_tree(fixtures):
+    """Loads a recorded page through a ReplayDriver and returns its lxml tree."""
+    driver = ReplayDriver(fixtures)
+
+    def load(url):
+        driver.get(url)
+        return driver.tree
+    return load
@@ -0,0 +1,28 @@
+import logging
+
+from linkedin_scraper import benchmark
+from linkedin_scraper.person import SECTION_PAGES
+
+from conftest import FIXTURE_DIR, PROFILE_URL
+
+
+def test_every_recorded_section_is_timed(fixtures, caplog):
+    with caplog.at_level(logging.WARNING, logger="linkedin_scraper.benchmark"):
+        results = benchmark.run(FIXTURE_DIR, repeat=1)
+    timed = {(result.entity, result.section) for result in results}
+    recorded = [section for section, page in SECTION_PAGES.items() if PROFILE_URL + page in fixtures]
+    assert len(recorded) >= 4
+    for section in recorded:
+        assert ("person", section) in timed
+    assert ("person", "top_card") in timed
+    assert ("company", "about_page") in timed
+    # Sections whose pages weren't recorded are reported, not dropped silently.
+    skipped = [record.getMessage() for record in caplog.records]
+    assert any("person certifications" in message for message in skipped)
+
+
+def test_classify():
+    assert benchmark.classify("https://www.linkedin.com/in/jane-doe/") == "person"
+    assert benchmark.classify("https://www.linkedin.com/in/jane-doe/details/skills/") is None
+    assert benchmark.classify("https://www.linkedin.com/company/acme/about/") == "company"
+    assert benchmark.entity_url("company", "https://www.linkedin.com/company/acme/about/") == "https://www.linkedin.com/company/acme/"
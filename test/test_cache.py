@@ -0,0 +1,99 @@
+import pytest
+
+from linkedin_scraper.cache import CachingDriver, PageCache
+from linkedin_scraper.replay import FixtureStore, ReplayDriver
+
+from conftest import PROFILE_URL
+
+PAGE = "<html><body><main><h1>%s</h1></main></body></html>"
+SEARCH_URL = "https://www.linkedin.com/search/results/people/?keywords=jane"
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = PageCache(str(tmp_path / "cache"), clock=clock)
+    yield cache
+    cache.close()
+
+
+def test_fresh_page_is_served(cache):
+    cache.put(PROFILE_URL + "?trk=x", PAGE % "Jane")
+    assert cache.get(PROFILE_URL) == (PAGE % "Jane", PROFILE_URL + "?trk=x")
+    assert cache.hits == 1
+
+
+def test_page_goes_stale_after_the_max_age_of_its_entity(cache, clock):
+    cache.max_ages.update(person=60, company=3600)
+    cache.put(PROFILE_URL, PAGE % "Jane")
+    cache.put("https://www.linkedin.com/company/acme/", PAGE % "Acme")
+    clock.now += 120
+    assert PROFILE_URL not in cache
+    assert "https://www.linkedin.com/company/acme/" in cache
+
+
+def test_identical_pages_are_stored_once(cache):
+    cache.put(PROFILE_URL, PAGE % "Jane")
+    size = cache.size()
+    cache.put("https://www.linkedin.com/in/jane-doe-2/", PAGE % "Jane")
+    assert cache.size() == size
+
+
+def test_least_recently_used_pages_are_evicted(cache, clock):
+    urls = ["https://www.linkedin.com/in/person-%d/" % i for i in range(3)]
+    for url in urls:
+        clock.now += 1
+        cache.put(url, PAGE % url)
+    cache.max_bytes = cache.size() - 1
+    clock.now += 1
+    assert cache.get(urls[0]) is not None
+    clock.now += 1
+    cache.put(urls[0], PAGE % urls[0])
+    assert urls[0] in cache
+    assert urls[1] not in cache
+    assert urls[2] in cache
+    assert cache.size() <= cache.max_bytes
+
+
+def test_blocked_page_is_never_served(cache):
+    cache.put(PROFILE_URL, PAGE % "Sign in", "https://www.linkedin.com/authwall?trk=x")
+    assert cache.get(PROFILE_URL) is None
+
+
+@pytest.fixture
+def live(tmp_path, fixtures):
+    # A live driver over the recorded corpus plus a search results page.
+    store = FixtureStore(str(tmp_path / "live"))
+    for url in fixtures.urls():
+        store.save(url, *fixtures.load(url))
+    store.save(SEARCH_URL, PAGE % "Results")
+    return ReplayDriver(store)
+
+
+def test_caching_driver_caches_entity_pages(cache, live):
+    driver = CachingDriver(live, cache)
+    driver.get(PROFILE_URL)
+    driver.get(PROFILE_URL + "details/skills/")
+    assert PROFILE_URL in cache
+    driver.get(PROFILE_URL)
+    assert live.pages_loaded == 2
+    assert "Jane Doe" in driver.page_source
+
+
+def test_caching_driver_does_not_cache_other_pages(cache, live):
+    driver = CachingDriver(live, cache)
+    driver.get(SEARCH_URL)
+    driver.get(PROFILE_URL)
+    assert SEARCH_URL not in cache
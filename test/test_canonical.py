@@ -0,0 +1,39 @@
+import pytest
+
+from linkedin_scraper.canonical import canonical_url, entity_key, entity_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/in/Jane-Doe?trk=pub-pbmap", "https://www.linkedin.com/in/jane-doe/"),
+    ("http://de.linkedin.com/in/jane-doe/#experience", "https://www.linkedin.com/in/jane-doe/"),
+    ("https://linkedin.com//company/Acme/about", "https://www.linkedin.com/company/acme/about/"),
+    ("https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3861234567/?refId=x",
+     "https://www.linkedin.com/jobs/view/3861234567/"),
+    ("https://www.linkedin.com/jobs/collections/recommended/?currentJobId=3861234567",
+     "https://www.linkedin.com/jobs/view/3861234567/"),
+    ("https://www.linkedin.com/jobs/search/?trk=x&location=Berlin&keywords=python",
+     "https://www.linkedin.com/jobs/search/?keywords=python&location=Berlin"),
+])
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_canonical_url_is_idempotent():
+    url = canonical_url("https://www.linkedin.com/in/J%C3%BCrgen/details/skills")
+    assert canonical_url(url) == url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.linkedin.com/in/Jane-Doe/details/experience/", "person:jane-doe"),
+    ("https://www.linkedin.com/company/acme/people/", "company:acme"),
+    ("https://www.linkedin.com/school/tu-berlin/", "company:tu-berlin"),
+    ("https://www.linkedin.com/jobs/view/3861234567", "job:3861234567"),
+    ("https://www.linkedin.com/feed/", None),
+])
+def test_entity_key(url, expected):
+    assert entity_key(url) == expected
+
+
+def test_entity_url():
+    assert entity_url("https://www.linkedin.com/in/jane-doe/details/skills/") == "https://www.linkedin.com/in/jane-doe/"
+    assert entity_url("https://www.linkedin.com/feed") == "https://www.linkedin.com/feed/"
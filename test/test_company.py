@@ -0,0 +1,84 @@
+from lxml import html
+from selenium.common.exceptions import StaleElementReferenceException
+
+from linkedin_scraper.company import Company
+from linkedin_scraper.replay import ReplayDriver, ReplayElement
+
+COMPANY_URL = "https://www.linkedin.com/company/acme/"
+NEXT = '<button aria-label="Next">Next</button>'
+
+
+def people_page(names, next_button=True):
+    items = "".join(
+        '<li><div>%s</div><div>1st</div><div>Connect</div><div>Engineer at Acme</div>'
+        '<a href="https://www.linkedin.com/in/%s/">Profile</a></li>' % (name, name.lower())
+        for name in names
+    )
+    return ('<html><body><main><h2>People you may know</h2><ul class="list-style-none">%s</ul>%s</main></body></html>'
+            % (items, NEXT if next_button else ""))
+
+
+class PagedElement(ReplayElement):
+    """An element of one page of results, stale once the driver moved on to the next page."""
+
+    def __init__(self, elem, parent):
+        super().__init__(elem, parent)
+        self.page = parent.page
+
+    def _check(self):
+        if self.parent.page != self.page:
+            raise StaleElementReferenceException("The list re-rendered")
+
+    def is_enabled(self):
+        self._check()
+        return super().is_enabled()
+
+    def find_elements(self, by="id", value=None):
+        self._check()
+        return [PagedElement(element.elem, self.parent) for element in super().find_elements(by, value)]
+
+    def click(self):
+        self._check()
+        if self.tag_name == "button":
+            self.parent.show(self.parent.page + 1)
+
+
+class PagedDriver(ReplayDriver):
+    """Serves the people page of a company, whose "Next" button renders the next page of results in place."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.page = 0
+        super().__init__(self)
+
+    def load(self, url):
+        return self.pages[0], url
+
+    def show(self, page):
+        self.page = page
+        self.page_source = self.pages[page]
+        self.tree = html.fromstring(self.page_source)
+
+    def get(self, url):
+        self.current_url = url
+        self.show(0)
+
+    def find_elements(self, by="id", value=None):
+        return PagedElement(self.tree, self).find_elements(by, value)
+
+
+def test_iter_employees_goes_through_every_page():
+    driver = PagedDriver([people_page(["Ann", "Bob"]), people_page(["Cid", "Bob"]), people_page(["Dee"], False)])
+    company = Company(COMPANY_URL, driver=driver, scrape=False)
+    employees = list(company.iter_employees(wait_time=1))
+    assert [employee["name"] for employee in employees] == ["Ann", "Bob", "Cid", "Dee"]
+    assert employees[0] == {"name": "Ann", "designation": "Engineer at Acme", "linkedin_url": "https://www.linkedin.com/in/ann/"}
+    assert company.employee_cursor == 5
+
+
+def test_iter_employees_resumes_from_a_cursor():
+    driver = PagedDriver([people_page(["Ann", "Bob"]), people_page(["Cid", "Dee"], False)])
+    company = Company(COMPANY_URL, driver=driver, scrape=False)
+    assert [employee["name"] for employee in company.iter_employees(limit=3, wait_time=1)] == ["Ann", "Bob", "Cid"]
+    cursor = company.employee_cursor
+    assert [employee["name"] for employee in company.iter_employees(cursor=cursor, wait_time=1)] == ["Dee"]
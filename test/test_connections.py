@@ -0,0 +1,75 @@
+import json
+
+from lxml import html
+
+from linkedin_scraper.connections import CONNECTIONS_URL, ConnectionsCrawler
+from linkedin_scraper.replay import ReplayDriver
+
+CARD = (
+    "<li class='mn-connection-card'><a class='mn-connection-card__link' href='/in/{0}/'></a>"
+    "<div class='mn-connection-card__details'><span class='mn-connection-card__name'>{0}</span>"
+    "<span class='mn-connection-card__occupation'>Engineer</span></div></li>"
+)
+
+
+class ScrollingDriver(ReplayDriver):
+    """A ReplayDriver whose connections list grows by the next batch of cards each time the page scrolls to the bottom."""
+
+    def __init__(self, batches):
+        self.batches = [list(batch) for batch in batches]
+        super().__init__(self)
+        self.scrolls = 0
+
+    def load(self, url):
+        cards = "".join(CARD.format(name) for name in self.batches.pop(0))
+        return "<html><body><ul class='mn-connections'>%s</ul></body></html>" % cards, url
+
+    def execute_script(self, script, *args):
+        if "scrollHeight" in script:
+            self.scrolls += 1
+            if self.batches:
+                connections = self.tree.find_class("mn-connections")[0]
+                for name in self.batches.pop(0):
+                    connections.append(html.fragment_fromstring(CARD.format(name)))
+            return None
+        return super().execute_script(script, *args)
+
+
+BATCHES = [["ada", "bob", "cy"], ["cy", "dee", "eve"], ["fay", "gus"]]
+
+
+def crawler(batches=BATCHES, **kwargs):
+    return ConnectionsCrawler(ScrollingDriver(batches), stable_rounds=1, wait_time=5, **kwargs)
+
+
+def test_crawl_streams_each_connection_once():
+    contacts = list(crawler().crawl())
+    assert [contact.name for contact in contacts] == ["ada", "bob", "cy", "dee", "eve", "fay", "gus"]
+    assert contacts[0].url == "https://www.linkedin.com/in/ada/"
+    assert contacts[0].occupation == "Engineer"
+
+
+def test_crawl_resumes_from_the_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "connections.json")
+    first = crawler(checkpoint=checkpoint)
+    assert [contact.name for contact in first.crawl(limit=4)] == ["ada", "bob", "cy", "dee"]
+    with open(checkpoint) as f:
+        assert json.load(f)["position"] == 5
+
+    second = crawler(checkpoint=checkpoint)
+    assert [contact.name for contact in second.crawl()] == ["eve", "fay", "gus"]
+
+
+def test_checkpoint_keeps_a_bounded_window_of_recent_keys(tmp_path):
+    checkpoint = str(tmp_path / "connections.json")
+    list(crawler(checkpoint=checkpoint, recent_window=2).crawl())
+    with open(checkpoint) as f:
+        state = json.load(f)
+    assert state["position"] == 8
+    assert len(state["recent"]) == 2
+
+
+def test_empty_connections_list():
+    driver = ScrollingDriver([[]])
+    assert list(ConnectionsCrawler(driver, stable_rounds=1, wait_time=2).crawl()) == []
+    assert driver.current_url == CONNECTIONS_URL
@@ -0,0 +1,81 @@
+import csv
+import json
+
+import pytest
+
+from linkedin_scraper.export import CSVSink, JSONLSink, ParquetSink, export, open_sink
+from linkedin_scraper.objects import Skill
+
+SKILLS = [Skill(name="Python", endorsements=12), Skill(name="Web Scraping", endorsements=0)]
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_export_jsonl(tmp_path):
+    path = str(tmp_path / "skills.jsonl")
+    assert export(SKILLS, path, Skill, batch_size=1) == 2
+    assert read_jsonl(path) == [{"name": "Python", "endorsements": 12}, {"name": "Web Scraping", "endorsements": 0}]
+
+
+def test_records_are_written_in_batches(tmp_path):
+    path = str(tmp_path / "skills.jsonl")
+    with JSONLSink(path, Skill, batch_size=2) as sink:
+        sink.write(SKILLS[0])
+        assert read_jsonl(path) == []
+        sink.write(SKILLS[1])
+        assert len(read_jsonl(path)) == 2
+
+
+def test_store_is_on_disk_before_it_returns(tmp_path):
+    path = str(tmp_path / "skills.jsonl")
+    sink = JSONLSink(path, Skill, batch_size=100)
+    assert sink.store("https://www.linkedin.com/in/jane-doe/", "person", SKILLS[0]) == path + ":1"
+    assert read_jsonl(path) == [{"name": "Python", "endorsements": 12}]
+    sink.close()
+
+
+def test_csv_appends_with_one_header(tmp_path):
+    path = str(tmp_path / "skills.csv")
+    export(SKILLS[:1], path, Skill)
+    export(SKILLS[1:], path, Skill)
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["name"] for row in rows] == ["Python", "Web Scraping"]
+
+
+def test_csv_writes_nested_values_as_json(tmp_path):
+    path = str(tmp_path / "people.csv")
+    with CSVSink(path) as sink:
+        sink.write({"name": "Jane Doe", "skills": SKILLS})
+    with open(path, newline="") as f:
+        [row] = list(csv.DictReader(f))
+    assert json.loads(row["skills"])[0] == {"name": "Python", "endorsements": 12}
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        open_sink(str(tmp_path / "skills.xml"))
+
+
+def test_parquet_never_overwrites_earlier_results(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "skills.parquet")
+    export(SKILLS[:1], path, Skill)
+    with ParquetSink(path, Skill) as sink:
+        sink.write(SKILLS[1])
+    assert sink.paths == [str(tmp_path / "skills.1.parquet")]
+    assert pq.read_table(path).to_pylist() == [{"name": "Python", "endorsements": 12}]
+    assert pq.read_table(sink.paths[0]).to_pylist() == [{"name": "Web Scraping", "endorsements": 0}]
+
+
+def test_parquet_store_closes_a_readable_part_per_record(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "skills.parquet")
+    sink = ParquetSink(path, Skill)
+    pointers = [sink.store("https://www.linkedin.com/in/jane-doe/", "person", skill) for skill in SKILLS]
+    assert [pointer.rsplit(":", 1)[0] for pointer in pointers] == sink.paths
+    assert pq.read_table(sink.paths[1]).to_pylist() == [{"name": "Web Scraping", "endorsements": 0}]
+    sink.close()
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from linkedin_scraper.frontier import CrawlFrontier, DONE, FAILED, IN_PROGRESS, PENDING
+
+PROFILE = "https://www.linkedin.com/in/jane-doe/"
+COMPANY = "https://www.linkedin.com/company/acme/"
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.db"), lease=60, max_attempts=2)
+    yield frontier
+    frontier.close()
+
+
+def test_add_canonicalises_and_deduplicates(frontier):
+    assert frontier.add([PROFILE, "https://linkedin.com/in/Jane-Doe?trk=x", COMPANY], "person") == 2
+    assert frontier.add([PROFILE], "person") == 0
+    assert frontier.counts() == {PENDING: 2}
+
+
+def test_claim_in_order_and_by_kind(frontier):
+    frontier.add([PROFILE], "person")
+    frontier.add([COMPANY], "company")
+    assert frontier.claim("w1", kinds=["company"]) == (COMPANY, "company")
+    assert frontier.claim("w1") == (PROFILE, "person")
+    assert frontier.claim("w1") is None
+    assert frontier.status(PROFILE)["status"] == IN_PROGRESS
+
+
+def test_claimed_item_is_not_handed_out_again_within_its_lease(frontier):
+    frontier.add([PROFILE], "person")
+    assert frontier.claim("w1") is not None
+    assert frontier.claim("w2") is None
+
+
+def test_expired_lease_is_claimed_again(frontier):
+    frontier.lease = 0.01
+    frontier.add([PROFILE], "person")
+    frontier.claim("w1")
+    time.sleep(0.02)
+    assert frontier.claim("w2") == (PROFILE, "person")
+    assert frontier.status(PROFILE)["attempts"] == 2
+
+
+def test_expired_lease_on_the_last_attempt_is_failed(frontier):
+    frontier.lease = 0.01
+    frontier.add([PROFILE], "person")
+    frontier.claim("w1")
+    time.sleep(0.02)
+    frontier.claim("w2")
+    time.sleep(0.02)
+    assert frontier.claim("w3") is None
+    status = frontier.status(PROFILE)
+    assert status["status"] == FAILED
+    assert status["last_error"] == "Lease expired on the last attempt"
+
+
+def test_failed_item_is_retried_until_max_attempts(frontier):
+    frontier.add([PROFILE], "person")
+    frontier.claim("w1")
+    frontier.fail(PROFILE, "boom")
+    assert frontier.claim("w1") == (PROFILE, "person")
+    frontier.fail(PROFILE, "boom again")
+    assert frontier.claim("w1") is None
+    assert frontier.status(PROFILE) == {"status": FAILED, "attempts": 2, "last_error": "boom again", "result": None}
+
+
+def test_completed_item_keeps_its_result(frontier):
+    frontier.add([PROFILE], "person")
+    url, _ = frontier.claim("w1")
+    frontier.complete(url, frontier.store_result(url, {"name": "Jane Doe"}))
+    assert frontier.claim("w1") is None
+    status = frontier.status(PROFILE)
+    assert status["status"] == DONE
+    assert frontier.load_result(status["result"]) == {"name": "Jane Doe"}
+
+
+def test_resumes_after_restart(tmp_path):
+    path = str(tmp_path / "frontier.db")
+    frontier = CrawlFrontier(path)
+    frontier.add([PROFILE, COMPANY], "person")
+    url, _ = frontier.claim("w1")
+    frontier.complete(url)
+    frontier.close()
+
+    frontier = CrawlFrontier(path)
+    assert frontier.claim("w1") == (COMPANY, "person")
+    assert frontier.claim("w1") is None
+    frontier.close()
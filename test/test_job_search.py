@@ -0,0 +1,49 @@
+import pytest
+
+from linkedin_scraper.canonical import SeenIndex
+from linkedin_scraper.job_search import JobSearch, job_id
+from linkedin_scraper.replay import ReplayDriver
+
+
+@pytest.fixture
+def job_search(fixtures):
+    job_search = JobSearch(ReplayDriver(fixtures), scrape=False)
+    job_search.WAIT_FOR_ELEMENT_TIMEOUT = 1
+    return job_search
+
+
+def ids(jobs):
+    return [job_id(job.linkedin_url) for job in jobs]
+
+
+def test_search_url():
+    job_search = JobSearch(None, scrape=False)
+    assert job_search.search_url("python", {"location": "Berlin", "date_posted": "week", "remote": ["remote", "hybrid"]},
+                                 start=25) == (
+        "https://www.linkedin.com/jobs/search?keywords=python&location=Berlin&f_TPR=r604800&f_WT=2%2C3&start=25&refresh=true"
+    )
+    with pytest.raises(ValueError):
+        job_search.search_url("python", {"salary": "100k"})
+
+
+def test_iter_search_follows_pages_and_drops_repeats(job_search):
+    jobs = list(job_search.iter_search("python", {"location": "Berlin"}))
+    assert ids(jobs) == ["3861234501", "3861234502", "3861234503", "3861234504"]
+    assert jobs[0].job_title == "Python Engineer"
+    assert jobs[0].company == "Acme Corp"
+    # Stopped at the third page, which had nothing new.
+    assert job_search.driver.pages_loaded == 3
+
+
+def test_iter_search_stops_after_max_pages(job_search):
+    assert ids(job_search.iter_search("python", {"location": "Berlin"}, max_pages=1)) == [
+        "3861234501", "3861234502", "3861234503",
+    ]
+
+
+def test_iter_search_skips_seen_jobs(job_search, tmp_path):
+    seen = SeenIndex(str(tmp_path / "seen.db"))
+    seen.add("https://www.linkedin.com/jobs/view/3861234502/")
+    assert ids(job_search.iter_search("python", {"location": "Berlin"}, seen=seen)) == [
+        "3861234501", "3861234503", "3861234504",
+    ]
@@ -0,0 +1,96 @@
+from lxml import html
+
+from linkedin_scraper import parsers
+from linkedin_scraper.replay import FixtureStore
+
+from conftest import COMPANY_ABOUT_URL, FIXTURE_DIR, PROFILE_URL
+
+
+def test_parse_experiences(load_tree):
+    experiences = parsers.parse_experiences(load_tree(PROFILE_URL + "details/experience/"))
+    assert [e.position_title for e in experiences] == ["Senior Engineer", "Engineer"]
+    current, previous = experiences
+    assert current.institution_name == "Acme Corp · Full-time"
+    assert current.linkedin_url == "https://www.linkedin.com/company/acme/"
+    assert (current.from_date, current.to_date, current.duration) == ("Jan 2020", "Present", "4 yrs 9 mos")
+    assert current.location == "Berlin, Germany"
+    assert current.description == "Leads the crawling platform."
+    assert (previous.from_date, previous.to_date, previous.location) == ("Mar 2016", "Dec 2019", "")
+
+
+def test_parse_educations(load_tree):
+    [education] = parsers.parse_educations(load_tree(PROFILE_URL + "details/education/"))
+    assert education.institution_name == "Technische Universität Berlin"
+    assert education.degree == "Master of Science - MS, Computer Science"
+    assert (education.from_date, education.to_date) == ("2014", "2016")
+    assert education.linkedin_url == "https://www.linkedin.com/school/tu-berlin/"
+
+
+def test_parse_skills(load_tree):
+    skills = parsers.parse_skills(load_tree(PROFILE_URL + "details/skills/"))
+    assert [(skill.name, skill.endorsements) for skill in skills] == [("Python", 12), ("Web Scraping", 0)]
+
+
+def test_parse_languages(load_tree):
+    languages = parsers.parse_languages(load_tree(PROFILE_URL + "details/languages/"))
+    assert [(language.name, language.proficiency) for language in languages] == [
+        ("English", "Native or bilingual proficiency"),
+        ("German", "Professional working proficiency"),
+    ]
+
+
+def test_parsers_return_none_before_the_page_loads():
+    tree = html.fromstring("<html><body><div>Loading</div></body></html>")
+    assert parsers.parse_experiences(tree) is None
+    assert parsers.parse_skills(tree) is None
+    assert parsers.parse_languages(tree) is None
+    assert parsers.parse_company_about(tree) is None
+
+
+def test_text_skips_hidden_elements():
+    elem = html.fromstring('<div><span aria-hidden="true">Python</span><span class="visually-hidden">Python</span>'
+                           '<script>var x;</script></div>')
+    assert parsers.text(elem) == "Python"
+
+
+
+def test_parse_profile_sections(load_tree):
+    sections = parsers.parse_profile_sections(load_tree(PROFILE_URL))
+    assert sections["about"] == "I build crawlers."
+    assert sections["experiences"].split("\n") == [
+        "3",
+        "Senior Engineer | Acme Corp · Full-time | Jan 2020 - Present",
+        "Engineer | Initech · Full-time | Mar 2016 - Dec 2019",
+    ]
+    assert sections["skills"].split("\n") == ["2", "Python", "Web Scraping"]
+    assert "connections" not in sections["top_card"]
+    assert sections["languages"] is None
+
+
+def test_profile_sections_ignore_relative_durations_and_counts():
+    # The page_source snapshot was taken a month before the rendered DOM, with fewer connections.
+    store = FixtureStore(FIXTURE_DIR)
+    earlier, later = (
+        parsers.parse_profile_sections(html.fromstring(store.load(PROFILE_URL, kind)[0]))
+        for kind in ("page_source", "rendered_dom")
+    )
+    assert earlier == later
+
+
+def test_strip_durations():
+    assert parsers.strip_durations("Jan 2020 - Present · 3 yrs 2 mos") == "Jan 2020 - Present"
+    assert parsers.strip_durations("Mar 2016 - Dec 2019") == "Mar 2016 - Dec 2019"
+
+
+def test_parse_company_about(load_tree):
+    about = parsers.parse_company_about(load_tree(COMPANY_ABOUT_URL))
+    assert about["name"] == "Acme Corp"
+    assert about["about_us"] == "Acme makes everything."
+    assert about["industry"] == "Manufacturing"
+    assert about["specialties"] == "Anvils\nRockets\nMagnets"
+    # The "associated members" link has no count, so the headcount comes from the next selector version.
+    assert about["headcount"] == 14436
+    assert about["showcase_pages"] == [{
+        "linkedin_url": "https://www.linkedin.com/showcase/acme-labs/", "name": "Acme Labs", "followers": "1,024 followers",
+    }]
+    assert [company["name"] for company in about["affiliated_companies"]] == ["Acme Logistics"]
@@ -0,0 +1,55 @@
+import pytest
+
+from linkedin_scraper.person import Person
+from linkedin_scraper.pool import DriverPool, scrape_people
+from linkedin_scraper.replay import ReplayDriver
+
+from conftest import PROFILE_URL
+
+
+@pytest.fixture
+def pool(fixtures):
+    with DriverPool(size=1, driver_factory=lambda: ReplayDriver(fixtures)) as pool:
+        yield pool
+
+
+def test_scraped_people_are_detached_from_the_pool(pool):
+    [person] = scrape_people([PROFILE_URL], concurrency=1, pool=pool, sections=["experiences"])
+    assert person.driver is None
+    assert [experience.position_title for experience in person.experiences] == ["Senior Engineer", "Engineer"]
+    pages = pool._drivers[0].pages
+    # Sections that weren't requested stay empty rather than loading a page on a driver that went back to the pool.
+    assert person.skills == []
+    assert pool._drivers[0].pages == pages
+
+
+def test_pending_section_without_a_driver_raises(fixtures):
+    person = Person(PROFILE_URL, driver=ReplayDriver(fixtures), sections=["experiences"], close_on_complete=False)
+    assert [skill.name for skill in person.skills] == ["Python", "Web Scraping"]
+    person.driver = None
+    with pytest.raises(RuntimeError, match="languages"):
+        person.languages
+
+
+def test_failed_launch_quits_the_drivers_already_launched(fixtures):
+    launched = []
+
+    class Driver(ReplayDriver):
+        def quit(self):
+            launched.remove(self)
+
+    def factory():
+        if len(launched) == 2:
+            raise RuntimeError("Chrome failed to start")
+        launched.append(Driver(fixtures))
+        return launched[-1]
+
+    with pytest.raises(RuntimeError, match="Chrome failed to start"):
+        DriverPool(size=3, driver_factory=factory)
+    assert launched == []
+
+
+def test_failed_profile_is_logged(pool, caplog):
+    url = "https://www.linkedin.com/in/not-recorded/"
+    assert scrape_people([url], concurrency=1, pool=pool, retries=0) == [None]
+    assert url in caplog.text
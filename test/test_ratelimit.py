@@ -0,0 +1,29 @@
+import pytest
+
+from linkedin_scraper.ratelimit import BLOCKED_URL, is_blocked
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/checkpoint/challenge/AgF",
+    "https://www.linkedin.com/authwall?trk=x",
+    "https://www.linkedin.com/uas/login?session_redirect=%2Fin%2Fjane-doe",
+    "https://www.linkedin.com/login",
+])
+def test_is_blocked(url):
+    assert is_blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/in/login-expert/",
+    "https://www.linkedin.com/company/checkpoint-software/",
+    "https://www.linkedin.com/jobs/search/?keywords=authwall",
+    "https://www.linkedin.com/loginhelp/",
+    None,
+])
+def test_is_not_blocked(url):
+    assert not is_blocked(url)
+
+
+def test_blocked_url_matches_paths_only():
+    assert BLOCKED_URL.match("/checkpoint/lg/login")
+    assert not BLOCKED_URL.match("https://www.linkedin.com/checkpoint/")
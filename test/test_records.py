@@ -0,0 +1,48 @@
+import pickle
+import sys
+
+import pytest
+
+from linkedin_scraper import parsers
+
+from conftest import PROFILE_URL
+
+records = pytest.importorskip("linkedin_scraper.records", reason="records needs Python 3.10")
+
+
+@pytest.fixture
+def experiences(load_tree):
+    return parsers.parse_experiences(load_tree(PROFILE_URL + "details/experience/"))
+
+
+def test_compact_and_expand_round_trip(experiences):
+    for experience in experiences:
+        record = records.compact(experience)
+        assert isinstance(record, records.ExperienceRecord)
+        assert not hasattr(record, "__dict__")
+        assert records.expand(record) == experience
+
+
+def test_compact_keeps_only_the_scraped_fields(experiences):
+    record = records.compact(experiences[0])
+    assert not hasattr(record, "industry")
+    assert record.to_dict()["position_title"] == "Senior Engineer"
+
+
+def test_repeated_strings_are_interned(experiences):
+    location = "".join(["Berlin, ", "Germany"])
+    experiences[0].location = location
+    record = records.compact(experiences[0])
+    assert record.location is sys.intern("Berlin, Germany")
+
+
+def test_frozen_records_are_hashable_and_pickle(experiences):
+    keys = {records.compact(experience, frozen=True) for experience in experiences + experiences}
+    assert len(keys) == 2
+    for key in keys:
+        assert pickle.loads(pickle.dumps(key)) == key
+
+
+def test_skill_records_round_trip(load_tree):
+    [skill, _] = parsers.parse_skills(load_tree(PROFILE_URL + "details/skills/"))
+    assert records.expand(records.compact(skill)) == skill
@@ -0,0 +1,61 @@
+from linkedin_scraper.replay import FixtureStore, RecordingDriver, ReplayDriver
+
+from conftest import PROFILE_URL
+
+
+class LiveDriver(object):
+    """The part of a live WebDriver that RecordingDriver reads, serving fixed pages."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.current_url = None
+
+    def get(self, url):
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return self.pages[self.current_url][0]
+
+    def execute_script(self, script, *args):
+        return self.pages[self.current_url][1]
+
+    def close(self):
+        pass
+
+
+def test_replay_prefers_the_rendered_dom(fixtures):
+    assert fixtures.kinds(PROFILE_URL) == ["rendered_dom", "page_source"]
+    driver = ReplayDriver(fixtures)
+    driver.get(PROFILE_URL)
+    assert driver.page_source == fixtures.load(PROFILE_URL, "rendered_dom")[0]
+    assert driver.find_element("tag name", "h1").text == "Jane Doe"
+
+
+def test_recording_keeps_page_source_and_rendered_dom_apart(tmp_path):
+    url = "https://www.linkedin.com/in/jane-doe/"
+    live = LiveDriver({url: ("<html><body>source</body></html>", "<html><body>rendered</body></html>")})
+    driver = RecordingDriver(live, str(tmp_path))
+    driver.get(url)
+    assert driver.page_source == "<html><body>source</body></html>"
+    driver.close()
+
+    store = FixtureStore(str(tmp_path))
+    assert store.load(url, "page_source")[0] == "<html><body>source</body></html>"
+    assert store.load(url, "rendered_dom")[0] == "<html><body>rendered</body></html>"
+    assert store.load(url)[0] == "<html><body>rendered</body></html>"
+
+
+def test_reads_indexes_with_one_snapshot_per_url(tmp_path):
+    (tmp_path / "page.html").write_text("<html><body>old</body></html>")
+    (tmp_path / "index.json").write_text(
+        '{"https://www.linkedin.com/feed/": {"file": "page.html", "current_url": "https://www.linkedin.com/feed/", '
+        '"kind": "page_source"}}'
+    )
+    store = FixtureStore(str(tmp_path))
+    assert store.load("https://www.linkedin.com/feed/") == ("<html><body>old</body></html>", "https://www.linkedin.com/feed/")
+
+
+def test_lookup_ignores_the_trailing_slash(fixtures):
+    assert PROFILE_URL + "details/skills" in fixtures
+    assert fixtures.load(PROFILE_URL + "details/skills") == fixtures.load(PROFILE_URL + "details/skills/")
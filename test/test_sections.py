@@ -0,0 +1,79 @@
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+
+from linkedin_scraper.objects import SECTION_OK, SECTION_PARSE_ERROR, SECTION_SESSION_ERROR, SECTION_TIMEOUT
+from linkedin_scraper.person import Person
+from linkedin_scraper.replay import ReplayDriver
+
+from conftest import PROFILE_URL
+
+
+def flaky_person(fixtures, failures, **kwargs):
+    """A Person whose skills and languages raise the queued errors after scraping, as a section failing halfway would."""
+    def fail(section):
+        if failures.get(section):
+            raise failures[section].pop(0)
+
+    class FlakyPerson(Person):
+        def get_skills(self):
+            super().get_skills()
+            fail("skills")
+
+        def get_languages(self):
+            super().get_languages()
+            fail("languages")
+
+    return FlakyPerson(PROFILE_URL, driver=ReplayDriver(fixtures), close_on_complete=False, **kwargs)
+
+
+def test_retry_discards_the_partial_results(fixtures):
+    person = flaky_person(fixtures, {"skills": [ValueError("half a page")]}, sections=["skills"])
+    status = person.section_status["skills"]
+    assert (status.status, status.attempts, status.items) == (SECTION_OK, 2, 2)
+    assert [skill.name for skill in person.skills] == ["Python", "Web Scraping"]
+    assert person.failed_sections == []
+
+
+def test_timeouts_are_retried(fixtures):
+    person = flaky_person(fixtures, {"skills": [TimeoutException()]}, sections=["skills"])
+    assert (person.section_status["skills"].status, person.section_status["skills"].attempts) == (SECTION_OK, 2)
+
+
+def test_section_retries_limit_the_attempts(fixtures):
+    errors = [ValueError("broken")] * 5
+    person = flaky_person(fixtures, {"skills": list(errors)}, sections=["skills"], section_retries=2)
+    status = person.section_status["skills"]
+    assert (status.status, status.attempts) == (SECTION_PARSE_ERROR, 3)
+    assert "broken" in status.error
+    assert person.failed_sections == ["skills"]
+
+
+def test_retry_budget_is_shared_by_the_sections(fixtures):
+    person = flaky_person(
+        fixtures,
+        {"skills": [ValueError("broken")], "languages": [ValueError("broken")]},
+        sections=["skills", "languages"],
+        retry_budget=1,
+    )
+    assert (person.section_status["skills"].status, person.section_status["skills"].attempts) == (SECTION_OK, 2)
+    assert (person.section_status["languages"].status, person.section_status["languages"].attempts) == (
+        SECTION_PARSE_ERROR, 1,
+    )
+    assert person.failed_sections == ["languages"]
+
+
+def test_retry_returns_the_budget_left(fixtures):
+    person = flaky_person(fixtures, {"skills": [ValueError("broken")] * 5}, sections=[])
+    person.run_section("skills")
+    assert person.retry_failed_sections(["skills"], budget=3) == 2
+    assert person.section_status["skills"].attempts == 2
+
+
+def test_session_errors_are_raised_and_not_retried(fixtures):
+    person = flaky_person(fixtures, {"skills": [InvalidSessionIdException("gone")]}, sections=[])
+    with pytest.raises(InvalidSessionIdException):
+        person.run_section("skills")
+    status = person.section_status["skills"]
+    assert status.status == SECTION_SESSION_ERROR
+    assert person.retry_failed_sections(["skills"], budget=3) == 3
+    assert status.attempts == 1
@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+
+import pytest
+from lxml import html
+
+from linkedin_scraper.selectors import DEFAULT_PATH, SelectorRegistry
+
+TREE = html.fromstring(
+    "<html><body><main><h1 class='title'>Acme Corp</h1><p>Makes everything.</p>"
+    "<a>See all associated members</a><dd>14,436 associated members</dd></main></body></html>"
+)
+
+
+def write(path, definitions):
+    with open(path, "w") as f:
+        json.dump(definitions, f)
+    # Make sure the change is seen even on filesystems with a coarse mtime.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def override(tmp_path):
+    path = str(tmp_path / "selectors.json")
+    write(path, {"test.title": [
+        {"version": "old", "by": "class name", "value": "old-title"},
+        {"version": "new", "by": "class name", "value": "title"},
+        {"version": "any", "by": "tag name", "value": "h1", "fallback": True},
+    ]})
+    return path
+
+
+def test_versions_keep_file_order(override):
+    registry = SelectorRegistry([override])
+    assert [selector.version for selector in registry.versions("test.title")] == ["old", "new", "any"]
+
+
+def test_matching_version_moves_to_the_front(override):
+    registry = SelectorRegistry([override])
+    assert registry.find_first(TREE, "test.title").text == "Acme Corp"
+    assert [selector.version for selector in registry.versions("test.title")] == ["new", "old", "any"]
+    assert registry.hits[("test.title", "new")] == 1
+
+
+def test_fallback_stays_last(override):
+    registry = SelectorRegistry([override])
+    tree = html.fromstring("<html><body><h1>Acme Corp</h1></body></html>")
+    assert registry.find_first(tree, "test.title") is not None
+    assert [selector.version for selector in registry.versions("test.title")] == ["old", "new", "any"]
+
+
+def test_unknown_key():
+    with pytest.raises(KeyError):
+        SelectorRegistry([DEFAULT_PATH]).versions("test.missing")
+
+
+def test_later_files_replace_keys(override):
+    registry = SelectorRegistry([DEFAULT_PATH, override])
+    assert registry.versions("test.title")
+    assert registry.versions("company.name")
+
+
+def test_reload_keeps_the_learned_order(override):
+    registry = SelectorRegistry([override], check_interval=0)
+    registry.find(TREE, "test.title")
+    # Versions that matched before keep their place ahead of newly added ones.
+    with open(override) as f:
+        definitions = json.load(f)
+    definitions["test.title"].insert(0, {"version": "newest", "by": "class name", "value": "newest-title"})
+    write(override, definitions)
+    assert [selector.version for selector in registry.versions("test.title")] == ["new", "old", "newest", "any"]
+
+
+def test_reload_is_throttled(override):
+    registry = SelectorRegistry([override], check_interval=3600)
+    write(override, {"test.other": [{"version": "v1", "by": "tag name", "value": "p"}]})
+    assert not registry.reload_if_changed()
+    assert registry.versions("test.title")
+
+
+@pytest.mark.parametrize("contents", [
+    "{not json",
+    json.dumps({"test.title": [{"version": "broken", "by": "xpath", "value": "//h1["}]}),
+    json.dumps({"test.title": [{"version": "missing-value", "by": "xpath"}]}),
+])
+def test_bad_reload_keeps_the_previous_selectors(override, contents, caplog):
+    registry = SelectorRegistry([DEFAULT_PATH, override], check_interval=0)
+    with open(override, "w") as f:
+        f.write(contents)
+    stat = os.stat(override)
+    os.utime(override, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    with caplog.at_level(logging.WARNING, logger="linkedin_scraper.selectors"):
+        assert not registry.reload_if_changed()
+        assert [selector.version for selector in registry.versions("test.title")] == ["old", "new", "any"]
+    assert registry.versions("company.name")
+    assert len(caplog.records) == 1
+
+
+def test_bad_file_on_first_load_keeps_the_packaged_selectors(tmp_path):
+    path = str(tmp_path / "selectors.json")
+    with open(path, "w") as f:
+        f.write("{not json")
+    registry = SelectorRegistry([DEFAULT_PATH, path])
+    assert registry.versions("company.name")
+
+
+def test_accept_falls_through_to_the_next_version():
+    registry = SelectorRegistry([DEFAULT_PATH])
+    members = registry.find(TREE, "company.associated_members", lambda elem: "14,436" in elem.text_content())
+    assert [elem.tag for elem in members] == ["dd"]
+    assert registry.versions("company.associated_members")[0].version == "2024-dd"
@@ -0,0 +1,73 @@
+from linkedin_scraper import actions, ratelimit
+from linkedin_scraper.replay import ReplayDriver
+from linkedin_scraper.session import SessionStore
+
+from conftest import PROFILE_URL
+
+SESSION = {
+    "cookies": [{"name": "li_at", "value": "token", "domain": ".linkedin.com"}],
+    "local_storage": {"voyager-web:badges": "[]"},
+}
+
+
+class CdpDriver(ReplayDriver):
+    """A ReplayDriver that records the CDP commands sent to it."""
+
+    def __init__(self, fixtures):
+        super().__init__(fixtures)
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.cdp_commands.append((cmd, cmd_args))
+        return {"identifier": "1"} if cmd == "Page.addScriptToEvaluateOnNewDocument" else {}
+
+
+def test_save_and_load(tmp_path, fixtures):
+    store = SessionStore(str(tmp_path))
+    store.save(ReplayDriver(fixtures), "jane@example.com")
+    session = store.load("jane@example.com")
+    assert session["account"] == "jane@example.com"
+    assert session["cookies"] == [] and session["local_storage"] == {}
+    store.delete("jane@example.com")
+    assert store.load("jane@example.com") is None
+
+
+def test_expired_session_is_not_loaded(tmp_path, fixtures):
+    store = SessionStore(str(tmp_path), max_age=60)
+    store.save(ReplayDriver(fixtures), "jane@example.com")
+    assert store.load("jane@example.com") is not None
+    store.max_age = -1
+    assert store.load("jane@example.com") is None
+
+
+def test_session_without_li_at_is_invalid(tmp_path):
+    assert not SessionStore(str(tmp_path)).is_valid({"cookies": [{"name": "JSESSIONID", "value": "x"}]})
+    assert not SessionStore(str(tmp_path)).is_valid(None)
+
+
+def test_restore_sets_cookies_without_loading_a_page(tmp_path, fixtures):
+    driver = CdpDriver(fixtures)
+    SessionStore(str(tmp_path)).restore(driver, SESSION)
+    assert driver.pages_loaded == 0
+    assert [cmd for cmd, _ in driver.cdp_commands] == [
+        "Network.enable", "Network.setCookies", "Page.addScriptToEvaluateOnNewDocument",
+    ]
+
+
+def test_local_storage_is_restored_on_the_first_page_only(tmp_path, fixtures):
+    driver = CdpDriver(fixtures)
+    SessionStore(str(tmp_path)).restore(driver, SESSION)
+    ratelimit.navigate(driver, PROFILE_URL)
+    assert driver.cdp_commands[-1] == ("Page.removeScriptToEvaluateOnNewDocument", {"identifier": "1"})
+    commands = len(driver.cdp_commands)
+    ratelimit.navigate(driver, PROFILE_URL + "details/skills/")
+    assert len(driver.cdp_commands) == commands
+
+
+def test_cookie_login_gets_its_own_account(fixtures):
+    driver = ReplayDriver(fixtures)
+    actions.login(driver, cookie="token")
+    assert ratelimit.account_for(driver).startswith("cookie:")
+    driver = ReplayDriver(fixtures)
+    actions.login(driver, email="jane@example.com", cookie="token")
+    assert ratelimit.account_for(driver) == "jane@example.com"
@@ -0,0 +1,123 @@
+from lxml import html
+
+from linkedin_scraper.person import Person
+from linkedin_scraper.replay import ReplayDriver
+from linkedin_scraper.tabs import OPEN_TAB_SCRIPT, TabPipeline
+
+from conftest import PROFILE_URL
+
+SKILLS_URL = PROFILE_URL + "details/skills/"
+LANGUAGES_URL = PROFILE_URL + "details/languages/"
+EDUCATION_URL = PROFILE_URL + "details/education/"
+
+
+class _TabSwitch(object):
+    def __init__(self, driver, alert):
+        self.driver = driver
+        self.alert = alert
+
+    def window(self, handle):
+        self.driver.show(handle)
+
+
+class TabbedDriver(ReplayDriver):
+    """A ReplayDriver that keeps a page per tab, and opens tabs unless popups are blocked."""
+
+    def __init__(self, fixtures, popups=True):
+        super().__init__(fixtures)
+        self.switch_to = _TabSwitch(self, self.switch_to.alert)
+        self.popups = popups
+        self.pages = {"replay": (self.page_source, self.current_url)}
+        self.opened = 0
+
+    def get(self, url):
+        super().get(url)
+        self.pages[self.current_window_handle] = (self.page_source, self.current_url)
+
+    def show(self, handle):
+        self.current_window_handle = handle
+        self.page_source, self.current_url = self.pages[handle]
+        self.tree = html.fromstring(self.page_source)
+        self.tree.make_links_absolute(self.current_url)
+
+    def execute_script(self, script, *args):
+        if script == OPEN_TAB_SCRIPT:
+            if self.popups:
+                self.opened += 1
+                handle = "tab-%d" % self.opened
+                self.pages[handle] = self.fixtures.load(args[0])
+                self.window_handles.append(handle)
+            return None
+        return super().execute_script(script, *args)
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+        del self.pages[self.current_window_handle]
+
+
+def test_prefetch_opens_up_to_depth_tabs(fixtures):
+    driver = TabbedDriver(fixtures)
+    pipeline = TabPipeline(driver, depth=2)
+    pipeline.prefetch([SKILLS_URL, LANGUAGES_URL, EDUCATION_URL])
+    assert pipeline.prefetched == 2
+    assert len(driver.window_handles) == 3
+    assert driver.current_window_handle == "replay"
+
+
+def test_navigate_switches_to_the_prefetched_tab(fixtures):
+    driver = TabbedDriver(fixtures)
+    pipeline = TabPipeline(driver, depth=1)
+    pipeline.prefetch([SKILLS_URL, LANGUAGES_URL])
+
+    pipeline.navigate(SKILLS_URL)
+    assert pipeline.hits == 1
+    assert driver.current_url == SKILLS_URL
+    # The tab the pipeline started from stays open; the freed slot loads the next url.
+    assert "replay" in driver.window_handles
+    assert pipeline.prefetched == 2
+
+    skills_tab = driver.current_window_handle
+    pipeline.navigate(LANGUAGES_URL)
+    assert pipeline.hits == 2
+    assert driver.current_url == LANGUAGES_URL
+    assert skills_tab not in driver.window_handles
+
+
+def test_urls_that_were_not_prefetched_load_in_the_current_tab(fixtures):
+    driver = TabbedDriver(fixtures)
+    pipeline = TabPipeline(driver, depth=1)
+    pipeline.prefetch([SKILLS_URL])
+    pipeline.navigate(EDUCATION_URL)
+    assert pipeline.hits == 0
+    assert (driver.current_window_handle, driver.current_url) == ("replay", EDUCATION_URL)
+
+
+def test_close_returns_to_the_origin(fixtures):
+    driver = TabbedDriver(fixtures)
+    pipeline = TabPipeline(driver, depth=2)
+    pipeline.prefetch([SKILLS_URL, LANGUAGES_URL, EDUCATION_URL])
+    pipeline.navigate(SKILLS_URL)
+    pipeline.close()
+    assert driver.window_handles == ["replay"]
+    assert driver.current_window_handle == "replay"
+
+
+def test_blocked_popups_stop_prefetching(fixtures):
+    driver = TabbedDriver(fixtures, popups=False)
+    pipeline = TabPipeline(driver, depth=2)
+    pipeline.prefetch([SKILLS_URL, LANGUAGES_URL])
+    assert (pipeline.depth, pipeline.prefetched) == (0, 0)
+    pipeline.navigate(SKILLS_URL)
+    assert pipeline.hits == 0
+    assert driver.current_url == SKILLS_URL
+
+
+def test_prefetched_sections_match_a_plain_scrape(fixtures):
+    sections = ["experiences", "educations", "skills", "languages"]
+    driver = TabbedDriver(fixtures)
+    person = Person(PROFILE_URL, driver=driver, sections=sections, prefetch_tabs=2, close_on_complete=False)
+    plain = Person(PROFILE_URL, driver=ReplayDriver(fixtures), sections=sections, close_on_complete=False)
+    for section in sections:
+        assert person.peek(section) and person.peek(section) == plain.peek(section)
+    assert driver.opened == 4
+    assert driver.window_handles == ["replay"]